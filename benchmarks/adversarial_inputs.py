@@ -0,0 +1,58 @@
+"""Show how the parse time of adversarial inputs grows with their length.
+
+Each input is built to exercise the nested quantifiers of the scripture reference
+regular expression, or the optional whitespace around its separators. If the parse
+time grows linearly, each doubling of the length roughly doubles the time. The
+reference cache is cleared before each run so that every run parses the text.
+
+Run with ``python benchmarks/adversarial_inputs.py`` or ``nox --session benchmarks``.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Callable
+
+import pythonbible as bible
+
+LENGTHS: tuple[int, ...] = (1000, 2000, 4000, 8000)
+REPEAT: int = 3
+
+ADVERSARIAL_INPUTS: dict[str, Callable[[int], str]] = {
+    "additional references": lambda length: "Genesis 1" + ", 1" * (length // 3),
+    "ranges": lambda length: "Genesis 1" + "-1" * (length // 2),
+    "chapters and verses": lambda length: "Genesis 1" + ":1" * (length // 2),
+    "whitespace": lambda length: "Genesis 1" + " " * length + ",",
+    "separators and whitespace": lambda length: "Genesis 1" + " , 1 :" * (length // 6),
+    "book names": lambda length: "Genesis " * (length // 8),
+    "book prefixes": lambda length: ("I" + " " * 49) * (length // 50),
+}
+
+
+def main() -> None:
+    print(f"{'input':<26} {'engine':<20}" + "".join(f"{n:>10}" for n in LENGTHS))
+
+    for name, build_input in ADVERSARIAL_INPUTS.items():
+        for engine in bible.ParserEngine:
+            timings: list[str] = []
+
+            for length in LENGTHS:
+                text: str = build_input(length)
+                seconds: float = min(
+                    timeit.repeat(
+                        lambda text=text, engine=engine: bible.get_references(
+                            text,
+                            engine=engine,
+                        ),
+                        setup=bible.clear_reference_cache,
+                        number=1,
+                        repeat=REPEAT,
+                    ),
+                )
+                timings.append(f"{seconds * 1000:8.2f}ms")
+
+            print(f"{name:<26} {engine.name:<20}" + "".join(timings))
+
+
+if __name__ == "__main__":
+    main()
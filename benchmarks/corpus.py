@@ -0,0 +1,40 @@
+"""Sample texts shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+REFERENCE_TEXTS: tuple[str, ...] = (
+    "Matthew 18:12-14 is the parable of the lost sheep.",
+    "Genesis 1:1-5, 50:3 - Exodus 1:14, 2:3-20:5 covers the whole story.",
+    "Psalm 130:4,8 and Jeremiah 29:32-30:10,11 were read this morning.",
+    "Exodus 20 contains the ten commandments.",
+    "Obadiah 3-6 is a short passage.",
+    "Genesis - Deuteronomy are the books of the law.",
+    "Philemon 1:9 was written by Paul.",
+    "Romans 8:28 is a favorite verse for many.",
+)
+
+PLAIN_TEXTS: tuple[str, ...] = (
+    "This message does not mention any scripture at all.",
+    "See you at 10:30 on Sunday, bring 2 or 3 friends.",
+    "The quick brown fox jumps over the lazy dog.",
+)
+
+
+def build_corpus(size: int, reference_ratio: float = 0.5) -> list[str]:
+    """Return a list of short documents, some of which contain references.
+
+    :param size: the number of documents
+    :param reference_ratio: the fraction of documents that contain a reference
+    :return: the list of documents
+    """
+    corpus: list[str] = []
+    reference_count: int = 0
+
+    for index in range(size):
+        if reference_count < (index + 1) * reference_ratio:
+            corpus.append(REFERENCE_TEXTS[reference_count % len(REFERENCE_TEXTS)])
+            reference_count += 1
+        else:
+            corpus.append(PLAIN_TEXTS[index % len(PLAIN_TEXTS)])
+
+    return corpus
@@ -0,0 +1,71 @@
+"""Compare the event loop latency while get_references and aget_references run.
+
+A ticker task sleeps for a millisecond at a time and records how late it wakes up,
+like the other requests served by the same event loop.
+
+Run with ``python benchmarks/event_loop_latency.py`` or ``nox --session benchmarks``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Awaitable
+from typing import Callable
+
+from corpus import build_corpus
+
+import pythonbible as bible
+
+CORPUS_SIZE: int = 5000
+TICK_SECONDS: float = 0.001
+P99: float = 0.99
+PARAGRAPH_BREAK: str = ".\n\n"
+
+
+async def _tick(delays: list[float], done: asyncio.Event) -> None:
+    while not done.is_set():
+        start: float = time.perf_counter()
+        await asyncio.sleep(TICK_SECONDS)
+        delays.append(time.perf_counter() - start - TICK_SECONDS)
+
+
+async def _measure(parse: Callable[[], Awaitable[object]]) -> tuple[float, float]:
+    delays: list[float] = []
+    done: asyncio.Event = asyncio.Event()
+    ticker: asyncio.Task[None] = asyncio.create_task(_tick(delays, done))
+    await asyncio.sleep(TICK_SECONDS)
+
+    start: float = time.perf_counter()
+    await parse()
+    seconds: float = time.perf_counter() - start
+
+    done.set()
+    await ticker
+
+    delays.sort()
+
+    return seconds, delays[int(len(delays) * P99)]
+
+
+async def _get_references(document: str) -> list[bible.NormalizedReference]:
+    return bible.get_references(document)
+
+
+def main() -> None:
+    document: str = PARAGRAPH_BREAK.join(build_corpus(CORPUS_SIZE))
+    parsers: dict[str, Callable[[], Awaitable[object]]] = {
+        "get_references": lambda: _get_references(document),
+        "aget_references": lambda: bible.aget_references(document),
+    }
+
+    for name, parse in parsers.items():
+        seconds, p99_delay = asyncio.run(_measure(parse))
+        print(
+            f"{name:<20} {seconds * 1000:8.2f} ms "
+            f"p99 event loop delay {p99_delay * 1000:8.2f} ms",
+        )
+
+
+if __name__ == "__main__":
+    main()
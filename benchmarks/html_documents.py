@@ -0,0 +1,47 @@
+"""Compare get_html_references with get_references on the same HTML document.
+
+The paragraphs of the document have references in their attributes, which
+get_references finds along with the references in the text.
+
+Run with ``python benchmarks/html_documents.py`` or ``nox --session benchmarks``.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Callable
+
+from corpus import build_corpus
+
+import pythonbible as bible
+
+CORPUS_SIZE: int = 2000
+REPEAT: int = 5
+PARAGRAPH: str = '<p class="verse" data-reference="Genesis 1:1">{}</p>\n'
+
+
+def main() -> None:
+    document: str = "<html><body>\n{}</body></html>".format(
+        "".join(PARAGRAPH.format(text) for text in build_corpus(CORPUS_SIZE)),
+    )
+    parsers: dict[str, Callable[[str], list[bible.NormalizedReference]]] = {
+        "get_references": bible.get_references,
+        "get_html_references": bible.get_html_references,
+    }
+
+    for name, parse in parsers.items():
+        seconds: float = min(
+            timeit.repeat(
+                lambda parse=parse: parse(document),
+                number=1,
+                repeat=REPEAT,
+            ),
+        )
+        print(
+            f"{name:<20} {seconds * 1000:8.2f} ms "
+            f"{len(parse(document)):8} references",
+        )
+
+
+if __name__ == "__main__":
+    main()
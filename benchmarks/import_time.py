@@ -0,0 +1,107 @@
+"""Report the time taken to import pythonbible, as measured by ``python -X importtime``.
+
+Each import runs in a new interpreter, so nothing is cached between runs. The names of
+the package are imported when they are first read, so the time is reported for a few
+common entry points. The modules of the package that take the longest to import on
+their own are listed below, along with the time taken by the first parse, which
+compiles the regular expressions that are not compiled at import.
+
+Run with ``python benchmarks/import_time.py`` or ``nox --session benchmarks``.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+REPEAT: int = 5
+SLOWEST_MODULES: int = 5
+TOTAL: str = ""
+PACKAGE: str = "pythonbible"
+ENTRY_POINTS: tuple[str, ...] = (
+    "import pythonbible",
+    "import pythonbible; pythonbible.get_verse_id",
+    "import pythonbible; pythonbible.format_scripture_references",
+    "import pythonbible; pythonbible.get_references",
+)
+EVERY_NAME: str = (
+    "import pythonbible; [getattr(pythonbible, name) for name in dir(pythonbible)]"
+)
+FIRST_PARSE: str = (
+    "import time\n"
+    "import pythonbible\n"
+    "start = time.perf_counter()\n"
+    "pythonbible.get_references('John 3:16')\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+
+def _import_times(statement: str) -> dict[str, tuple[int, int]]:
+    # Return the self and cumulative import time in microseconds of each module, and
+    # the total time of the modules of the package that were not imported by another
+    # module, which are the package itself and the submodules it loaded on first use.
+    # The statement is one of the constants above, run by this same Python executable.
+    result: subprocess.CompletedProcess[str] = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    import_times: dict[str, tuple[int, int]] = {}
+    total_time: int = 0
+
+    for line in result.stderr.splitlines()[1:]:
+        self_time, cumulative_time, module = line.split(":", 1)[1].split("|")
+        import_times[module.strip()] = (int(self_time), int(cumulative_time))
+
+        if module.startswith(f" {PACKAGE}"):
+            total_time += int(cumulative_time)
+
+    import_times[TOTAL] = (total_time, total_time)
+
+    return import_times
+
+
+def main() -> None:
+    for entry_point in ENTRY_POINTS:
+        total_time: int = min(
+            _import_times(entry_point)[TOTAL][1] for _ in range(REPEAT)
+        )
+        print(f"{entry_point:<64} {total_time / 1000:8.2f} ms")
+
+    runs: list[dict[str, tuple[int, int]]] = [
+        _import_times(EVERY_NAME) for _ in range(REPEAT)
+    ]
+    fastest: dict[str, tuple[int, int]] = min(runs, key=lambda run: run[TOTAL][1])
+    print(f"{'every name of ' + PACKAGE:<64} {fastest[TOTAL][1] / 1000:8.2f} ms")
+
+    package_modules: list[tuple[str, tuple[int, int]]] = sorted(
+        (
+            (module, import_time)
+            for module, import_time in fastest.items()
+            if module.startswith(f"{PACKAGE}.")
+        ),
+        key=lambda item: item[1][0],
+        reverse=True,
+    )
+
+    for module, (self_time, _) in package_modules[:SLOWEST_MODULES]:
+        print(f"  {module:<62} {self_time / 1000:8.2f} ms")
+
+    # FIRST_PARSE is a constant, run by this same Python executable.
+    first_parse_seconds: float = min(
+        float(
+            subprocess.run(  # noqa: S603
+                [sys.executable, "-c", FIRST_PARSE],
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout,
+        )
+        for _ in range(REPEAT)
+    )
+    print(f"{'first get_references':<64} {first_parse_seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Compare IncrementalParser.edit with get_reference_matches on the edited document.
+
+Each edit types one character in the middle of the document, as in an editor.
+
+Run with ``python benchmarks/incremental.py`` or ``nox --session benchmarks``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from corpus import build_corpus
+
+import pythonbible as bible
+
+CORPUS_SIZE: int = 2000
+EDITS: int = 100
+REPEAT: int = 5
+
+
+def main() -> None:
+    document: str = "\n\n".join(build_corpus(CORPUS_SIZE))
+    offset: int = len(document) // 2
+
+    def edit_incrementally() -> None:
+        parser: bible.IncrementalParser = bible.IncrementalParser(document)
+
+        for edit in range(EDITS):
+            parser.edit(offset + edit, 0, "x")
+
+    def parse_fully() -> None:
+        text: str = document
+
+        for edit in range(EDITS):
+            text = text[: offset + edit] + "x" + text[offset + edit :]
+            bible.get_reference_matches(text)
+
+    parser_seconds: float = min(
+        timeit.repeat(
+            lambda: bible.IncrementalParser(document),
+            number=1,
+            repeat=REPEAT,
+        ),
+    )
+    print(f"{'initial parse':<24} {parser_seconds * 1000:8.2f} ms")
+
+    for name, run in (
+        ("IncrementalParser.edit", edit_incrementally),
+        ("get_reference_matches", parse_fully),
+    ):
+        seconds: float = min(timeit.repeat(run, number=1, repeat=REPEAT))
+
+        if run is edit_incrementally:
+            seconds -= parser_seconds
+
+        print(f"{name:<24} {seconds * 1000 / EDITS:8.3f} ms per edit")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Compare get_references with every locale and with only the English book names.
+
+Run with ``python benchmarks/locales.py`` or ``nox --session benchmarks``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from corpus import build_corpus
+
+import pythonbible as bible
+
+CORPUS_SIZE: int = 2000
+REPEAT: int = 5
+LOCALE_SETS: tuple[tuple[str, ...] | None, ...] = (None, ("en",))
+
+
+def main() -> None:
+    corpus: list[str] = build_corpus(CORPUS_SIZE)
+
+    for engine in bible.ParserEngine:
+        for locales in LOCALE_SETS:
+            # Build the lexicon before timing, since it is only built once.
+            bible.get_book_lexicon(locales)
+            seconds: float = min(
+                timeit.repeat(
+                    lambda engine=engine, locales=locales: [
+                        bible.get_references(text, engine=engine, locales=locales)
+                        for text in corpus
+                    ],
+                    setup=bible.clear_reference_cache,
+                    number=1,
+                    repeat=REPEAT,
+                ),
+            )
+            print(
+                f"{engine.name:<20} {','.join(locales or bible.LOCALES):<10} "
+                f"{seconds * 1000:8.2f} ms {CORPUS_SIZE / seconds:12.0f} documents/s",
+            )
+
+
+if __name__ == "__main__":
+    main()
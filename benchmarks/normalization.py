@@ -0,0 +1,68 @@
+"""Compare normalize_text with replacing each kind of dash in its own pass.
+
+Replacing each kind of dash with str.replace copies the whole document once for each
+kind and loses the offsets in the original document. normalize_text reads it once and
+keeps a compact map of offsets, whose size is printed along with the times.
+
+Run with ``python benchmarks/normalization.py`` or ``nox --session benchmarks``.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Callable
+
+from corpus import build_corpus
+
+from pythonbible.normalization import DASH
+from pythonbible.normalization import HTML_MDASH
+from pythonbible.normalization import HTML_NDASH
+from pythonbible.normalization import UNICODE_DASHES
+from pythonbible.normalization import NormalizedText
+from pythonbible.normalization import normalize_text
+
+CORPUS_SIZE: int = 20000
+REPEAT: int = 5
+DASH_VARIANTS: tuple[str, ...] = (HTML_NDASH, HTML_MDASH, *UNICODE_DASHES)
+
+
+def _replace_each(text: str) -> str:
+    for dash_variant in DASH_VARIANTS:
+        text = text.replace(dash_variant, DASH)
+
+    return text
+
+
+def main() -> None:
+    document: str = "\n".join(
+        text.replace(DASH, DASH_VARIANTS[index % len(DASH_VARIANTS)])
+        for index, text in enumerate(build_corpus(CORPUS_SIZE))
+    )
+    normalizers: dict[str, Callable[[str], object]] = {
+        "replace each": _replace_each,
+        "normalize_text": normalize_text,
+    }
+
+    for name, normalize in normalizers.items():
+        seconds: float = min(
+            timeit.repeat(
+                lambda normalize=normalize: normalize(document),
+                number=1,
+                repeat=REPEAT,
+            ),
+        )
+        print(f"{name:<20} {seconds * 1000:8.2f} ms")
+
+    normalized_text: NormalizedText = normalize_text(document)
+    offset_map_size: int = (
+        normalized_text.ends.itemsize * len(normalized_text.ends)
+        + normalized_text.deltas.itemsize * len(normalized_text.deltas)
+    )
+    print(
+        f"{len(document)} characters, {len(normalized_text.ends)} replacements that "
+        f"change the length, {offset_map_size} bytes of offsets",
+    )
+
+
+if __name__ == "__main__":
+    main()
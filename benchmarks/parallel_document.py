@@ -0,0 +1,52 @@
+"""Compare get_references with get_references_parallel on one large document.
+
+Run with ``python benchmarks/parallel_document.py`` or ``nox --session benchmarks``.
+"""
+
+from __future__ import annotations
+
+import os
+import timeit
+
+from corpus import build_corpus
+
+import pythonbible as bible
+
+CORPUS_SIZE: int = 20000
+REPEAT: int = 3
+PARAGRAPH_BREAK: str = ".\n\n"
+
+
+def main() -> None:
+    # The documents of the corpus are joined into paragraphs of one large document.
+    document: str = PARAGRAPH_BREAK.join(build_corpus(CORPUS_SIZE))
+    workers: int = os.cpu_count() or 1
+
+    for engine in bible.ParserEngine:
+        serial: float = min(
+            timeit.repeat(
+                lambda engine=engine: bible.get_references(document, engine=engine),
+                number=1,
+                repeat=REPEAT,
+            ),
+        )
+        parallel: float = min(
+            timeit.repeat(
+                lambda engine=engine: bible.get_references_parallel(
+                    document,
+                    workers,
+                    engine,
+                ),
+                number=1,
+                repeat=REPEAT,
+            ),
+        )
+        print(
+            f"{engine.name:<20} {len(document):>10} characters "
+            f"serial {serial * 1000:8.2f} ms "
+            f"parallel ({workers} workers) {parallel * 1000:8.2f} ms",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Compare the throughput of the regular expression and lexer parser engines.
+
+Run with ``python benchmarks/parser_engines.py`` or ``nox --session benchmarks``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from corpus import build_corpus
+
+import pythonbible as bible
+
+CORPUS_SIZE: int = 2000
+REPEAT: int = 5
+
+
+def main() -> None:
+    corpus: list[str] = build_corpus(CORPUS_SIZE)
+
+    for engine in bible.ParserEngine:
+        seconds: float = min(
+            timeit.repeat(
+                lambda engine=engine: [
+                    bible.get_references(text, engine=engine) for text in corpus
+                ],
+                number=1,
+                repeat=REPEAT,
+            ),
+        )
+        print(
+            f"{engine.name:<20} {seconds * 1000:8.2f} ms "
+            f"{CORPUS_SIZE / seconds:12.0f} documents/s",
+        )
+
+
+if __name__ == "__main__":
+    main()
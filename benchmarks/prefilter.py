@@ -0,0 +1,41 @@
+"""Compare get_references with and without the prefilter on mostly plain texts.
+
+Run with ``python benchmarks/prefilter.py`` or ``nox --session benchmarks``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from corpus import build_corpus
+
+import pythonbible as bible
+
+CORPUS_SIZE: int = 2000
+REFERENCE_RATIO: float = 0.1
+REPEAT: int = 5
+
+
+def main() -> None:
+    corpus: list[str] = build_corpus(CORPUS_SIZE, REFERENCE_RATIO)
+
+    for prefilter in (False, True):
+        bible.reset_prefilter_info()
+        seconds: float = min(
+            timeit.repeat(
+                lambda prefilter=prefilter: [
+                    bible.get_references(text, prefilter=prefilter) for text in corpus
+                ],
+                number=1,
+                repeat=REPEAT,
+            ),
+        )
+        print(
+            f"prefilter={prefilter!s:<6} {seconds * 1000:8.2f} ms "
+            f"{CORPUS_SIZE / seconds:12.0f} documents/s "
+            f"skip rate {bible.get_prefilter_info().skip_rate:.0%}",
+        )
+
+
+if __name__ == "__main__":
+    main()
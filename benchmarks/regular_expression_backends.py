@@ -0,0 +1,51 @@
+"""Compare the throughput of the regular expression backends on the same corpus.
+
+Backends that are not installed, or that cannot compile the scripture reference
+regular expression, are reported as falling back to the re backend.
+
+Run with ``python benchmarks/regular_expression_backends.py`` or
+``nox --session benchmarks``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from corpus import build_corpus
+
+import pythonbible as bible
+
+CORPUS_SIZE: int = 2000
+REPEAT: int = 5
+
+
+def main() -> None:
+    corpus: list[str] = build_corpus(CORPUS_SIZE)
+
+    for backend in bible.RegularExpressionBackend:
+        used_backend = bible.set_regular_expression_backend(backend)
+
+        if used_backend is not backend:
+            print(
+                f"{backend.name:<20} not available, falls back to {used_backend.name}",
+            )
+            continue
+
+        seconds: float = min(
+            timeit.repeat(
+                lambda: [bible.get_references(text) for text in corpus],
+                setup=bible.clear_reference_cache,
+                number=1,
+                repeat=REPEAT,
+            ),
+        )
+        print(
+            f"{backend.name:<20} {seconds * 1000:8.2f} ms "
+            f"{CORPUS_SIZE / seconds:12.0f} documents/s",
+        )
+
+    bible.set_regular_expression_backend(bible.RegularExpressionBackend.RE)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compare roman numeral book prefixes in the matcher with rewriting the whole text.
+
+The book regular expressions match roman numeral book prefixes (e.g. "II Kings")
+directly. The alternative is to replace every roman numeral in the text with an
+integer before searching it, with convert_all_roman_numerals_to_integers, which takes
+an extra pass over the text and calls a Python function for every roman numeral,
+including the ones that are not book prefixes, such as the pronoun "I".
+
+Run with ``python benchmarks/roman_numerals.py`` or ``nox --session benchmarks``.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Callable
+
+import pythonbible as bible
+from pythonbible.roman_numeral_util import convert_all_roman_numerals_to_integers
+
+ROMAN_NUMERAL_TEXTS: tuple[str, ...] = (
+    "II Kings 2:3 tells of Elijah, and I think I will read it again.",
+    "I Cor 13 is read at weddings. I did not know that until chapter IV of the book.",
+    "III John 1:2 is short. Did I say that Louis XIV read it?",
+    "II Tim 3:16 is often quoted, and I agree with it.",
+)
+PLAIN_TEXTS: tuple[str, ...] = (
+    "I said I would come, and I did, but I could not stay.",
+    "The quick brown fox jumps over the lazy dog.",
+)
+CORPUS_SIZE: int = 2000
+REPEAT: int = 5
+
+APPROACHES: dict[str, Callable[[str], list[bible.NormalizedReference]]] = {
+    "matcher": bible.get_references,
+    "substitution": lambda text: bible.get_references(
+        convert_all_roman_numerals_to_integers(text),
+    ),
+}
+
+
+def main() -> None:
+    texts: tuple[str, ...] = ROMAN_NUMERAL_TEXTS + PLAIN_TEXTS
+    corpus: list[str] = [texts[index % len(texts)] for index in range(CORPUS_SIZE)]
+
+    for name, get_references in APPROACHES.items():
+        seconds: float = min(
+            timeit.repeat(
+                lambda get_references=get_references: [
+                    get_references(text) for text in corpus
+                ],
+                setup=bible.clear_reference_cache,
+                number=1,
+                repeat=REPEAT,
+            ),
+        )
+        references: int = sum(len(get_references(text)) for text in corpus)
+        print(
+            f"{name:<20} {seconds * 1000:8.2f} ms "
+            f"{CORPUS_SIZE / seconds:12.0f} documents/s {references:>8} references",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Show the throughput of get_transcript_references on transcripts of growing length.
+
+Each transcript repeats a paragraph of a sermon transcript with spoken references. If
+the parse time grows linearly, the number of words parsed per second stays the same
+as the transcript gets longer.
+
+Run with ``python benchmarks/transcripts.py`` or ``nox --session benchmarks``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+import pythonbible as bible
+
+PARAGRAPH: str = (
+    "Turn with me to Second Timothy chapter two verses three and four, where Paul "
+    "says endure hardship. If you read Ephesians four 17 through 32 you find all the "
+    "ammunition you need, and Jesus said over in Matthew chapter six, verse number "
+    "12, forgive us our debts. We will go back and forth between Haggai two and Ezra "
+    "three, and then to Psalm one hundred and nineteen verse one hundred and five. "
+)
+REPETITIONS: tuple[int, ...] = (100, 200, 400, 800)
+REPEAT: int = 3
+
+
+def main() -> None:
+    for repetitions in REPETITIONS:
+        transcript: str = PARAGRAPH * repetitions
+        words: int = len(transcript.split())
+        seconds: float = min(
+            timeit.repeat(
+                lambda transcript=transcript: bible.get_transcript_references(
+                    transcript,
+                ),
+                number=1,
+                repeat=REPEAT,
+            ),
+        )
+        print(
+            f"{words:>8} words {seconds * 1000:8.2f} ms "
+            f"{words / seconds:12.0f} words/s",
+        )
+
+
+if __name__ == "__main__":
+    main()
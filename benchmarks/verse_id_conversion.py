@@ -0,0 +1,69 @@
+"""Time the conversion between references and verse ids for ranges of growing size.
+
+A range of verses is converted to its verse ids, and the verse ids are converted back
+to references, for one book, the New Testament and the whole Bible.
+
+Run with ``python benchmarks/verse_id_conversion.py`` or ``nox --session benchmarks``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+import pythonbible as bible
+
+REPEAT: int = 3
+
+
+def _get_range(
+    start_book: bible.Book,
+    end_book: bible.Book,
+) -> bible.NormalizedReference:
+    last_chapter: int = bible.get_number_of_chapters(end_book)
+
+    return bible.NormalizedReference(
+        start_book,
+        1,
+        1,
+        last_chapter,
+        bible.get_number_of_verses(end_book, last_chapter),
+        None if start_book is end_book else end_book,
+    )
+
+
+def main() -> None:
+    ranges: dict[str, bible.NormalizedReference] = {
+        "Genesis": _get_range(bible.Book.GENESIS, bible.Book.GENESIS),
+        "New Testament": _get_range(bible.Book.MATTHEW, bible.Book.REVELATION),
+        "Whole Bible": _get_range(bible.Book.GENESIS, bible.Book.MACCABEES_2),
+    }
+
+    for name, reference in ranges.items():
+        verse_ids: list[int] = bible.convert_references_to_verse_ids([reference])
+        to_verse_ids_seconds: float = min(
+            timeit.repeat(
+                lambda reference=reference: bible.convert_references_to_verse_ids(
+                    [reference],
+                ),
+                number=1,
+                repeat=REPEAT,
+            ),
+        )
+        to_references_seconds: float = min(
+            timeit.repeat(
+                lambda verse_ids=verse_ids: bible.convert_verse_ids_to_references(
+                    list(verse_ids),
+                ),
+                number=1,
+                repeat=REPEAT,
+            ),
+        )
+        print(
+            f"{name:<14} {len(verse_ids):6} verses "
+            f"to verse ids {to_verse_ids_seconds * 1000:9.2f} ms "
+            f"to references {to_references_seconds * 1000:9.2f} ms",
+        )
+
+
+if __name__ == "__main__":
+    main()
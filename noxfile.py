@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 import nox
 
 PYTEST = "pytest"
@@ -17,3 +19,12 @@ def coverage(session: nox.Session) -> None:
     session.install("coverage[toml]", PYTEST)
     session.run(COVERAGE, "run", "-m", PYTEST)
     session.run(COVERAGE, "report", "--show-missing")
+
+
+@nox.session(python=["3.11"])
+def benchmarks(session: nox.Session) -> None:
+    session.install(".")
+
+    for benchmark in sorted(Path("benchmarks").glob("*.py")):
+        if benchmark.name != "corpus.py":
+            session.run("python", str(benchmark))
@@ -8,39 +8,321 @@ references as human-readable strings.
 
 from __future__ import annotations
 
+import importlib
+import pkgutil
+from typing import TYPE_CHECKING
+from typing import Any
+
 __version__ = "0.13.1"
 
-from .book_groups import BOOK_GROUPS
-from .book_groups import BookGroup
-from .books import Book
-from .converter import convert_reference_to_verse_ids
-from .converter import convert_references_to_verse_ids
-from .converter import convert_verse_ids_to_references
-from .counters.book_counter import count_books
-from .counters.chapter_counter import count_chapters
-from .counters.verse_counter import count_verses
-from .errors import InvalidBibleParserError
-from .errors import InvalidBookError
-from .errors import InvalidChapterError
-from .errors import InvalidVerseError
-from .errors import MissingBookFileError
-from .errors import MissingVerseFileError
-from .errors import VersionMissingVerseError
-from .formatter import format_scripture_references
-from .formatter import format_single_reference
-from .normalized_reference import NormalizedReference
-from .parser import get_references
-from .parser import normalize_reference
-from .validator import is_valid_book
-from .validator import is_valid_chapter
-from .validator import is_valid_reference
-from .validator import is_valid_verse
-from .validator import is_valid_verse_id
-from .verses import get_book_chapter_verse
-from .verses import get_book_number
-from .verses import get_chapter_number
-from .verses import get_number_of_chapters
-from .verses import get_number_of_verses
-from .verses import get_verse_id
-from .verses import get_verse_number
-from .versions import Version
+if TYPE_CHECKING:
+    from .async_parser import aget_references
+    from .async_parser import aiter_references
+    from .book_groups import BOOK_GROUPS
+    from .book_groups import BookGroup
+    from .books import Book
+    from .converter import convert_reference_to_verse_ids
+    from .converter import convert_references_to_verse_ids
+    from .converter import convert_verse_ids_to_references
+    from .counters.book_counter import count_books
+    from .counters.chapter_counter import count_chapters
+    from .counters.verse_counter import count_verses
+    from .errors import InvalidBibleParserError
+    from .errors import InvalidBookError
+    from .errors import InvalidChapterError
+    from .errors import InvalidEditError
+    from .errors import InvalidLocaleError
+    from .errors import InvalidVerseError
+    from .errors import MissingBookFileError
+    from .errors import MissingVerseFileError
+    from .errors import ParserBudgetExceededError
+    from .errors import VersionMissingVerseError
+    from .formatter import format_scripture_references
+    from .formatter import format_single_reference
+    from .incremental import IncrementalParser
+    from .locales import LOCALES
+    from .locales import BookLexicon
+    from .locales import get_book_lexicon
+    from .markup import get_html_reference_matches
+    from .markup import get_html_references
+    from .markup import iter_html_reference_matches
+    from .markup import iter_html_references
+    from .normalized_reference import NormalizedReference
+    from .parallel import get_reference_matches_parallel
+    from .parallel import get_references_many
+    from .parallel import get_references_parallel
+    from .parser import ParserBudget
+    from .parser import ParserEngine
+    from .parser import clear_reference_cache
+    from .parser import contains_reference
+    from .parser import first_reference
+    from .parser import get_reference_cache_info
+    from .parser import get_reference_matches
+    from .parser import get_references
+    from .parser import iter_reference_matches
+    from .parser import iter_references
+    from .parser import normalize_reference
+    from .parser import set_reference_cache_size
+    from .prefilter import PrefilterInfo
+    from .prefilter import get_prefilter_info
+    from .prefilter import might_contain_reference
+    from .prefilter import reset_prefilter_info
+    from .reference_match import ReferenceMatch
+    from .regular_expression_backend import RegularExpressionBackend
+    from .regular_expression_backend import get_regular_expression_backend
+    from .regular_expression_backend import set_regular_expression_backend
+    from .stream import iter_references_from_stream
+    from .substitution import html_link_replacer
+    from .substitution import markdown_link_replacer
+    from .substitution import substitute_references
+    from .transcript import get_transcript_reference_matches
+    from .transcript import get_transcript_references
+    from .transcript import iter_transcript_reference_matches
+    from .transcript import iter_transcript_references
+    from .validator import is_valid_book
+    from .validator import is_valid_chapter
+    from .validator import is_valid_reference
+    from .validator import is_valid_verse
+    from .validator import is_valid_verse_id
+    from .verses import get_book_chapter_verse
+    from .verses import get_book_number
+    from .verses import get_chapter_number
+    from .verses import get_number_of_chapters
+    from .verses import get_number_of_verses
+    from .verses import get_verse_id
+    from .verses import get_verse_id_from_ordinal
+    from .verses import get_verse_ids_in_range
+    from .verses import get_verse_number
+    from .verses import get_verse_ordinal
+    from .versions import Version
+
+# The submodule of each public name. The submodules are only imported when one of
+# their names is first read, so importing pythonbible does not import the parser and
+# its regular expressions, the verse tables, asyncio or multiprocessing until they are
+# needed. The names are imported above for static type checkers.
+_SUBMODULES: dict[str, str] = {
+    "aget_references": "async_parser",
+    "aiter_references": "async_parser",
+    "BOOK_GROUPS": "book_groups",
+    "BookGroup": "book_groups",
+    "Book": "books",
+    "convert_reference_to_verse_ids": "converter",
+    "convert_references_to_verse_ids": "converter",
+    "convert_verse_ids_to_references": "converter",
+    "count_books": "counters.book_counter",
+    "count_chapters": "counters.chapter_counter",
+    "count_verses": "counters.verse_counter",
+    "InvalidBibleParserError": "errors",
+    "InvalidBookError": "errors",
+    "InvalidChapterError": "errors",
+    "InvalidEditError": "errors",
+    "InvalidLocaleError": "errors",
+    "InvalidVerseError": "errors",
+    "MissingBookFileError": "errors",
+    "MissingVerseFileError": "errors",
+    "ParserBudgetExceededError": "errors",
+    "VersionMissingVerseError": "errors",
+    "format_scripture_references": "formatter",
+    "format_single_reference": "formatter",
+    "IncrementalParser": "incremental",
+    "LOCALES": "locales",
+    "BookLexicon": "locales",
+    "get_book_lexicon": "locales",
+    "get_html_reference_matches": "markup",
+    "get_html_references": "markup",
+    "iter_html_reference_matches": "markup",
+    "iter_html_references": "markup",
+    "NormalizedReference": "normalized_reference",
+    "get_reference_matches_parallel": "parallel",
+    "get_references_many": "parallel",
+    "get_references_parallel": "parallel",
+    "ParserBudget": "parser",
+    "ParserEngine": "parser",
+    "clear_reference_cache": "parser",
+    "contains_reference": "parser",
+    "first_reference": "parser",
+    "get_reference_cache_info": "parser",
+    "get_reference_matches": "parser",
+    "get_references": "parser",
+    "iter_reference_matches": "parser",
+    "iter_references": "parser",
+    "normalize_reference": "parser",
+    "set_reference_cache_size": "parser",
+    "PrefilterInfo": "prefilter",
+    "get_prefilter_info": "prefilter",
+    "might_contain_reference": "prefilter",
+    "reset_prefilter_info": "prefilter",
+    "ReferenceMatch": "reference_match",
+    "RegularExpressionBackend": "regular_expression_backend",
+    "get_regular_expression_backend": "regular_expression_backend",
+    "set_regular_expression_backend": "regular_expression_backend",
+    "iter_references_from_stream": "stream",
+    "html_link_replacer": "substitution",
+    "markdown_link_replacer": "substitution",
+    "substitute_references": "substitution",
+    "get_transcript_reference_matches": "transcript",
+    "get_transcript_references": "transcript",
+    "iter_transcript_reference_matches": "transcript",
+    "iter_transcript_references": "transcript",
+    "is_valid_book": "validator",
+    "is_valid_chapter": "validator",
+    "is_valid_reference": "validator",
+    "is_valid_verse": "validator",
+    "is_valid_verse_id": "validator",
+    "get_book_chapter_verse": "verses",
+    "get_book_number": "verses",
+    "get_chapter_number": "verses",
+    "get_number_of_chapters": "verses",
+    "get_number_of_verses": "verses",
+    "get_verse_id": "verses",
+    "get_verse_id_from_ordinal": "verses",
+    "get_verse_ids_in_range": "verses",
+    "get_verse_number": "verses",
+    "get_verse_ordinal": "verses",
+    "Version": "versions",
+}
+
+# The public names, so that a star import binds them, even though they are not loaded.
+# These are the names of _SUBMODULES, written out so that linters and type checkers
+# can read them.
+__all__: list[str] = [
+    "aget_references",
+    "aiter_references",
+    "BOOK_GROUPS",
+    "BookGroup",
+    "Book",
+    "convert_reference_to_verse_ids",
+    "convert_references_to_verse_ids",
+    "convert_verse_ids_to_references",
+    "count_books",
+    "count_chapters",
+    "count_verses",
+    "InvalidBibleParserError",
+    "InvalidBookError",
+    "InvalidChapterError",
+    "InvalidEditError",
+    "InvalidLocaleError",
+    "InvalidVerseError",
+    "MissingBookFileError",
+    "MissingVerseFileError",
+    "ParserBudgetExceededError",
+    "VersionMissingVerseError",
+    "format_scripture_references",
+    "format_single_reference",
+    "IncrementalParser",
+    "LOCALES",
+    "BookLexicon",
+    "get_book_lexicon",
+    "get_html_reference_matches",
+    "get_html_references",
+    "iter_html_reference_matches",
+    "iter_html_references",
+    "NormalizedReference",
+    "get_reference_matches_parallel",
+    "get_references_many",
+    "get_references_parallel",
+    "ParserBudget",
+    "ParserEngine",
+    "clear_reference_cache",
+    "contains_reference",
+    "first_reference",
+    "get_reference_cache_info",
+    "get_reference_matches",
+    "get_references",
+    "iter_reference_matches",
+    "iter_references",
+    "normalize_reference",
+    "set_reference_cache_size",
+    "PrefilterInfo",
+    "get_prefilter_info",
+    "might_contain_reference",
+    "reset_prefilter_info",
+    "ReferenceMatch",
+    "RegularExpressionBackend",
+    "get_regular_expression_backend",
+    "set_regular_expression_backend",
+    "iter_references_from_stream",
+    "html_link_replacer",
+    "markdown_link_replacer",
+    "substitute_references",
+    "get_transcript_reference_matches",
+    "get_transcript_references",
+    "iter_transcript_reference_matches",
+    "iter_transcript_references",
+    "is_valid_book",
+    "is_valid_chapter",
+    "is_valid_reference",
+    "is_valid_verse",
+    "is_valid_verse_id",
+    "get_book_chapter_verse",
+    "get_book_number",
+    "get_chapter_number",
+    "get_number_of_chapters",
+    "get_number_of_verses",
+    "get_verse_id",
+    "get_verse_id_from_ordinal",
+    "get_verse_ids_in_range",
+    "get_verse_number",
+    "get_verse_ordinal",
+    "Version",
+]
+
+# The names used to load the package lazily, which are left out of dir().
+_LAZY_LOADING_NAMES: frozenset[str] = frozenset(
+    (
+        "TYPE_CHECKING",
+        "Any",
+        "importlib",
+        "pkgutil",
+        "_SUBMODULES",
+        "_LAZY_LOADING_NAMES",
+        "__annotations__",
+        "__dir__",
+        "__getattr__",
+    ),
+)
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import a public name or a submodule of the package the first time it is read.
+
+    The value is stored in the package, so this is only called once for each name.
+
+    :param name: the name of the package attribute
+    :type name: str
+    :return: the value of the public name, or the submodule
+    :rtype: Any
+    :raises AttributeError: if the package has no public name or submodule with the
+                            name
+    """
+    value: Any
+
+    if name in _SUBMODULES:
+        # The import statement machinery is used rather than importlib.import_module,
+        # so that python -X importtime reports the time taken by the submodule.
+        submodule: Any = __import__(f"{__name__}.{_SUBMODULES[name]}", fromlist=(name,))
+        value = getattr(submodule, name)
+    else:
+        try:
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as error:
+            if error.name != f"{__name__}.{name}":
+                raise
+
+            error_message = f"module {__name__!r} has no attribute {name!r}"
+            raise AttributeError(error_message) from None
+
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the names of the package, including the names that are not loaded yet.
+
+    :return: the sorted public names and submodules of the package
+    :rtype: list[str]
+    """
+    submodules: set[str] = {module.name for module in pkgutil.iter_modules(__path__)}
+
+    return sorted({*globals(), *_SUBMODULES, *submodules} - _LAZY_LOADING_NAMES)
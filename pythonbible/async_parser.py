@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING
+from typing import AsyncIterator
+from typing import Iterable
+
+from pythonbible.locales import get_locale_tuple
+from pythonbible.parallel import iter_text_pieces
+from pythonbible.parser import ParserEngine
+from pythonbible.parser import get_references
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from pythonbible.normalized_reference import NormalizedReference
+
+# A slice of this many characters is parsed in a few milliseconds, so the event loop
+# is never blocked for long between slices.
+DEFAULT_SLICE_SIZE: int = 4 * 1024
+
+# At or above this many characters the slices are parsed in an executor, so that the
+# event loop only waits for the results.
+DEFAULT_EXECUTOR_THRESHOLD: int = 1000000
+
+
+async def aget_references(
+    text: str,
+    engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+    *,
+    locales: Iterable[str] | None = None,
+    slice_size: int = DEFAULT_SLICE_SIZE,
+    executor: Executor | None = None,
+    executor_threshold: int | None = DEFAULT_EXECUTOR_THRESHOLD,
+) -> list[NormalizedReference]:
+    """Search the text for scripture references without blocking the event loop.
+
+    The text is parsed one slice at a time, and control is given back to the event
+    loop between slices. The slices are split at whitespace that cannot fall inside a
+    reference, even in a long single line, so the result is the same as
+    get_references.
+
+    :param text: String that may contain zero or more scripture references
+    :type text: str
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :param locales: Optional locales of the book names to find (e.g. ("en",)),
+                    defaults to None for all of the locales
+    :type locales: Iterable[str] or None
+    :param slice_size: The number of characters to aim for in each slice
+    :type slice_size: int
+    :param executor: The executor that parses the slices of long texts, defaults to
+                     None for the default executor of the event loop
+    :type executor: concurrent.futures.Executor or None
+    :param executor_threshold: The length of text at which the slices are parsed in
+                               the executor, or None to always parse them in the
+                               event loop
+    :type executor_threshold: int or None
+    :return: The list of found scripture references
+    :rtype: list[NormalizedReference]
+    :raises InvalidLocaleError: if one of the locales is not supported
+    """
+    return [
+        reference
+        async for reference in aiter_references(
+            text,
+            engine,
+            locales=locales,
+            slice_size=slice_size,
+            executor=executor,
+            executor_threshold=executor_threshold,
+        )
+    ]
+
+
+async def aiter_references(
+    text: str,
+    engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+    *,
+    locales: Iterable[str] | None = None,
+    slice_size: int = DEFAULT_SLICE_SIZE,
+    executor: Executor | None = None,
+    executor_threshold: int | None = DEFAULT_EXECUTOR_THRESHOLD,
+) -> AsyncIterator[NormalizedReference]:
+    """Search the text for scripture references without blocking the event loop.
+
+    Yield the references of each slice of the text as soon as the slice is parsed, in
+    the same order as aget_references.
+
+    :param text: String that may contain zero or more scripture references
+    :type text: str
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :param locales: Optional locales of the book names to find (e.g. ("en",)),
+                    defaults to None for all of the locales
+    :type locales: Iterable[str] or None
+    :param slice_size: The number of characters to aim for in each slice
+    :type slice_size: int
+    :param executor: The executor that parses the slices of long texts, defaults to
+                     None for the default executor of the event loop
+    :type executor: concurrent.futures.Executor or None
+    :param executor_threshold: The length of text at which the slices are parsed in
+                               the executor, or None to always parse them in the
+                               event loop
+    :type executor_threshold: int or None
+    :return: An asynchronous iterator of the found scripture references
+    :rtype: AsyncIterator[NormalizedReference]
+    :raises InvalidLocaleError: if one of the locales is not supported
+    """
+    get_slice_references = partial(
+        get_references,
+        engine=engine,
+        locales=get_locale_tuple(locales),
+    )
+    use_executor: bool = executor_threshold is not None and (
+        len(text) >= executor_threshold
+    )
+    loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+    for _, text_slice in iter_text_pieces(text, slice_size):
+        references: list[NormalizedReference]
+
+        if use_executor:
+            references = await loop.run_in_executor(
+                executor,
+                get_slice_references,
+                text_slice,
+            )
+        else:
+            references = get_slice_references(text_slice)
+
+            # Let the other tasks on the event loop run before the next slice.
+            await asyncio.sleep(0)
+
+        for reference in references:
+            yield reference
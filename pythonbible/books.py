@@ -25,12 +25,12 @@ _SAMUEL_REGULAR_EXPRESSION = r"(Samuel|Sam\.*|Sa\.*|Sm\.*)"
 _KINGS_REGULAR_EXPRESSION = r"(Kings|Kgs\.*|Kin\.*|Ki\.*|Reyes|Reis|Re\.*|Rs\.*)"
 _CHRONICLES_REGULAR_EXPRESSION = r"(Chronicles|Chron\.*|Chro\.*|Chr\.*|Crónicas|Crônicas|Cr\.*)"
 _JOHN_REGULAR_EXPRESSION = r"(John|Joh\.*|Jhn\.*|Jo\.*(?!shua|b|nah|el)|Jn\.*|Juan|João|Jn\.*)"
-_CORINTHIANS_REGULAR_EXPRESSION = r"(Corinthians|Corintios|Coríntios|Co\.*)"
-_THESSALONIANS_REGULAR_EXPRESSION = r"(Thessalonians|Tesalonicenses|Tessalonicenses|Th\.*|Ts\.*)"
-_TIMOTHY_REGULAR_EXPRESSION = r"(Timothy|Timoteo|Timóteo|Ti\.*|Tm\.*)"
-_PETER_REGULAR_EXPRESSION = r"(Peter|Pedro|Pe\.*|Pt\.*)"
+_CORINTHIANS_REGULAR_EXPRESSION = r"(Corinthians|Corintios|Coríntios|Cor\.*|Co\.*)"
+_THESSALONIANS_REGULAR_EXPRESSION = r"(Thessalonians|Tesalonicenses|Tessalonicenses|Thess\.*|Thes\.*|Th\.*|Ts\.*)"
+_TIMOTHY_REGULAR_EXPRESSION = r"(Timothy|Timoteo|Timóteo|Tim\.*|Ti\.*|Tm\.*)"
+_PETER_REGULAR_EXPRESSION = r"(Peter|Pedro|Pet\.*|Pe\.*|Pt\.*)"
 
-_MACCABEES_REGULAR_EXPRESSION = r"(Maccabees|Macabeos|Macabeus|Ma\.*|M\.*)"
+_MACCABEES_REGULAR_EXPRESSION = r"(Maccabees|Macabeos|Macabeus|Macc\.*|Mac\.*|Ma\.*|M\.*)"
 
 _FIRST = r"1|I\s+|1st\s+|First\s+|Primero\s+|Primeiro\s+|1\s+"
 _SECOND = r"2|II|2nd\s+|Second\s+|Segundo\s+|2\s+"
@@ -1,16 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
+from pythonbible.books import Book
 from pythonbible.errors import InvalidVerseError
 from pythonbible.normalized_reference import NormalizedReference
-from pythonbible.validator import is_valid_verse_id
-from pythonbible.verses import VERSE_IDS
-from pythonbible.verses import get_book_chapter_verse
+from pythonbible.verses import get_book_number
+from pythonbible.verses import get_chapter_number
 from pythonbible.verses import get_verse_id
-
-if TYPE_CHECKING:
-    from pythonbible.books import Book
+from pythonbible.verses import get_verse_ids_in_range
+from pythonbible.verses import get_verse_number
+from pythonbible.verses import get_verse_ordinal
 
 
 def convert_references_to_verse_ids(references: list[NormalizedReference]) -> list[int]:
@@ -53,9 +51,8 @@ def convert_reference_to_verse_ids(reference: NormalizedReference) -> tuple[int,
         reference.end_chapter,
         reference.end_verse,
     )
-    return VERSE_IDS[
-        VERSE_IDS.index(start_verse_id) : VERSE_IDS.index(end_verse_id) + 1
-    ]
+
+    return get_verse_ids_in_range(start_verse_id, end_verse_id)
 
 
 def convert_verse_ids_to_references(verse_ids: list[int]) -> list[NormalizedReference]:
@@ -76,17 +73,13 @@ def convert_verse_ids_to_references(verse_ids: list[int]) -> list[NormalizedRefe
     verse_ids.sort()
 
     # Initialize with the first verse id in the list
-    first_verse = verse_ids[0]
-
-    if not is_valid_verse_id(first_verse):
-        raise InvalidVerseError(verse_id=first_verse)
-
     previous_verse_id: int = verse_ids[0]
+    previous_ordinal: int = _get_checked_verse_ordinal(previous_verse_id)
 
     book: Book
     chapter: int
     verse: int
-    book, chapter, verse = get_book_chapter_verse(previous_verse_id)
+    book, chapter, verse = _get_book_chapter_verse(previous_verse_id)
 
     start_book: Book = book
     previous_book: Book = book
@@ -97,18 +90,16 @@ def convert_verse_ids_to_references(verse_ids: list[int]) -> list[NormalizedRefe
 
     # Loop through the remaining verse ids in the list
     for verse_id in verse_ids[1:]:
-        if not is_valid_verse_id(verse_id):
-            raise InvalidVerseError(verse_id=verse_id)
-
-        book, chapter, verse = get_book_chapter_verse(verse_id)
+        ordinal: int = _get_checked_verse_ordinal(verse_id)
+        book, chapter, verse = _get_book_chapter_verse(verse_id)
 
         # If it's just the next verse in the range, updated the previous fields and
         # continue.
-        if VERSE_IDS.index(verse_id) - VERSE_IDS.index(previous_verse_id) == 1:
+        if ordinal - previous_ordinal == 1:
             previous_book = book
             previous_chapter = chapter
             previous_verse = verse
-            previous_verse_id = verse_id
+            previous_ordinal = ordinal
             continue
 
         # At the beginning of a new range, so create the reference and reset all of the
@@ -130,7 +121,7 @@ def convert_verse_ids_to_references(verse_ids: list[int]) -> list[NormalizedRefe
         start_verse = verse
         previous_chapter = chapter
         previous_verse = verse
-        previous_verse_id = verse_id
+        previous_ordinal = ordinal
 
     # The last range reference doesn't get created within the loop, so create it now.
     references.append(
@@ -145,3 +136,21 @@ def convert_verse_ids_to_references(verse_ids: list[int]) -> list[NormalizedRefe
     )
 
     return references
+
+
+def _get_checked_verse_ordinal(verse_id: int) -> int:
+    # Check the verse id once, with the same rules as is_valid_verse_id, so that its
+    # book, chapter and verse numbers can then be read without checking it again.
+    if not isinstance(verse_id, int):
+        raise InvalidVerseError(verse_id=verse_id)
+
+    return get_verse_ordinal(verse_id)
+
+
+def _get_book_chapter_verse(verse_id: int) -> tuple[Book, int, int]:
+    # The same as get_book_chapter_verse, for a verse id that has already been checked.
+    return (
+        Book(get_book_number(verse_id)),  # type: ignore[call-arg]
+        get_chapter_number(verse_id),
+        get_verse_number(verse_id),
+    )
@@ -52,6 +52,18 @@ class InvalidBibleParserError(Exception):
     """Raised when the Bible parser is not valid."""
 
 
+class InvalidEditError(Exception):
+    """Raised when an edit of an incremental parser is not inside of its text."""
+
+
+class InvalidLocaleError(Exception):
+    """Raised when the locale is not one of the locales of the book names."""
+
+
+class ParserBudgetExceededError(Exception):
+    """Raised when parsing a text goes over the length or time budget given for it."""
+
+
 class MissingVerseFileError(Exception):
     """Raised when the verse file for a given version is not found."""
 
@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import TYPE_CHECKING
+from typing import Iterable
+
+from pythonbible.errors import InvalidEditError
+from pythonbible.locales import get_locale_tuple
+from pythonbible.parallel import iter_text_pieces
+from pythonbible.parser import ParserEngine
+from pythonbible.parser import get_reference_matches
+from pythonbible.reference_match import ReferenceMatch
+
+if TYPE_CHECKING:
+    from pythonbible.normalized_reference import NormalizedReference
+
+# Split the text at every line break that cannot fall inside a reference, so that each
+# block is about one paragraph or line.
+BLOCK_LENGTH: int = 1
+
+
+class IncrementalParser:
+    """IncrementalParser keeps the references of a text up to date as it is edited.
+
+    The text is split into blocks at the line breaks that cannot fall inside a
+    reference, and the reference matches of each block are kept. An edit only parses
+    the blocks that it changes and the block on either side of them again, so the
+    time taken grows with the size of the edit rather than the size of the text. The
+    reference matches are always the same as get_reference_matches for the whole
+    text.
+
+    :param text: the initial text, defaults to an empty string
+    :type text: str
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :param locales: Optional locales of the book names to find (e.g. ("en",)),
+                    defaults to None for all of the locales
+    :type locales: Iterable[str] or None
+    :raises InvalidLocaleError: if one of the locales is not supported
+    """
+
+    def __init__(
+        self: IncrementalParser,
+        text: str = "",
+        engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+        *,
+        locales: Iterable[str] | None = None,
+    ) -> None:
+        """Initialize IncrementalParser and parse the initial text."""
+        self._text: str = text
+        self._engine: ParserEngine = engine
+        self._locales: tuple[str, ...] | None = get_locale_tuple(locales)
+
+        # The offset and end of each block in the text, and the reference matches of
+        # the block with offsets in the block. Every block after the first one starts
+        # with the last character of the block before it. The offsets and ends of the
+        # blocks from the shifted block on are stored without the shift, which is only
+        # moved to the blocks between one edit and the next, so that an edit does not
+        # change every block after it.
+        self._block_offsets: list[int] = []
+        self._block_ends: list[int] = []
+        self._block_reference_matches: list[list[ReferenceMatch]] = []
+        self._shifted_block: int = 0
+        self._shift: int = 0
+        self._replace_blocks(0, 0, self._parse_blocks(text, 0, len(text)))
+
+    @property
+    def text(self: IncrementalParser) -> str:
+        """The text with every edit applied."""
+        return self._text
+
+    @property
+    def reference_matches(self: IncrementalParser) -> list[ReferenceMatch]:
+        """The reference matches of the text, with offsets in the text."""
+        return self._get_reference_matches(0, len(self._block_offsets))
+
+    @property
+    def references(self: IncrementalParser) -> list[NormalizedReference]:
+        """The references of the text, in the same order as get_references."""
+        return [
+            reference
+            for block_reference_matches in self._block_reference_matches
+            for reference_match in block_reference_matches
+            for reference in reference_match.references
+        ]
+
+    def edit(
+        self: IncrementalParser,
+        offset: int,
+        deleted_length: int,
+        inserted_text: str,
+    ) -> list[ReferenceMatch]:
+        """Replace part of the text and find the references of the edited text.
+
+        Only the reference matches of the blocks that were parsed again are returned,
+        since the reference matches of the other blocks are not changed by the edit,
+        and reference_matches has the reference matches of the whole text.
+
+        :param offset: the offset in the text where the edit starts
+        :type offset: int
+        :param deleted_length: the number of characters removed from the offset
+        :type deleted_length: int
+        :param inserted_text: the text inserted at the offset
+        :type inserted_text: str
+        :return: the reference matches of the blocks that were parsed again, with
+                 offsets in the edited text
+        :rtype: list[ReferenceMatch]
+        :raises InvalidEditError: if the edit is not inside of the text
+        """
+        if (
+            offset < 0
+            or deleted_length < 0
+            or offset + deleted_length > len(self._text)
+        ):
+            error_message = (
+                f"The edit of {deleted_length} characters at offset {offset} is not "
+                f"inside of the text of {len(self._text)} characters."
+            )
+            raise InvalidEditError(error_message)
+
+        # The blocks next to the edited ones are parsed again too, since the edit may
+        # have made the line breaks between them unsafe to split at.
+        first_block: int = max(0, self._find_block(offset) - 1)
+        last_block: int = min(
+            len(self._block_offsets) - 1,
+            self._find_block(offset + deleted_length) + 1,
+        )
+        length_change: int = len(inserted_text) - deleted_length
+        text: str = (
+            self._text[:offset] + inserted_text + self._text[offset + deleted_length :]
+        )
+
+        # The blocks are parsed before anything is changed, so that the parser is left
+        # as it was if the edited text cannot be parsed.
+        blocks: tuple[list[int], list[int], list[list[ReferenceMatch]]] = (
+            self._parse_blocks(
+                text,
+                self._get_block_offset(first_block),
+                self._get_block_end(last_block) + length_change,
+            )
+        )
+
+        self._text = text
+        self._move_shift(last_block + 1)
+        self._shift += length_change
+        self._replace_blocks(first_block, last_block + 1, blocks)
+
+        return self._get_reference_matches(
+            first_block,
+            first_block + len(blocks[0]),
+        )
+
+    def _get_block_offset(self: IncrementalParser, block: int) -> int:
+        if block < self._shifted_block:
+            return self._block_offsets[block]
+
+        return self._block_offsets[block] + self._shift
+
+    def _get_block_end(self: IncrementalParser, block: int) -> int:
+        if block < self._shifted_block:
+            return self._block_ends[block]
+
+        return self._block_ends[block] + self._shift
+
+    def _find_block(self: IncrementalParser, offset: int) -> int:
+        # Return the last block that starts at or before the offset, or -1 if there is
+        # none. The blocks before and after the shifted block are searched apart,
+        # since only the offsets before it are stored with the shift applied.
+        if self._shifted_block < len(self._block_offsets) and offset >= (
+            self._get_block_offset(self._shifted_block)
+        ):
+            block: int = bisect_right(
+                self._block_offsets,
+                offset - self._shift,
+                self._shifted_block,
+            )
+        else:
+            block = bisect_right(self._block_offsets, offset, 0, self._shifted_block)
+
+        return block - 1
+
+    def _move_shift(self: IncrementalParser, block: int) -> None:
+        # Store the blocks between the shifted block and the given block with the
+        # shift applied, or without it if the given block is before the shifted one,
+        # so that the shift starts at the given block. Edits are usually close to the
+        # edit before them, so only a few blocks are changed.
+        shift: int = self._shift
+
+        for moved_block in range(self._shifted_block, block):
+            self._block_offsets[moved_block] += shift
+            self._block_ends[moved_block] += shift
+
+        for moved_block in range(block, self._shifted_block):
+            self._block_offsets[moved_block] -= shift
+            self._block_ends[moved_block] -= shift
+
+        self._shifted_block = block
+
+    def _get_reference_matches(
+        self: IncrementalParser,
+        first_block: int,
+        end_block: int,
+    ) -> list[ReferenceMatch]:
+        # Return the reference matches of the blocks from first_block up to end_block,
+        # with offsets in the text.
+        reference_matches: list[ReferenceMatch] = []
+
+        for block in range(first_block, end_block):
+            block_offset: int = self._get_block_offset(block)
+            reference_matches.extend(
+                ReferenceMatch(
+                    block_offset + reference_match.start,
+                    block_offset + reference_match.end,
+                    reference_match.text,
+                    reference_match.references,
+                )
+                for reference_match in self._block_reference_matches[block]
+            )
+
+        return reference_matches
+
+    def _parse_blocks(
+        self: IncrementalParser,
+        text: str,
+        start: int,
+        end: int,
+    ) -> tuple[list[int], list[int], list[list[ReferenceMatch]]]:
+        # Split the text from start to end into blocks, and return the offset, end and
+        # reference matches of each block.
+        block_offsets: list[int] = []
+        block_ends: list[int] = []
+        block_reference_matches: list[list[ReferenceMatch]] = []
+
+        for piece_offset, piece in iter_text_pieces(
+            text[start:end],
+            BLOCK_LENGTH,
+            line_breaks_only=True,
+        ):
+            block_offsets.append(start + piece_offset)
+            block_ends.append(start + piece_offset + len(piece))
+            block_reference_matches.append(
+                get_reference_matches(
+                    piece,
+                    engine=self._engine,
+                    locales=self._locales,
+                ),
+            )
+
+        return block_offsets, block_ends, block_reference_matches
+
+    def _replace_blocks(
+        self: IncrementalParser,
+        first_block: int,
+        end_block: int,
+        blocks: tuple[list[int], list[int], list[list[ReferenceMatch]]],
+    ) -> None:
+        # The blocks from first_block up to end_block are before the shifted block, so
+        # the shifted block moves by the change in the number of blocks.
+        (
+            self._block_offsets[first_block:end_block],
+            self._block_ends[first_block:end_block],
+            self._block_reference_matches[first_block:end_block],
+        ) = blocks
+        self._shifted_block += len(blocks[0]) - (end_block - first_block)
@@ -0,0 +1,263 @@
+"""A hand-written lexer for scripture references.
+
+The lexer reads the text once, from left to right. Book names are still matched with
+the book regular expressions, but the chapter and verse numbers and the separators
+between them are read character by character by a small state machine that mirrors
+the ``CROSS_BOOK`` grammar in ``regular_expressions.py``. The numbers are converted to
+integers as they are read, so the tokens can be turned into normalized references
+without splitting the matched text again.
+
+The references are found at the same places as with the regular expression, but a run
+of periods after a book name is always read as part of the book name, so a few texts
+such as "Titus..1" give references that the regular expression engine does not.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+from enum import auto
+from typing import TYPE_CHECKING
+from typing import Iterator
+from typing import Pattern
+
+from pythonbible import regular_expressions
+from pythonbible.books import Book
+from pythonbible.skip_util import skip_while
+
+if TYPE_CHECKING:
+    from typing import Match
+
+COLON_CHARACTERS: str = ":."
+COMMA_CHARACTERS: str = ","
+DASH_CHARACTERS: str = "-"
+MAX_NUMBER_LENGTH: int = 3
+
+_NOT_FOUND: int = -1
+
+
+class TokenType(Enum):
+    """TokenType is an Enum that contains the types of scripture reference tokens."""
+
+    BOOK = auto()
+    NUMBER = auto()
+    COLON = auto()
+    DASH = auto()
+    COMMA = auto()
+
+
+@dataclass(frozen=True)
+class Token:
+    """Token is a dataclass that represents a single piece of a scripture reference.
+
+    :param token_type: the type of the token
+    :type token_type: TokenType
+    :param start: the index of the first character of the token in the text
+    :type start: int
+    :param end: the index after the last character of the token in the text
+    :type end: int
+    :param value: the Book for book tokens, the integer for number tokens, otherwise
+                  None
+    :type value: Book | int | None
+    """
+
+    token_type: TokenType
+    start: int
+    end: int
+    value: Book | int | None = None
+
+
+def tokenize_references(
+    text: str,
+    book_regular_expression: Pattern[str] | None = None,
+) -> Iterator[tuple[int, int, list[Token]]]:
+    """Search the text for scripture references and yield the tokens for each one.
+
+    The references found are the same as the references found by
+    ``SCRIPTURE_REFERENCE_REGULAR_EXPRESSION``.
+
+    :param text: String that may contain zero or more scripture references
+    :type text: str
+    :param book_regular_expression: The book names to find, each in a group named
+                                    after its Book, defaults to None for
+                                    BOOK_TOKEN_REGULAR_EXPRESSION
+    :type book_regular_expression: Pattern[str] or None
+    :return: An iterator of the start index, end index, and tokens of each reference
+    :rtype: Iterator[tuple[int, int, list[Token]]]
+    """
+    if book_regular_expression is None:
+        book_regular_expression = regular_expressions.BOOK_TOKEN_REGULAR_EXPRESSION
+
+    position: int = 0
+
+    while book_match := book_regular_expression.search(text, position):
+        tokens: list[Token] = []
+        end: int = _read_full_book(text, book_match, tokens, book_regular_expression)
+
+        # Cross book reference
+        dash_end: int = _read_separator(text, end, DASH_CHARACTERS)
+
+        if dash_end != _NOT_FOUND and (
+            second_book_match := book_regular_expression.match(text, dash_end)
+        ):
+            tokens.append(Token(TokenType.DASH, end, dash_end))
+            end = _read_full_book(
+                text,
+                second_book_match,
+                tokens,
+                book_regular_expression,
+            )
+
+        yield book_match.start(), end, tokens
+        position = end
+
+
+def _read_full_book(
+    text: str,
+    book_match: Match[str],
+    tokens: list[Token],
+    book_regular_expression: Pattern[str],
+) -> int:
+    tokens.append(_get_book_token(book_match))
+    position: int = skip_while(text, book_match.end(), str.isspace)
+    end: int = _read_full_chapter_and_verse(
+        text,
+        position,
+        tokens,
+        book_regular_expression,
+    )
+
+    return position if end == _NOT_FOUND else end
+
+
+def _read_full_chapter_and_verse(
+    text: str,
+    position: int,
+    tokens: list[Token],
+    book_regular_expression: Pattern[str],
+) -> int:
+    end: int = _read_chapter_and_verse(text, position, tokens)
+
+    if end == _NOT_FOUND:
+        return _NOT_FOUND
+
+    range_end: int = _read_range(text, end, tokens, book_regular_expression)
+
+    if range_end != _NOT_FOUND:
+        end = range_end
+
+    while (
+        additional_end := _read_additional_reference(
+            text,
+            end,
+            tokens,
+            book_regular_expression,
+        )
+    ) != _NOT_FOUND:
+        end = additional_end
+
+    return end
+
+
+def _read_chapter_and_verse(text: str, position: int, tokens: list[Token]) -> int:
+    end: int = _read_number(text, position, tokens)
+
+    if end == _NOT_FOUND:
+        return _NOT_FOUND
+
+    colon_end: int = _read_separator(text, end, COLON_CHARACTERS)
+
+    if colon_end == _NOT_FOUND:
+        return end
+
+    tokens.append(Token(TokenType.COLON, end, colon_end))
+    verse_end: int = _read_number(text, colon_end, tokens)
+
+    if verse_end == _NOT_FOUND:
+        tokens.pop()
+        return end
+
+    return verse_end
+
+
+def _read_range(
+    text: str,
+    position: int,
+    tokens: list[Token],
+    book_regular_expression: Pattern[str],
+) -> int:
+    dash_end: int = _read_separator(text, position, DASH_CHARACTERS)
+
+    if dash_end == _NOT_FOUND:
+        return _NOT_FOUND
+
+    tokens.append(Token(TokenType.DASH, position, dash_end))
+
+    if book_match := book_regular_expression.match(text, dash_end):
+        tokens.append(_get_book_token(book_match))
+        end: int = skip_while(text, book_match.end(), str.isspace)
+        chapter_and_verse_end: int = _read_chapter_and_verse(text, end, tokens)
+        return end if chapter_and_verse_end == _NOT_FOUND else chapter_and_verse_end
+
+    end = _read_chapter_and_verse(text, dash_end, tokens)
+
+    if end == _NOT_FOUND:
+        tokens.pop()
+
+    return end
+
+
+def _read_additional_reference(
+    text: str,
+    position: int,
+    tokens: list[Token],
+    book_regular_expression: Pattern[str],
+) -> int:
+    comma_end: int = _read_separator(text, position, COMMA_CHARACTERS)
+
+    if comma_end == _NOT_FOUND:
+        return _NOT_FOUND
+
+    tokens.append(Token(TokenType.COMMA, position, comma_end))
+    end: int = _read_chapter_and_verse(text, comma_end, tokens)
+
+    if end == _NOT_FOUND:
+        tokens.pop()
+        return _NOT_FOUND
+
+    range_end: int = _read_range(text, end, tokens, book_regular_expression)
+
+    return end if range_end == _NOT_FOUND else range_end
+
+
+def _read_number(text: str, position: int, tokens: list[Token]) -> int:
+    end: int = position
+    max_end: int = min(position + MAX_NUMBER_LENGTH, len(text))
+
+    while end < max_end and text[end].isdecimal():
+        end += 1
+
+    if end == position:
+        return _NOT_FOUND
+
+    tokens.append(Token(TokenType.NUMBER, position, end, int(text[position:end])))
+
+    return end
+
+
+def _read_separator(text: str, position: int, separators: str) -> int:
+    separator_position: int = skip_while(text, position, str.isspace)
+
+    if separator_position >= len(text) or text[separator_position] not in separators:
+        return _NOT_FOUND
+
+    return skip_while(text, separator_position + 1, str.isspace)
+
+
+def _get_book_token(book_match: Match[str]) -> Token:
+    return Token(
+        TokenType.BOOK,
+        book_match.start(),
+        book_match.end(),
+        Book[book_match.lastgroup],  # type: ignore[misc]
+    )
@@ -0,0 +1,394 @@
+"""Book lexicons for a chosen set of locales.
+
+The book regular expressions match the English names of the books, with the Spanish
+and Portuguese names and abbreviations added as extra alternatives. The alternatives
+that only name a book in Spanish or Portuguese are listed here, so that a lexicon for
+a chosen set of locales can drop the alternatives of the other locales from the book
+regular expressions. The smaller regular expressions are faster to search, and an
+abbreviation such as "Jn" is no longer read as the Spanish or Portuguese abbreviation
+of Jonah in an English-only lexicon.
+
+Every alternative that is not listed is shared by all of the locales, so the English
+names are part of every lexicon.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable
+from typing import Pattern
+
+from pythonbible import regular_expressions
+from pythonbible.books import Book
+from pythonbible.errors import InvalidLocaleError
+from pythonbible.regular_expressions import BOOK
+from pythonbible.regular_expressions import CROSS_BOOK
+
+ENGLISH: str = "en"
+SPANISH: str = "es"
+PORTUGUESE: str = "pt"
+LOCALES: tuple[str, ...] = (ENGLISH, SPANISH, PORTUGUESE)
+
+BOOK_LEXICON_CACHE_SIZE: int = 16
+
+# The alternatives of the ordinal prefixes (e.g. "First") of the numbered books.
+_ORDINAL_LEXICONS: dict[str, tuple[str, ...]] = {
+    ENGLISH: (),
+    SPANISH: (r"Primero\s+", r"Segundo\s+", r"Tercero\s+"),
+    PORTUGUESE: (r"Primeiro\s+", r"Segundo\s+", r"Terceiro\s+"),
+}
+
+# The alternatives of the book names, exactly as they are written in the book regular
+# expressions.
+_BOOK_LEXICONS: dict[str, dict[Book, tuple[str, ...]]] = {
+    ENGLISH: {},
+    SPANISH: {
+        Book.GENESIS: (r"Gén\.*(?:esis)?",),
+        Book.EXODUS: (r"Éxo\.*(?:do)?", "Éx"),
+        Book.LEVITICUS: (r"Lev\.*(?:ítico)?",),
+        Book.NUMBERS: (r"Num\.*(?:eros)?", r"Núm\.*"),
+        Book.DEUTERONOMY: (r"Deu\.*(?:teronomio)?",),
+        Book.JOSHUA: ("Josué",),
+        Book.JUDGES: ("Jueces", r"Jue\.*"),
+        Book.RUTH: (r"Rut\.*",),
+        Book.KINGS_1: ("Reyes", r"Re\.*", r"Rs\.*"),
+        Book.KINGS_2: ("Reyes", r"Re\.*", r"Rs\.*"),
+        Book.CHRONICLES_1: ("Crónicas", r"Cr\.*"),
+        Book.CHRONICLES_2: ("Crónicas", r"Cr\.*"),
+        Book.EZRA: (r"Esd\.*", "Esdras", r"Ed\.*"),
+        Book.ESTHER: ("Ester",),
+        Book.PSALMS: ("Salmos", r"Sal\.*"),
+        Book.PROVERBS: ("Proverbios",),
+        Book.ECCLESIASTES: ("Eclesiastés", r"Ecles\.*", r"Ecle\.*", r"Ecl\.*"),
+        Book.SONG_OF_SONGS: ("Cantar de los Cantares", "Cantares", r"Ct\.*"),
+        Book.ISAIAH: ("Isaias",),
+        Book.JEREMIAH: ("Jeremias",),
+        Book.LAMENTATIONS: ("Lamentaciones", r"Lm\.*"),
+        Book.EZEKIEL: ("Ezequiel", r"Ezq\.*"),
+        Book.HOSEA: ("Oseas", r"Os\.*"),
+        Book.AMOS: ("Amós",),
+        Book.OBADIAH: ("Abdías", r"Abd\.*", r"Ab\.*"),
+        Book.JONAH: ("Jonás", r"Jn\.*"),
+        Book.MICAH: ("Miqueas", r"Mq\.*"),
+        Book.NAHUM: ("Nahúm",),
+        Book.HABAKKUK: ("Habacuc", r"Hc\.*"),
+        Book.ZEPHANIAH: ("Sofonías", r"Sof\.*", r"Sf\.*"),
+        Book.HAGGAI: ("Ageo", r"Ag\.*"),
+        Book.ZECHARIAH: ("Zacarías", r"Zac\.*"),
+        Book.MALACHI: ("Malaquías",),
+        Book.MATTHEW: ("Mateo",),
+        Book.MARK: ("Marcos", r"Mc\.*"),
+        Book.LUKE: ("Lucas", r"Luc\.*", r"Lc\.*"),
+        Book.JOHN: ("Juan",),
+        Book.ACTS: ("Hechos", r"He\.*"),
+        Book.ROMANS: ("Romanos",),
+        Book.CORINTHIANS_1: ("Corintios",),
+        Book.CORINTHIANS_2: ("Corintios",),
+        Book.GALATIANS: ("Gálatas",),
+        Book.EPHESIANS: ("Efesios", r"Efe\.*", r"Ef\.*"),
+        Book.PHILIPPIANS: ("Filipenses", r"Flp\.*"),
+        Book.COLOSSIANS: ("Colosenses",),
+        Book.THESSALONIANS_1: ("Tesalonicenses", r"Ts\.*"),
+        Book.THESSALONIANS_2: ("Tesalonicenses", r"Ts\.*"),
+        Book.TIMOTHY_1: ("Timoteo",),
+        Book.TIMOTHY_2: ("Timoteo",),
+        Book.TITUS: ("Tito",),
+        Book.PHILEMON: ("Filemón", r"Flm\.*", r"Fm\.*"),
+        Book.HEBREWS: ("Hebreos",),
+        Book.JAMES: ("Santiago", r"San\.*", r"Stg\.*"),
+        Book.PETER_1: ("Pedro",),
+        Book.PETER_2: ("Pedro",),
+        Book.JUDE: ("Judas",),
+        Book.REVELATION: ("Apocalipsis", r"Ap\.*"),
+        Book.TOBIT: ("Tobías",),
+        Book.WISDOM_OF_SOLOMON: ("Sabiduría",),
+        Book.ECCLESIASTICUS: ("Eclesiástico",),
+        Book.MACCABEES_1: ("Macabeos",),
+        Book.MACCABEES_2: ("Macabeos",),
+    },
+    PORTUGUESE: {
+        Book.GENESIS: (r"Gên\.*(?:esis)?",),
+        Book.EXODUS: (r"Êxo\.*(?:do)?", "Êx"),
+        Book.LEVITICUS: (r"Lev\.*(?:ítico)?",),
+        Book.NUMBERS: (r"Num\.*(?:eros)?", r"Núm\.*"),
+        Book.DEUTERONOMY: (r"Deu\.*(?:teronomio)?",),
+        Book.JOSHUA: ("Josué",),
+        Book.JUDGES: (r"Jz\.*",),
+        Book.RUTH: (r"Rut\.*",),
+        Book.KINGS_1: ("Reis", r"Re\.*", r"Rs\.*"),
+        Book.KINGS_2: ("Reis", r"Re\.*", r"Rs\.*"),
+        Book.CHRONICLES_1: ("Crônicas", r"Cr\.*"),
+        Book.CHRONICLES_2: ("Crônicas", r"Cr\.*"),
+        Book.EZRA: (r"Esd\.*", "Esdras", r"Ed\.*"),
+        Book.NEHEMIAH: ("Neemias",),
+        Book.ESTHER: ("Ester",),
+        Book.JOB: (r"Jó\.*",),
+        Book.PSALMS: ("Salmos", r"Sl\.*"),
+        Book.PROVERBS: ("Provérbios", r"Pv\.*"),
+        Book.ECCLESIASTES: ("Eclesiastes", r"Ecles\.*", r"Ecle\.*", r"Ecl\.*"),
+        Book.SONG_OF_SONGS: ("Cânticos", "Cantares", r"Ct\.*"),
+        Book.ISAIAH: ("Isaias",),
+        Book.JEREMIAH: ("Jeremias", r"Jr\.*"),
+        Book.LAMENTATIONS: ("Lamentações", r"Lm\.*", r"Lá\.*"),
+        Book.EZEKIEL: ("Ezequiel",),
+        Book.HOSEA: (r"Os\.*",),
+        Book.AMOS: ("Amós",),
+        Book.OBADIAH: (r"Ab\.*",),
+        Book.JONAH: (r"Jn\.*",),
+        Book.MICAH: (r"Mq\.*",),
+        Book.HABAKKUK: (r"Hc\.*",),
+        Book.ZEPHANIAH: ("Zefanias", r"Zef\.*"),
+        Book.HAGGAI: (r"Ag\.*",),
+        Book.ZECHARIAH: ("Zacarias", r"Zac\.*"),
+        Book.MALACHI: ("Malaquias",),
+        Book.MARK: ("Marcos", r"Mc\.*"),
+        Book.LUKE: ("Lucas", r"Luc\.*", r"Lc\.*"),
+        Book.JOHN: ("João",),
+        Book.ACTS: ("Atos", r"At\.*"),
+        Book.ROMANS: ("Romanos",),
+        Book.CORINTHIANS_1: ("Coríntios",),
+        Book.CORINTHIANS_2: ("Coríntios",),
+        Book.GALATIANS: ("Gálatas",),
+        Book.EPHESIANS: ("Efésios", r"Efe\.*", r"Ef\.*"),
+        Book.PHILIPPIANS: ("Filipenses", r"Fp\.*"),
+        Book.COLOSSIANS: ("Colossenses",),
+        Book.THESSALONIANS_1: ("Tessalonicenses", r"Ts\.*"),
+        Book.THESSALONIANS_2: ("Tessalonicenses", r"Ts\.*"),
+        Book.TIMOTHY_1: ("Timóteo",),
+        Book.TIMOTHY_2: ("Timóteo",),
+        Book.TITUS: ("Tito",),
+        Book.PHILEMON: ("Filemon", r"Flm\.*", r"Fm\.*"),
+        Book.HEBREWS: ("Hebreus",),
+        Book.JAMES: ("Tiago", r"Tg\.*"),
+        Book.PETER_1: ("Pedro",),
+        Book.PETER_2: ("Pedro",),
+        Book.JUDE: ("Judas",),
+        Book.REVELATION: ("Apocalipse", r"Ap\.*"),
+        Book.WISDOM_OF_SOLOMON: ("Sabedoria",),
+        Book.ECCLESIASTICUS: ("Eclesiástico",),
+        Book.MACCABEES_1: ("Macabeus",),
+        Book.MACCABEES_2: ("Macabeus",),
+    },
+}
+
+_CHARACTER_SET_START: str = "["
+_CHARACTER_SET_END: str = "]"
+_ESCAPE: str = "\\"
+_GROUP_START: str = "("
+_GROUP_END: str = ")"
+_ALTERNATIVE_SEPARATOR: str = "|"
+
+
+@dataclass(frozen=True, eq=False)
+class BookLexicon:
+    """BookLexicon is a dataclass with the book regular expressions of some locales.
+
+    Lexicons are built once for each set of locales by get_book_lexicon, so two
+    lexicons for the same locales are the same object.
+
+    :param locales: the locales of the book names in the lexicon
+    :type locales: frozenset[str]
+    :param scripture_reference_regular_expression: the scripture reference regular
+                                                   expression for the locales
+    :type scripture_reference_regular_expression: Pattern[str]
+    :param book_resolver_regular_expression: every book regular expression for the
+                                             locales, each in a group named after
+                                             its Book
+    :type book_resolver_regular_expression: Pattern[str]
+    :param book_token_regular_expression: the book names used by the lexer
+    :type book_token_regular_expression: Pattern[str]
+    :param book_regular_expressions: the book regular expression of each Book
+    :type book_regular_expressions: dict[Book, Pattern[str]]
+    """
+
+    locales: frozenset[str]
+    scripture_reference_regular_expression: Pattern[str]
+    book_resolver_regular_expression: Pattern[str]
+    book_token_regular_expression: Pattern[str]
+    book_regular_expressions: dict[Book, Pattern[str]]
+
+
+def get_book_lexicon(locales: Iterable[str] | None = None) -> BookLexicon:
+    """Return the book lexicon for the given locales.
+
+    :param locales: The locales of the book names to find (e.g. ("en",)), or a single
+                    locale (e.g. "en"), defaults to None for all of the locales
+    :type locales: Iterable[str] or None
+    :return: The book lexicon for the locales
+    :rtype: BookLexicon
+    :raises InvalidLocaleError: if one of the locales is not in LOCALES
+    """
+    locale_tuple: tuple[str, ...] | None = get_locale_tuple(locales)
+
+    if locale_tuple is None:
+        return _get_default_book_lexicon()
+
+    return _get_book_lexicon(frozenset(locale_tuple))
+
+
+def get_locale_tuple(locales: Iterable[str] | None) -> tuple[str, ...] | None:
+    """Return the given locales as a tuple, so that an iterator can be read again.
+
+    A string is itself an iterable of strings, so a single locale given as a string
+    (e.g. "en") is returned as the only locale rather than split into its characters.
+
+    :param locales: The locales (e.g. ("en",)), a single locale (e.g. "en"), or None
+                    for all of the locales
+    :type locales: Iterable[str] or None
+    :return: The tuple of the locales, or None for all of the locales
+    :rtype: tuple[str, ...] or None
+    """
+    if locales is None:
+        return None
+
+    if isinstance(locales, str):
+        return (locales,)
+
+    return tuple(locales)
+
+
+@lru_cache(maxsize=1)
+def _get_default_book_lexicon() -> BookLexicon:
+    # The lexicon of all of the locales compiles every book regular expression, so it
+    # is built the first time it is needed rather than when the module is imported.
+    return BookLexicon(
+        frozenset(LOCALES),
+        regular_expressions.SCRIPTURE_REFERENCE_REGULAR_EXPRESSION,
+        regular_expressions.BOOK_RESOLVER_REGULAR_EXPRESSION,
+        regular_expressions.BOOK_TOKEN_REGULAR_EXPRESSION,
+        {book: re.compile(book.regular_expression, re.IGNORECASE) for book in Book},
+    )
+
+
+@lru_cache(maxsize=BOOK_LEXICON_CACHE_SIZE)
+def _get_book_lexicon(locales: frozenset[str]) -> BookLexicon:
+    if invalid_locales := locales.difference(LOCALES):
+        error_message = (
+            f"{', '.join(sorted(invalid_locales))} is not one of the supported "
+            f"locales: {', '.join(LOCALES)}."
+        )
+        raise InvalidLocaleError(error_message)
+
+    if locales == _get_default_book_lexicon().locales:
+        return _get_default_book_lexicon()
+
+    book_regular_expressions: dict[Book, str] = {
+        book: _filter_alternatives(
+            book.regular_expression,
+            _get_excluded_alternatives(book, locales),
+        )
+        for book in Book
+    }
+    book_resolver_pattern: str = "|".join(
+        f"(?P<{book.name}>{regular_expression})"
+        for book, regular_expression in book_regular_expressions.items()
+    )
+
+    # CROSS_BOOK is built from BOOK, so the scripture reference regular expression for
+    # the locales is CROSS_BOOK with the alternation of the filtered book regular
+    # expressions in place of BOOK.
+    book_pattern: str = rf"\b({'|'.join(book_regular_expressions.values())})\b\.*"
+
+    return BookLexicon(
+        locales,
+        re.compile(
+            CROSS_BOOK.replace(BOOK, book_pattern),
+            re.IGNORECASE | re.UNICODE,
+        ),
+        re.compile(book_resolver_pattern, re.IGNORECASE),
+        re.compile(
+            rf"\b(?:{book_resolver_pattern})\b\.*",
+            re.IGNORECASE | re.UNICODE,
+        ),
+        {
+            book: re.compile(regular_expression, re.IGNORECASE)
+            for book, regular_expression in book_regular_expressions.items()
+        },
+    )
+
+
+def _get_excluded_alternatives(book: Book, locales: frozenset[str]) -> set[str]:
+    # An alternative is only excluded if none of the chosen locales use it.
+    excluded: set[str] = set()
+    included: set[str] = set()
+
+    for locale in LOCALES:
+        alternatives: tuple[str, ...] = _ORDINAL_LEXICONS[locale] + _BOOK_LEXICONS[
+            locale
+        ].get(book, ())
+        (included if locale in locales else excluded).update(alternatives)
+
+    return excluded - included
+
+
+def _filter_alternatives(regular_expression: str, excluded: set[str]) -> str:
+    filtered: str
+    filtered, _ = _filter_alternation(regular_expression, 0, excluded)
+    return filtered
+
+
+def _filter_alternation(
+    regular_expression: str,
+    position: int,
+    excluded: set[str],
+) -> tuple[str, int]:
+    # Read the alternatives from the position up to the end of the group they are in,
+    # and return them without the excluded and repeated alternatives, along with the
+    # position of the end of the group.
+    alternatives: list[str] = []
+    alternative: list[str] = []
+
+    while position < len(regular_expression):
+        character: str = regular_expression[position]
+
+        if character == _ESCAPE:
+            alternative.append(regular_expression[position : position + 2])
+            position += 2
+        elif character == _CHARACTER_SET_START:
+            end: int = (
+                regular_expression.index(_CHARACTER_SET_END, position + 2) + 1
+            )
+            alternative.append(regular_expression[position:end])
+            position = end
+        elif character == _GROUP_START:
+            group_start: int = _get_group_start_end(regular_expression, position)
+            group: str
+            group, end = _filter_alternation(regular_expression, group_start, excluded)
+            alternative.append(
+                f"{regular_expression[position:group_start]}{group}{_GROUP_END}",
+            )
+            position = end + 1
+        elif character == _GROUP_END:
+            break
+        elif character == _ALTERNATIVE_SEPARATOR:
+            alternatives.append("".join(alternative))
+            alternative = []
+            position += 1
+        else:
+            alternative.append(character)
+            position += 1
+
+    alternatives.append("".join(alternative))
+    kept: list[str] = [
+        alternative
+        for alternative in dict.fromkeys(alternatives)
+        if alternative not in excluded
+    ]
+
+    return _ALTERNATIVE_SEPARATOR.join(kept or alternatives), position
+
+
+def _get_group_start_end(regular_expression: str, position: int) -> int:
+    # Return the position after the opening of the group, e.g. "(", "(?:" or "(?<!".
+    if regular_expression.startswith("(?P<", position):
+        return regular_expression.index(">", position) + 1
+
+    if regular_expression.startswith("(?<", position):
+        return position + len("(?<!")
+
+    if regular_expression.startswith("(?", position):
+        return position + len("(?:")
+
+    return position + 1
@@ -0,0 +1,195 @@
+"""Find the scripture references in the text nodes of an HTML document.
+
+Tags, comments and the contents of script and style elements are skipped, so the
+references in attribute values or JavaScript are not found. Each text node is searched
+on its own, and the entities in it are decoded as it is read, so the HTML does not
+need to be converted to text first. The offsets of the reference matches refer to the
+HTML document.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+from typing import Iterable
+from typing import Iterator
+from typing import Pattern
+
+from pythonbible.locales import get_book_lexicon
+from pythonbible.normalization import normalize_text
+from pythonbible.parser import ParserEngine
+from pythonbible.parser import iter_normalized_reference_matches
+from pythonbible.reference_match import ReferenceMatch
+
+if TYPE_CHECKING:
+    from pythonbible.books import Book
+    from pythonbible.locales import BookLexicon
+    from pythonbible.normalized_reference import NormalizedReference
+
+# The markup that is skipped. A tag ends at the first ">" that is not inside a quoted
+# attribute value, and an unclosed comment, CDATA section, script or style element
+# runs to the end of the document.
+_MARKUP_REGULAR_EXPRESSION: Pattern[str] = re.compile(
+    r"<!--.*?(?:-->|\Z)"
+    r"|<!\[CDATA\[.*?(?:\]\]>|\Z)"
+    r"|<(script|style)\b(?:[^>\"'<]|\"[^\"]*\"|'[^']*')*>.*?(?:</\1\s*>|\Z)"
+    r"|</?[A-Za-z!?](?:[^>\"'<]|\"[^\"]*\"|'[^']*')*>",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def get_html_references(
+    document: str,
+    book_groups: dict[str, tuple[Book, ...]] | None = None,
+    engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+    *,
+    locales: Iterable[str] | None = None,
+) -> list[NormalizedReference]:
+    """Search the text nodes of an HTML document for scripture references.
+
+    :param document: An HTML document or fragment
+    :type document: str
+    :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
+                        related regular expression
+    :type book_groups: dict[str, tuple[Book, ...]] or None
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :param locales: Optional locales of the book names to find (e.g. ("en",)),
+                    defaults to None for all of the locales
+    :type locales: Iterable[str] or None
+    :return: The list of found scripture references
+    :rtype: list[NormalizedReference]
+    :raises InvalidLocaleError: if one of the locales is not supported
+    """
+    return list(iter_html_references(document, book_groups, engine, locales=locales))
+
+
+def iter_html_references(
+    document: str,
+    book_groups: dict[str, tuple[Book, ...]] | None = None,
+    engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+    *,
+    locales: Iterable[str] | None = None,
+) -> Iterator[NormalizedReference]:
+    """Search the text nodes of an HTML document for scripture references.
+
+    Yield the references as they are found, in the same order as
+    get_html_references, so that the search can stop early.
+
+    :param document: An HTML document or fragment
+    :type document: str
+    :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
+                        related regular expression
+    :type book_groups: dict[str, tuple[Book, ...]] or None
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :param locales: Optional locales of the book names to find (e.g. ("en",)),
+                    defaults to None for all of the locales
+    :type locales: Iterable[str] or None
+    :return: An iterator of the found scripture references
+    :rtype: Iterator[NormalizedReference]
+    :raises InvalidLocaleError: if one of the locales is not supported
+    """
+    for reference_match in iter_html_reference_matches(
+        document,
+        book_groups,
+        engine,
+        locales=locales,
+    ):
+        yield from reference_match.references
+
+
+def get_html_reference_matches(
+    document: str,
+    book_groups: dict[str, tuple[Book, ...]] | None = None,
+    engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+    *,
+    locales: Iterable[str] | None = None,
+) -> list[ReferenceMatch]:
+    """Search the text nodes of an HTML document for references and their offsets.
+
+    :param document: An HTML document or fragment
+    :type document: str
+    :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
+                        related regular expression
+    :type book_groups: dict[str, tuple[Book, ...]] or None
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :param locales: Optional locales of the book names to find (e.g. ("en",)),
+                    defaults to None for all of the locales
+    :type locales: Iterable[str] or None
+    :return: The list of reference matches, with offsets in the HTML document
+    :rtype: list[ReferenceMatch]
+    :raises InvalidLocaleError: if one of the locales is not supported
+    """
+    return list(
+        iter_html_reference_matches(document, book_groups, engine, locales=locales),
+    )
+
+
+def iter_html_reference_matches(
+    document: str,
+    book_groups: dict[str, tuple[Book, ...]] | None = None,
+    engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+    *,
+    locales: Iterable[str] | None = None,
+) -> Iterator[ReferenceMatch]:
+    """Search the text nodes of an HTML document for references and their offsets.
+
+    Yield the reference matches as they are found, in the same order as
+    get_html_reference_matches, so that the search can stop early.
+
+    :param document: An HTML document or fragment
+    :type document: str
+    :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
+                        related regular expression
+    :type book_groups: dict[str, tuple[Book, ...]] or None
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :param locales: Optional locales of the book names to find (e.g. ("en",)),
+                    defaults to None for all of the locales
+    :type locales: Iterable[str] or None
+    :return: An iterator of the reference matches, with offsets in the HTML document
+    :rtype: Iterator[ReferenceMatch]
+    :raises InvalidLocaleError: if one of the locales is not supported
+    """
+    lexicon: BookLexicon = get_book_lexicon(locales)
+
+    for start, end in _iter_text_nodes(document):
+        text_node: str = document[start:end]
+
+        if text_node.isspace():
+            continue
+
+        # Every entity is decoded here, and the decoded text is not normalized again,
+        # so that an escaped entity such as "&amp;ndash;" is not read as a dash.
+        for reference_match in iter_normalized_reference_matches(
+            text_node,
+            normalize_text(text_node, html_entities=True),
+            book_groups,
+            engine,
+            lexicon,
+        ):
+            yield ReferenceMatch(
+                start + reference_match.start,
+                start + reference_match.end,
+                reference_match.text,
+                reference_match.references,
+            )
+
+
+def _iter_text_nodes(document: str) -> Iterator[tuple[int, int]]:
+    position: int = 0
+
+    for markup_match in _MARKUP_REGULAR_EXPRESSION.finditer(document):
+        if markup_match.start() > position:
+            yield position, markup_match.start()
+
+        position = markup_match.end()
+
+    if position < len(document):
+        yield position, len(document)
@@ -0,0 +1,155 @@
+"""Normalize a text before it is searched for scripture references.
+
+The HTML dash entities and the Unicode dash characters (e.g. en dash and em dash) are
+all replaced with a hyphen, and a compact map of offsets is kept alongside the
+normalized text, so that the offsets of the references found in it can be mapped
+back to the original text. A text that has nothing to replace is not copied. Roman
+numeral book prefixes (e.g. "II Kings") are matched by the book regular expressions,
+so they are left as they are.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Pattern
+
+DASH: str = "-"
+SPACE: str = " "
+HTML_ENTITY_START: str = "&"
+HTML_MDASH: str = "&mdash;"
+HTML_NDASH: str = "&ndash;"
+UNICODE_DASHES: str = "\u2010\u2011\u2012\u2013\u2014\u2015\u2212"
+
+# The offsets are stored as signed machine integers, which take far less memory than
+# a list of Python integers.
+OFFSET_TYPE_CODE: str = "l"
+REPLACEMENT_CACHE_SIZE: int = 256
+
+# Shared by every text that has nothing to replace, and never changed.
+_NO_OFFSETS: array[int] = array(OFFSET_TYPE_CODE)
+
+# The Unicode dashes are replaced with one character each, so they do not change any
+# offsets and are replaced by the regular expression engine without a Python callback.
+_UNICODE_DASH_REGULAR_EXPRESSION: Pattern[str] = re.compile(f"[{UNICODE_DASHES}]")
+_DASH_ENTITY_REGULAR_EXPRESSION: Pattern[str] = re.compile(
+    f"{re.escape(HTML_NDASH)}|{re.escape(HTML_MDASH)}",
+)
+_HTML_ENTITY_REGULAR_EXPRESSION: Pattern[str] = re.compile(
+    r"&(?:#[0-9]{1,7}|#[xX][0-9a-fA-F]{1,6}|[A-Za-z][A-Za-z0-9]{1,31});",
+)
+
+
+@dataclass(frozen=True)
+class NormalizedText:
+    """NormalizedText is a dataclass that represents a text prepared for searching.
+
+    :param text: the normalized text
+    :type text: str
+    :param ends: the offset in the normalized text after each replacement that
+                 changed the length of the text
+    :type ends: array[int]
+    :param deltas: the number of characters removed from the original text up to the
+                   end of each of those replacements
+    :type deltas: array[int]
+    """
+
+    text: str
+    ends: array[int]
+    deltas: array[int]
+
+    def get_original_offset(self: NormalizedText, offset: int) -> int:
+        """Return the offset in the original text of an offset in the normalized text.
+
+        :param offset: an offset in the normalized text
+        :type offset: int
+        :return: the matching offset in the original text
+        :rtype: int
+        """
+        replacements_before: int = bisect_right(self.ends, offset)
+
+        if replacements_before == 0:
+            return offset
+
+        return offset + self.deltas[replacements_before - 1]
+
+
+def normalize_text(text: str, *, html_entities: bool = False) -> NormalizedText:
+    """Replace the dash variants in the text with hyphens, keeping a map of offsets.
+
+    Only the entities change the length of the text, so the Unicode dashes are
+    replaced after them in one pass that keeps every offset.
+
+    :param text: the text to normalize
+    :type text: str
+    :param html_entities: if True, decode every HTML entity, and not only the dash
+                          entities, with the dash and space entities decoded to a
+                          hyphen and a space
+    :type html_entities: bool
+    :return: the normalized text and its map of offsets
+    :rtype: NormalizedText
+    """
+    ends: array[int] = _NO_OFFSETS
+    deltas: array[int] = _NO_OFFSETS
+
+    if HTML_ENTITY_START in text:
+        text, ends, deltas = _replace_entities(
+            text,
+            _HTML_ENTITY_REGULAR_EXPRESSION
+            if html_entities
+            else _DASH_ENTITY_REGULAR_EXPRESSION,
+        )
+
+    if not text.isascii():
+        text = _UNICODE_DASH_REGULAR_EXPRESSION.sub(DASH, text)
+
+    return NormalizedText(text, ends, deltas)
+
+
+def _replace_entities(
+    text: str,
+    entity_regular_expression: Pattern[str],
+) -> tuple[str, array[int], array[int]]:
+    # Return the text with the entities replaced, the offset in the new text after
+    # each replacement that changed the length of the text, and the number of
+    # characters removed up to that offset.
+    text_parts: list[str] = []
+    ends: array[int] = array(OFFSET_TYPE_CODE)
+    deltas: array[int] = array(OFFSET_TYPE_CODE)
+    position: int = 0
+    delta: int = 0
+
+    for entity_match in entity_regular_expression.finditer(text):
+        replacement: str = _get_replacement(entity_match[0])
+        text_parts.append(text[position : entity_match.start()])
+        text_parts.append(replacement)
+        position = entity_match.end()
+
+        if len(replacement) != len(entity_match[0]):
+            delta += len(entity_match[0]) - len(replacement)
+            ends.append(position - delta)
+            deltas.append(delta)
+
+    if not text_parts:
+        return text, _NO_OFFSETS, _NO_OFFSETS
+
+    text_parts.append(text[position:])
+
+    return "".join(text_parts), ends, deltas
+
+
+@lru_cache(maxsize=REPLACEMENT_CACHE_SIZE)
+def _get_replacement(original: str) -> str:
+    decoded: str = html.unescape(original)
+
+    if decoded in UNICODE_DASHES:
+        return DASH
+
+    if decoded.isspace():
+        return SPACE
+
+    return decoded
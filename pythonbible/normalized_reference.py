@@ -7,11 +7,12 @@ if TYPE_CHECKING:
     from pythonbible.books import Book
 
 
-@dataclass
+@dataclass(frozen=True)
 class NormalizedReference:
     """NormalizedReference is a dataclass that represents a single scripture reference.
 
-    The scripture reference contains one or more consecutive verses.
+    The scripture reference contains one or more consecutive verses. Normalized
+    references are immutable, so they can be shared between the results of the parser.
 
     :param book: the first book of the Bible in the reference
     :type book: Book
@@ -0,0 +1,401 @@
+from __future__ import annotations
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import Pattern
+from typing import TypeVar
+
+from pythonbible import regular_expressions
+from pythonbible.locales import get_book_lexicon
+from pythonbible.locales import get_locale_tuple
+from pythonbible.normalization import UNICODE_DASHES
+from pythonbible.parser import ParserEngine
+from pythonbible.parser import get_reference_matches
+from pythonbible.parser import get_references
+from pythonbible.reference_match import ReferenceMatch
+from pythonbible.regular_expression_backend import get_regular_expression_backend
+from pythonbible.regular_expression_backend import set_regular_expression_backend
+
+if TYPE_CHECKING:
+    from pythonbible.books import Book
+    from pythonbible.normalized_reference import NormalizedReference
+    from pythonbible.regular_expression_backend import RegularExpressionBackend
+
+_T = TypeVar("_T")
+
+# Below this many texts the cost of starting the worker processes and pickling the
+# texts and results is larger than the time saved by parsing in parallel.
+PARALLEL_THRESHOLD: int = 10000
+CHUNKS_PER_WORKER: int = 4
+
+# Below this many characters a single document is parsed serially, for the same reason.
+DOCUMENT_PARALLEL_THRESHOLD: int = 1000000
+
+# A reference can only go on across whitespace when the characters on both sides of it
+# are letters, digits, separators, dashes or part of an HTML entity, so a line break
+# with any other character on one side of it can never fall inside a reference.
+_LINE_BREAK_REGULAR_EXPRESSION: Pattern[str] = re.compile(r"\s*\n\s*")
+_JOINING_CHARACTERS: str = f":.,-;&{UNICODE_DASHES}"
+_END_OF_SENTENCE_CHARACTERS: str = ":.,"
+
+# A long line with no safe line break is split at other whitespace instead. After a
+# letter or a separator, a reference can only go on across whitespace to a letter inside
+# of a book name, so that whitespace is safe when no book name of at most this many
+# characters on either side of it can span it. Whitespace after a number is never used,
+# since a piece only keeps one character before it and the John regular expression
+# looks behind for a number followed by a whitespace character.
+_WHITESPACE_REGULAR_EXPRESSION: Pattern[str] = re.compile(r"\s+")
+_WORD_REGULAR_EXPRESSION: Pattern[str] = re.compile(r"\w+")
+_RANGE_CHARACTERS: str = f"-;&{UNICODE_DASHES}"
+_BOOK_NAME_LENGTH: int = 128
+
+_WARM_UP_TEXT: str = "Genesis 1:1-5, 50:3 - Exodus 1:14, 2:3-20:5"
+
+
+def get_references_many(
+    texts: Iterable[str],
+    workers: int | None = None,
+    chunksize: int | None = None,
+    book_groups: dict[str, tuple[Book, ...]] | None = None,
+    engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+) -> list[list[NormalizedReference]]:
+    """Search each of the given texts for scripture references.
+
+    Large inputs are parsed in a pool of worker processes. Small inputs, or a single
+    worker, are parsed serially in the current process.
+
+    :param texts: Strings that may each contain zero or more scripture references
+    :type texts: Iterable[str]
+    :param workers: The number of worker processes, defaults to the number of CPUs
+    :type workers: int or None
+    :param chunksize: The number of texts sent to a worker process at a time, defaults
+                      to an even split of the texts between the worker processes
+    :type chunksize: int or None
+    :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
+                        related regular expression
+    :type book_groups: dict[str, tuple[Book, ...]] or None
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :return: The list of found scripture references for each text, in the same order
+             as the given texts
+    :rtype: list[list[NormalizedReference]]
+    """
+    texts = list(texts)
+    get_text_references = partial(
+        get_references,
+        book_groups=book_groups,
+        engine=engine,
+    )
+
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(texts) < PARALLEL_THRESHOLD:
+        return [get_text_references(text) for text in texts]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_worker,
+        initargs=(book_groups, engine, get_regular_expression_backend()),
+    ) as executor:
+        return list(
+            executor.map(
+                get_text_references,
+                texts,
+                chunksize=chunksize
+                or max(1, len(texts) // (workers * CHUNKS_PER_WORKER)),
+            ),
+        )
+
+
+def get_references_parallel(
+    text: str,
+    workers: int | None = None,
+    engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+    *,
+    locales: Iterable[str] | None = None,
+) -> list[NormalizedReference]:
+    """Search one large text for scripture references in a pool of worker processes.
+
+    The text is split into pieces at whitespace that cannot fall inside a reference,
+    and the references found in the pieces are put back together in the order of the
+    text, so the result is the same as get_references. Small texts, or a single
+    worker, are parsed serially in the current process.
+
+    :param text: String that may contain zero or more scripture references
+    :type text: str
+    :param workers: The number of worker processes, defaults to the number of CPUs
+    :type workers: int or None
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :param locales: Optional locales of the book names to find (e.g. ("en",)),
+                    defaults to None for all of the locales
+    :type locales: Iterable[str] or None
+    :return: The list of found scripture references
+    :rtype: list[NormalizedReference]
+    :raises InvalidLocaleError: if one of the locales is not supported
+    """
+    get_piece_references = partial(
+        get_references,
+        engine=engine,
+        locales=get_locale_tuple(locales),
+    )
+
+    return [
+        reference
+        for _, piece_references in _map_pieces(
+            get_piece_references,
+            text,
+            workers,
+            engine,
+        )
+        for reference in piece_references
+    ]
+
+
+def get_reference_matches_parallel(
+    text: str,
+    workers: int | None = None,
+    engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+    *,
+    locales: Iterable[str] | None = None,
+) -> list[ReferenceMatch]:
+    """Search one large text for scripture references and where they were found.
+
+    The text is parsed in pieces in a pool of worker processes like
+    get_references_parallel, and the offsets of the reference matches refer to the
+    whole text, so the result is the same as get_reference_matches.
+
+    :param text: String that may contain zero or more scripture references
+    :type text: str
+    :param workers: The number of worker processes, defaults to the number of CPUs
+    :type workers: int or None
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :param locales: Optional locales of the book names to find (e.g. ("en",)),
+                    defaults to None for all of the locales
+    :type locales: Iterable[str] or None
+    :return: The list of reference matches, in the same order as get_reference_matches
+    :rtype: list[ReferenceMatch]
+    :raises InvalidLocaleError: if one of the locales is not supported
+    """
+    get_piece_reference_matches = partial(
+        get_reference_matches,
+        engine=engine,
+        locales=get_locale_tuple(locales),
+    )
+
+    return [
+        ReferenceMatch(
+            offset + reference_match.start,
+            offset + reference_match.end,
+            reference_match.text,
+            reference_match.references,
+        )
+        for offset, piece_reference_matches in _map_pieces(
+            get_piece_reference_matches,
+            text,
+            workers,
+            engine,
+        )
+        for reference_match in piece_reference_matches
+    ]
+
+
+def _map_pieces(
+    function: Callable[[str], list[_T]],
+    text: str,
+    workers: int | None,
+    engine: ParserEngine,
+) -> list[tuple[int, list[_T]]]:
+    # Return the offset of each piece of the text in the text, with the result of the
+    # function for that piece.
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(text) < DOCUMENT_PARALLEL_THRESHOLD:
+        return [(0, function(text))]
+
+    pieces: list[tuple[int, str]] = list(
+        iter_text_pieces(text, max(1, len(text) // (workers * CHUNKS_PER_WORKER))),
+    )
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_worker,
+        initargs=(None, engine, get_regular_expression_backend()),
+    ) as executor:
+        return list(
+            zip(
+                (offset for offset, _ in pieces),
+                executor.map(function, (piece for _, piece in pieces)),
+            ),
+        )
+
+
+def iter_text_pieces(
+    text: str,
+    piece_length: int,
+    *,
+    line_breaks_only: bool = False,
+) -> Iterator[tuple[int, str]]:
+    """Split the text into pieces of about the given length that can be parsed alone.
+
+    The text is only split at whitespace that cannot fall inside a reference, so the
+    references found in the pieces are the same as the references found in the whole
+    text. A line break is used if there is one within the piece length, and otherwise
+    the first safe whitespace, so that a long single line is split too. Every piece
+    after the first one also starts with the last whitespace character before its
+    split, so that the word boundaries at the start of the piece are the same as in
+    the whole text.
+
+    :param text: String that may contain zero or more scripture references
+    :type text: str
+    :param piece_length: The number of characters to aim for in each piece
+    :type piece_length: int
+    :param line_breaks_only: Only split the text at line breaks, defaults to False
+    :type line_breaks_only: bool
+    :return: An iterator of the offset of each piece in the text, and the piece
+    :rtype: Iterator[tuple[int, str]]
+    """
+    offset: int = 0
+    position: int = piece_length
+
+    while position < len(text):
+        boundary: int | None = _find_safe_line_break(
+            text,
+            position,
+            None if line_breaks_only else position + piece_length,
+        )
+
+        if boundary is None and not line_breaks_only:
+            boundary = _find_safe_whitespace(text, position)
+
+        if boundary is None:
+            break
+
+        yield offset, text[offset:boundary]
+        offset = boundary - 1
+        position = boundary + piece_length
+
+    yield offset, text[offset:]
+
+
+def _find_safe_line_break(text: str, position: int, limit: int | None) -> int | None:
+    # Return the offset just after the first line break from the given position, and
+    # before the limit, that cannot fall inside a reference, including the whitespace
+    # around the line break, since a reference may end with whitespace.
+    for line_break_match in _LINE_BREAK_REGULAR_EXPRESSION.finditer(
+        text,
+        position,
+        len(text) if limit is None else limit,
+    ):
+        start: int = line_break_match.start()
+        end: int = line_break_match.end()
+
+        while end < len(text) and text[end].isspace():
+            end += 1
+
+        if end == len(text):
+            return None
+
+        while start > 0 and text[start - 1].isspace():
+            start -= 1
+
+        if start > 0 and _is_safe_boundary(text[start - 1], text[end]):
+            return end
+
+    return None
+
+
+def _find_safe_whitespace(text: str, position: int) -> int | None:
+    # Return the offset just after the first whitespace from the given position that
+    # cannot fall inside a reference, including all of the whitespace.
+    for whitespace_match in _WHITESPACE_REGULAR_EXPRESSION.finditer(text, position):
+        start: int = whitespace_match.start()
+        end: int = whitespace_match.end()
+
+        if end == len(text):
+            return None
+
+        while start > 0 and text[start - 1].isspace():
+            start -= 1
+
+        if start == 0:
+            continue
+
+        before: str = text[start - 1]
+        after: str = text[end]
+
+        if (
+            after.isalpha()
+            and not before.isdigit()
+            and before not in _RANGE_CHARACTERS
+        ):
+            if not _is_in_book_name(text, start, end):
+                return end
+        elif _is_safe_boundary(before, after):
+            return end
+
+    return None
+
+
+def _is_in_book_name(text: str, start: int, end: int) -> bool:
+    # Whether a book name can start before the whitespace from start to end and end
+    # after it. Every end of a word after the whitespace is tried, since the book
+    # regular expression stops at the first alternative that matches.
+    book_regular_expression: Pattern[str] = (
+        regular_expressions.BOOK_RESOLVER_REGULAR_EXPRESSION
+    )
+    limit: int = end + _BOOK_NAME_LENGTH
+    word_ends: list[int] = [
+        word_match.end()
+        for word_match in _WORD_REGULAR_EXPRESSION.finditer(text, end, limit)
+    ]
+
+    return any(
+        book_regular_expression.match(text, word_match.start(), limit)
+        and any(
+            book_regular_expression.fullmatch(text, word_match.start(), word_end)
+            for word_end in word_ends
+        )
+        for word_match in _WORD_REGULAR_EXPRESSION.finditer(
+            text,
+            max(0, start - _BOOK_NAME_LENGTH),
+            start,
+        )
+    )
+
+
+def _is_safe_boundary(before: str, after: str) -> bool:
+    if before in _END_OF_SENTENCE_CHARACTERS and after.isalpha():
+        # After a separator a reference can only go on with a number.
+        return True
+
+    return not (
+        (before.isalnum() or before in _JOINING_CHARACTERS)
+        and (after.isalnum() or after in _JOINING_CHARACTERS)
+    )
+
+
+def _initialize_worker(
+    book_groups: dict[str, tuple[Book, ...]] | None,
+    engine: ParserEngine,
+    backend: RegularExpressionBackend,
+) -> None:
+    # The worker may have been started without the backend set in this process, so it
+    # is set again. The regular expressions are only compiled on first use, so the book
+    # lexicon of every locale is built here, which compiles the scripture reference,
+    # book resolver and book token regular expressions and the regular expression of
+    # each book. Parsing a reference once also compiles the matchers of the book
+    # groups, so that none of this work is repeated in the first task.
+    set_regular_expression_backend(backend)
+    get_book_lexicon()
+    get_references(_WARM_UP_TEXT, book_groups=book_groups, engine=engine)
@@ -1,29 +1,108 @@
 from __future__ import annotations
 
+import math
 import re
+import time
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from typing import Iterable
+from typing import Iterator
 from typing import Match
 from typing import Pattern
 
 from pythonbible.books import Book
+from pythonbible.errors import ParserBudgetExceededError
+from pythonbible.lexer import Token
+from pythonbible.lexer import TokenType
+from pythonbible.lexer import tokenize_references
+from pythonbible.locales import BookLexicon
+from pythonbible.locales import get_book_lexicon
+from pythonbible.normalization import DASH
+from pythonbible.normalization import NormalizedText
+from pythonbible.normalization import normalize_text
 from pythonbible.normalized_reference import NormalizedReference
-from pythonbible.regular_expressions import SCRIPTURE_REFERENCE_REGULAR_EXPRESSION
-from pythonbible.roman_numeral_util import convert_all_roman_numerals_to_integers
+from pythonbible.prefilter import might_contain_reference
+from pythonbible.reference_match import ReferenceMatch
+from pythonbible.regular_expression_backend import (
+    get_scripture_reference_regular_expression,
+)
 from pythonbible.validator import is_valid_reference
 from pythonbible.verses import get_number_of_chapters
 from pythonbible.verses import get_number_of_verses
 from pythonbible.verses import is_single_chapter_book
 
+if TYPE_CHECKING:
+    from functools import _CacheInfo
+
 COLON = ":"
 COMMA = ","
-DASH = "-"
-HTML_MDASH = "&mdash;"
-HTML_NDASH = "&ndash;"
 PERIOD = "."
 
+DEFAULT_REFERENCE_CACHE_SIZE: int = 4096
+BOOK_GROUP_MATCHER_CACHE_SIZE: int = 32
+
+_BOOK_GROUP_NAME_PREFIX: str = "book_group_"
+
+_BOOKS_AFTER: dict[Book, tuple[Book, ...]] = {
+    book: tuple(Book)[index + 1 :] + tuple(Book)[: index + 1]
+    for index, book in enumerate(Book)
+}
+
+
+class ParserEngine(Enum):
+    """ParserEngine is an Enum that contains the engines used to find references.
+
+    REGULAR_EXPRESSION finds references with SCRIPTURE_REFERENCE_REGULAR_EXPRESSION and
+    then normalizes each matched string. LEXER reads the text once with a hand-written
+    lexer and builds the normalized references directly from its tokens. The time the
+    LEXER takes grows linearly with the length of the text, since it never goes back
+    over the numbers and separators it has already read.
+
+    Both engines find references at the same places in the text, but they can read
+    periods after a book name differently. The LEXER reads a run of periods after any
+    book name as part of the name, like the BOOK regular expression does. The
+    REGULAR_EXPRESSION engine only does so when the book name it matched can end with
+    periods, as in "Tit..1", and otherwise reads them as chapter and verse separators,
+    so "Titus..1" is a reference to Titus 1 for the LEXER and no reference at all for
+    the REGULAR_EXPRESSION engine.
+    """
+
+    REGULAR_EXPRESSION = "regular_expression"
+    LEXER = "lexer"
+
+
+@dataclass(frozen=True)
+class ParserBudget:
+    """ParserBudget is a dataclass that limits the work done to parse a single text.
+
+    The length of the text is checked before it is searched. The time budget is
+    best-effort: it is checked each time a reference is found and once more when the
+    search is done, but the search is never interrupted in between, so a text with no
+    references is searched to the end before the time budget is checked. Use the
+    length budget to bound how long the search can take.
+
+    :param max_length: the maximum number of characters in the text, defaults to None
+                       for no limit
+    :type max_length: int or None
+    :param max_seconds: the maximum number of seconds spent parsing the text, defaults
+                        to None for no limit
+    :type max_seconds: float or None
+    """
+
+    max_length: int | None = None
+    max_seconds: float | None = None
+
 
 def get_references(
     text: str,
     book_groups: dict[str, tuple[Book, ...]] | None = None,
+    engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+    *,
+    prefilter: bool = False,
+    budget: ParserBudget | None = None,
+    locales: Iterable[str] | None = None,
 ) -> list[NormalizedReference]:
     """Search the text for scripture references.
 
@@ -34,65 +113,315 @@ def get_references(
     :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
                         related regular expression
     :type book_groups: dict[str, tuple[Book, ...]] or None
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :param prefilter: If True, skip searching the text when a cheap check shows that
+                      it cannot contain a scripture reference, defaults to False
+    :type prefilter: bool
+    :param budget: Optional limits on the length of the text and the time spent
+                   parsing it
+    :type budget: ParserBudget or None
+    :param locales: Optional locales of the book names to find (e.g. ("en",)),
+                    defaults to None for all of the locales
+    :type locales: Iterable[str] or None
     :return: The list of found scripture references
     :rtype: list[NormalizedReference]
+    :raises ParserBudgetExceededError: if the text goes over the given budget
+    :raises InvalidLocaleError: if one of the locales is not supported
     """
-    references: list[NormalizedReference] = []
+    return list(
+        iter_references(
+            text,
+            book_groups,
+            engine,
+            prefilter=prefilter,
+            budget=budget,
+            locales=locales,
+        ),
+    )
 
-    # First replace all roman numerals in the text with integers.
-    clean_text: str = text#convert_all_roman_numerals_to_integers(text)
-    clean_text = clean_text.replace(HTML_NDASH, DASH).replace(HTML_MDASH, DASH)
 
-    for reference_match in re.finditer(
-        SCRIPTURE_REFERENCE_REGULAR_EXPRESSION,
-        clean_text,
+def iter_references(
+    text: str,
+    book_groups: dict[str, tuple[Book, ...]] | None = None,
+    engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+    *,
+    prefilter: bool = False,
+    budget: ParserBudget | None = None,
+    locales: Iterable[str] | None = None,
+) -> Iterator[NormalizedReference]:
+    """Search the text for scripture references.
+
+    Yield the scripture references as they are found, in the same order as
+    get_references, so that the search can stop early.
+
+    :param text: String that may contain zero or more scripture references
+    :type text: str
+    :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
+                        related regular expression
+    :type book_groups: dict[str, tuple[Book, ...]] or None
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :param prefilter: If True, skip searching the text when a cheap check shows that
+                      it cannot contain a scripture reference, defaults to False
+    :type prefilter: bool
+    :param budget: Optional limits on the length of the text and the time spent
+                   parsing it
+    :type budget: ParserBudget or None
+    :param locales: Optional locales of the book names to find (e.g. ("en",)),
+                    defaults to None for all of the locales
+    :type locales: Iterable[str] or None
+    :return: An iterator of the found scripture references
+    :rtype: Iterator[NormalizedReference]
+    :raises ParserBudgetExceededError: if the text goes over the given budget
+    :raises InvalidLocaleError: if one of the locales is not supported
+    """
+    lexicon: BookLexicon = get_book_lexicon(locales)
+    spans: Iterator[tuple[int, int, list[NormalizedReference]]]
+
+    if budget is None:
+        spans = _iter_reference_spans(
+            normalize_text(text).text,
+            book_groups,
+            engine,
+            lexicon,
+            prefilter=prefilter,
+        )
+    else:
+        spans = _iter_reference_spans_within_budget(
+            text,
+            book_groups,
+            engine,
+            lexicon,
+            prefilter=prefilter,
+            budget=budget,
+        )
+
+    for _, _, references in spans:
+        yield from references
+
+
+def get_reference_matches(
+    text: str,
+    book_groups: dict[str, tuple[Book, ...]] | None = None,
+    engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+    *,
+    locales: Iterable[str] | None = None,
+) -> list[ReferenceMatch]:
+    """Search the text for scripture references and where they were found.
+
+    Return a reference match for each matched substring, with its offsets in the
+    given text and the normalized references parsed from it. The offsets refer to
+    the given text even if it contains HTML dash entities or Unicode dashes.
+
+    :param text: String that may contain zero or more scripture references
+    :type text: str
+    :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
+                        related regular expression
+    :type book_groups: dict[str, tuple[Book, ...]] or None
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :param locales: Optional locales of the book names to find (e.g. ("en",)),
+                    defaults to None for all of the locales
+    :type locales: Iterable[str] or None
+    :return: The list of reference matches, in the same order as get_references
+    :rtype: list[ReferenceMatch]
+    :raises InvalidLocaleError: if one of the locales is not supported
+    """
+    return list(iter_reference_matches(text, book_groups, engine, locales=locales))
+
+
+def iter_reference_matches(
+    text: str,
+    book_groups: dict[str, tuple[Book, ...]] | None = None,
+    engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+    *,
+    locales: Iterable[str] | None = None,
+) -> Iterator[ReferenceMatch]:
+    """Search the text for scripture references and where they were found.
+
+    Yield the reference matches as they are found, in the same order as
+    get_reference_matches, so that the search can stop early.
+
+    :param text: String that may contain zero or more scripture references
+    :type text: str
+    :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
+                        related regular expression
+    :type book_groups: dict[str, tuple[Book, ...]] or None
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :param locales: Optional locales of the book names to find (e.g. ("en",)),
+                    defaults to None for all of the locales
+    :type locales: Iterable[str] or None
+    :return: An iterator of the reference matches
+    :rtype: Iterator[ReferenceMatch]
+    :raises InvalidLocaleError: if one of the locales is not supported
+    """
+    lexicon: BookLexicon = get_book_lexicon(locales)
+
+    yield from iter_normalized_reference_matches(
+        text,
+        normalize_text(text),
+        book_groups,
+        engine,
+        lexicon,
+    )
+
+
+def iter_normalized_reference_matches(
+    text: str,
+    normalized_text: NormalizedText,
+    book_groups: dict[str, tuple[Book, ...]] | None,
+    engine: ParserEngine,
+    lexicon: BookLexicon,
+) -> Iterator[ReferenceMatch]:
+    """Search a text that is already normalized for scripture references.
+
+    The normalized text is searched as it is, so a caller that normalizes the text in
+    its own way (e.g. decoding every HTML entity) does not have it normalized again.
+
+    :param text: String that may contain zero or more scripture references
+    :type text: str
+    :param normalized_text: The text after normalization, with its map of offsets
+    :type normalized_text: NormalizedText
+    :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
+                        related regular expression
+    :type book_groups: dict[str, tuple[Book, ...]] or None
+    :param engine: The engine used to find the references
+    :type engine: ParserEngine
+    :param lexicon: The book lexicon of the locales of the book names to find
+    :type lexicon: BookLexicon
+    :return: An iterator of the reference matches, with offsets in the text
+    :rtype: Iterator[ReferenceMatch]
+    """
+    for start, end, references in _iter_reference_spans(
+        normalized_text.text,
+        book_groups,
+        engine,
+        lexicon,
     ):
-        references.extend(normalize_reference(reference_match[0]))
+        original_start: int = normalized_text.get_original_offset(start)
+        original_end: int = normalized_text.get_original_offset(end)
+        yield ReferenceMatch(
+            original_start,
+            original_end,
+            text[original_start:original_end],
+            references,
+        )
 
-    if book_groups:
-        references.extend(_get_book_group_references(clean_text, book_groups))
 
-    return references
+def contains_reference(
+    text: str,
+    book_groups: dict[str, tuple[Book, ...]] | None = None,
+    engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+) -> bool:
+    """Check to see if the text contains at least one scripture reference.
 
+    The search stops at the first scripture reference found.
+
+    :param text: String that may contain zero or more scripture references
+    :type text: str
+    :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
+                        related regular expression
+    :type book_groups: dict[str, tuple[Book, ...]] or None
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :return: True if the text contains a scripture reference; otherwise, False
+    :rtype: bool
+    """
+    return first_reference(text, book_groups, engine) is not None
 
-def normalize_reference(reference: str) -> list[NormalizedReference]:
+
+def first_reference(
+    text: str,
+    book_groups: dict[str, tuple[Book, ...]] | None = None,
+    engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+) -> NormalizedReference | None:
+    """Return the first scripture reference found in the text.
+
+    The search stops at the first scripture reference found.
+
+    :param text: String that may contain zero or more scripture references
+    :type text: str
+    :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
+                        related regular expression
+    :type book_groups: dict[str, tuple[Book, ...]] or None
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :return: The first scripture reference found, or None if there are none
+    :rtype: NormalizedReference or None
+    """
+    return next(iter_references(text, book_groups, engine), None)
+
+
+def normalize_reference(
+    reference: str,
+    *,
+    locales: Iterable[str] | None = None,
+) -> list[NormalizedReference]:
     """Convert a scripture reference string into a list of normalized tuple references.
 
+    The results are kept in a bounded least recently used cache keyed on the reference
+    string and the locales, so a reference string that has been seen recently is not
+    parsed again.
+
     :param reference: a string that is a scripture reference
+    :param locales: optional locales of the book names (e.g. ("en",)), defaults to None
+                    for all of the locales
     :return: a list of tuples. each tuple is in the format (book, start_chapter,
              start_verse, end_chapter, end_verse)
+    :raises InvalidLocaleError: if one of the locales is not supported
     """
-    references: list[NormalizedReference] = []
-    books: list[Book] = []
-    cleaned_references: list[str] = []
-    reference_without_books: str = reference
-    start: int
-    end: int
-    book_found: bool = True
+    return list(_normalize_reference_cached(reference, get_book_lexicon(locales)))
 
-    while book_found:
-        book_found = False
 
-        for book in Book:
-            if reference_match := re.search(
-                book.regular_expression,
-                reference_without_books,
-                re.IGNORECASE,
-            ):
-                start, end = reference_match.regs[0]
+def get_reference_cache_info() -> _CacheInfo:
+    """Return the statistics of the normalize_reference cache.
 
-                if start != 0 and not books:
-                    continue
+    :return: The hits, misses, maximum size and current size of the cache
+    :rtype: functools._CacheInfo
+    """
+    return _normalize_reference_cached.cache_info()
 
-                book_found = True
 
-                if books:
-                    cleaned_references.append(reference_without_books[:start])
+def clear_reference_cache() -> None:
+    """Remove all of the entries and statistics from the normalize_reference cache."""
+    _normalize_reference_cached.cache_clear()
 
-                reference_without_books = reference_without_books[end:]
-                books.append(book)
 
-    cleaned_references.append(reference_without_books)
+def set_reference_cache_size(maxsize: int | None) -> None:
+    """Set the maximum number of entries in the normalize_reference cache.
+
+    The cache is cleared when it is resized.
+
+    :param maxsize: The maximum number of entries, 0 to turn off caching, or None for
+                    an unbounded cache
+    :type maxsize: int or None
+    """
+    global _normalize_reference_cached  # noqa: PLW0603
+    _normalize_reference_cached = lru_cache(maxsize=maxsize)(_normalize_reference)
+
+
+def _normalize_reference(
+    reference: str,
+    lexicon: BookLexicon,
+) -> tuple[NormalizedReference, ...]:
+    return tuple(_parse_reference(reference, lexicon))
+
+
+def _parse_reference(
+    reference: str,
+    lexicon: BookLexicon,
+) -> list[NormalizedReference]:
+    books: list[Book]
+    cleaned_references: list[str]
+    books, cleaned_references = _split_books(reference, lexicon)
 
     # First Book
     first_book_references = _process_sub_references(
@@ -109,6 +438,20 @@ def normalize_reference(reference: str) -> list[NormalizedReference]:
         cleaned_references[1].strip(),
     )
 
+    return _combine_book_references(first_book_references, second_book_references)
+
+
+_normalize_reference_cached = lru_cache(maxsize=DEFAULT_REFERENCE_CACHE_SIZE)(
+    _normalize_reference,
+)
+
+
+def _combine_book_references(
+    first_book_references: list[NormalizedReference],
+    second_book_references: list[NormalizedReference],
+) -> list[NormalizedReference]:
+    references: list[NormalizedReference] = []
+
     if len(first_book_references) > 1:
         references.extend(first_book_references[:-1])
 
@@ -133,126 +476,373 @@ def normalize_reference(reference: str) -> list[NormalizedReference]:
     return references
 
 
+def _split_books(
+    reference: str,
+    lexicon: BookLexicon,
+) -> tuple[list[Book], list[str]]:
+    books: list[Book] = []
+    cleaned_references: list[str] = []
+    reference_without_books: str = reference
+    start: int
+    end: int
+
+    # The first book must be at the very beginning of the reference.
+    book_match: Match[str] | None = lexicon.book_resolver_regular_expression.match(
+        reference,
+    )
+    book: Book | None = (
+        Book[book_match.lastgroup] if book_match and book_match.lastgroup else None
+    )
+
+    while book_match and book:
+        start, end = book_match.span()
+
+        if books:
+            cleaned_references.append(reference_without_books[:start])
+
+        reference_without_books = reference_without_books[end:]
+        books.append(book)
+        book, book_match = _search_next_book(reference_without_books, book, lexicon)
+
+    cleaned_references.append(reference_without_books)
+
+    return books, cleaned_references
+
+
+def _search_next_book(
+    reference: str,
+    previous_book: Book,
+    lexicon: BookLexicon,
+) -> tuple[Book | None, Match[str] | None]:
+    # Most references only contain a single book, so a single search of the combined
+    # regular expression is usually enough to know that there are no more books.
+    if not lexicon.book_resolver_regular_expression.search(reference):
+        return None, None
+
+    # Any following book can be anywhere in the rest of the reference. Books are
+    # checked in order, starting with the book after the previous book found.
+    for book in _BOOKS_AFTER[previous_book]:
+        if book_match := lexicon.book_regular_expressions[book].search(reference):
+            return book, book_match
+
+    return None, None
+
+
 def _process_sub_references(book: Book, reference: str) -> list[NormalizedReference]:
     references: list[NormalizedReference] = []
     start_chapter: int = 0
 
     for sub_reference in reference.split(COMMA):
         if (not sub_reference or sub_reference in {DASH, PERIOD}) and not references:
-            max_chapter: int = get_number_of_chapters(book)
-            max_verse: int = get_number_of_verses(book, max_chapter)
-            references.append(NormalizedReference(book, 1, 1, max_chapter, max_verse))
+            references.append(_build_whole_book_reference(book))
             continue
 
-        start_chapter, start_verse, end_chapter, end_verse = _process_sub_reference(
-            sub_reference[:-1] if sub_reference.endswith(DASH) else sub_reference,
+        start_chapter = _add_sub_reference(
+            references,
             book,
             start_chapter,
+            *_process_sub_reference(
+                sub_reference[:-1] if sub_reference.endswith(DASH) else sub_reference,
+            ),
         )
 
-        new_reference = NormalizedReference(
+    return references
+
+
+def _process_sub_reference(sub_reference: str) -> tuple[list[int], list[int]]:
+    clean_sub_reference: str = sub_reference.replace(PERIOD, COLON)
+    chapter_and_verse_range: list[str] = clean_sub_reference.split(DASH)
+    min_chapter_and_verse: list[int] = _process_chapter_and_verse(
+        chapter_and_verse_range[0].strip(),
+    )
+    max_chapter_and_verse: list[int] = (
+        _process_chapter_and_verse(chapter_and_verse_range[1])
+        if len(chapter_and_verse_range) > 1
+        else []
+    )
+
+    return min_chapter_and_verse, max_chapter_and_verse
+
+
+def _process_chapter_and_verse(chapter_and_verse: str) -> list[int]:
+    numbers: list[str] = chapter_and_verse.split(COLON)
+
+    # Only a chapter, a verse, or a chapter and verse are meaningful.
+    if len(numbers) > 2:
+        return []
+
+    return [int(number.strip()) for number in numbers]
+
+
+def _process_reference_tokens(tokens: list[Token]) -> list[NormalizedReference]:
+    books: list[Book] = []
+    book_tokens: list[list[Token]] = []
+
+    for token in tokens:
+        if token.token_type is TokenType.BOOK:
+            books.append(token.value)  # type: ignore[arg-type]
+            book_tokens.append([])
+        else:
+            book_tokens[-1].append(token)
+
+    # First Book
+    first_book_references = _process_sub_reference_tokens(books[0], book_tokens[0])
+
+    if len(books) == 1:
+        return first_book_references
+
+    # Second Book
+    second_book_references = _process_sub_reference_tokens(books[1], book_tokens[1])
+
+    return _combine_book_references(first_book_references, second_book_references)
+
+
+def _process_sub_reference_tokens(
+    book: Book,
+    tokens: list[Token],
+) -> list[NormalizedReference]:
+    references: list[NormalizedReference] = []
+    start_chapter: int = 0
+
+    for sub_reference in _split_tokens(tokens, TokenType.COMMA):
+        if sub_reference and sub_reference[-1].token_type is TokenType.DASH:
+            sub_reference.pop()
+
+        if not sub_reference and not references:
+            references.append(_build_whole_book_reference(book))
+            continue
+
+        chapter_and_verse_range: list[list[int]] = [
+            [
+                token.value  # type: ignore[misc]
+                for token in chapter_and_verse_tokens
+                if token.token_type is TokenType.NUMBER
+            ]
+            for chapter_and_verse_tokens in _split_tokens(sub_reference, TokenType.DASH)
+        ]
+        start_chapter = _add_sub_reference(
+            references,
             book,
             start_chapter,
-            start_verse,
-            end_chapter,
-            end_verse,
+            chapter_and_verse_range[0],
+            chapter_and_verse_range[1] if len(chapter_and_verse_range) > 1 else [],
         )
 
-        if is_valid_reference(new_reference):
-            references.append(new_reference)
+    return references
 
-        start_chapter = end_chapter
 
-    return references
+def _split_tokens(tokens: list[Token], separator: TokenType) -> list[list[Token]]:
+    split_tokens: list[list[Token]] = [[]]
+
+    for token in tokens:
+        if token.token_type is separator:
+            split_tokens.append([])
+        else:
+            split_tokens[-1].append(token)
 
+    return split_tokens
 
-def _process_sub_reference(
-    sub_reference: str,
+
+def _add_sub_reference(
+    references: list[NormalizedReference],
     book: Book,
     start_chapter: int,
-) -> tuple[int, int, int, int]:
+    min_chapter_and_verse: list[int],
+    max_chapter_and_verse: list[int],
+) -> int:
     start_verse: int = 0
     end_chapter: int = start_chapter
     end_verse: int = start_verse
     no_verses: bool = False
 
-    clean_sub_reference: str = sub_reference.replace(PERIOD, COLON)
-    chapter_and_verse_range: list[str] = clean_sub_reference.split(DASH)
-    min_chapter_and_verse: list[str] = chapter_and_verse_range[0].strip().split(COLON)
-
     if len(min_chapter_and_verse) == 1:
         if start_chapter > 0:
-            start_verse = int(min_chapter_and_verse[0].strip())
+            start_verse = min_chapter_and_verse[0]
             end_chapter = start_chapter
             end_verse = start_verse
         elif is_single_chapter_book(book):
             start_chapter = 1
-            start_verse = int(min_chapter_and_verse[0].strip())
+            start_verse = min_chapter_and_verse[0]
             end_chapter = 1
             end_verse = start_verse
         else:
-            start_chapter = int(min_chapter_and_verse[0].strip())
+            start_chapter = min_chapter_and_verse[0]
             start_verse = 1
             end_chapter = start_chapter
             end_verse = get_number_of_verses(book, end_chapter)
             no_verses = True
     elif len(min_chapter_and_verse) == 2:
-        start_chapter = int(min_chapter_and_verse[0].strip())
+        start_chapter, start_verse = min_chapter_and_verse
         end_chapter = start_chapter
-        start_verse = int(min_chapter_and_verse[1].strip())
         end_verse = start_verse
 
-    if len(chapter_and_verse_range) > 1:
-        max_chapter_and_verse = chapter_and_verse_range[1].split(COLON)
+    if len(max_chapter_and_verse) == 1:
+        if no_verses:
+            end_chapter = max_chapter_and_verse[0]
+            end_verse = get_number_of_verses(book, end_chapter)
+        else:
+            end_verse = max_chapter_and_verse[0]
+    elif len(max_chapter_and_verse) == 2:
+        end_chapter, end_verse = max_chapter_and_verse
+
+    new_reference = NormalizedReference(
+        book,
+        start_chapter,
+        start_verse,
+        end_chapter,
+        end_verse,
+    )
+
+    if is_valid_reference(new_reference):
+        references.append(new_reference)
+
+    return end_chapter
 
-        if len(max_chapter_and_verse) == 1:
-            if no_verses:
-                end_chapter = int(max_chapter_and_verse[0].strip())
-                end_verse = get_number_of_verses(book, end_chapter)
-            else:
-                end_verse = int(max_chapter_and_verse[0].strip())
-        elif len(max_chapter_and_verse) == 2:
-            end_chapter = int(max_chapter_and_verse[0].strip())
-            end_verse = int(max_chapter_and_verse[1].strip())
 
-    return start_chapter, start_verse, end_chapter, end_verse
+def _build_whole_book_reference(book: Book) -> NormalizedReference:
+    max_chapter: int = get_number_of_chapters(book)
+    max_verse: int = get_number_of_verses(book, max_chapter)
+    return NormalizedReference(book, 1, 1, max_chapter, max_verse)
 
 
-def _get_book_group_references(
+def _iter_reference_spans(
+    clean_text: str,
+    book_groups: dict[str, tuple[Book, ...]] | None,
+    engine: ParserEngine,
+    lexicon: BookLexicon,
+    *,
+    prefilter: bool = False,
+) -> Iterator[tuple[int, int, list[NormalizedReference]]]:
+    # The book group matches are not prefiltered, since they are not book names. The
+    # prefilter looks for the book names of every locale, so it never skips a text
+    # with a book name from the lexicon.
+    if not prefilter or might_contain_reference(clean_text):
+        yield from _iter_scripture_reference_spans(clean_text, engine, lexicon)
+
+    if book_groups:
+        yield from _iter_book_group_spans(clean_text, book_groups)
+
+
+def _iter_reference_spans_within_budget(
     text: str,
-    book_groups: dict[str, tuple[Book, ...]],
-) -> list[NormalizedReference]:
-    references: list[NormalizedReference] = []
-    book_group_regex: Pattern[str] = re.compile(
-        "|".join(book_groups.keys()),
-        re.IGNORECASE | re.UNICODE,
-    )
+    book_groups: dict[str, tuple[Book, ...]] | None,
+    engine: ParserEngine,
+    lexicon: BookLexicon,
+    *,
+    prefilter: bool,
+    budget: ParserBudget,
+) -> Iterator[tuple[int, int, list[NormalizedReference]]]:
+    if budget.max_length is not None and len(text) > budget.max_length:
+        error_message = (
+            f"The text is {len(text)} characters long, which is more than the "
+            f"budget of {budget.max_length} characters."
+        )
+        raise ParserBudgetExceededError(error_message)
+
+    if budget.max_seconds is None:
+        deadline: float = math.inf
+    else:
+        deadline = time.monotonic() + budget.max_seconds
+
+    # A single search of the text cannot be interrupted, so the time is checked each
+    # time a reference is found and once more at the end, so that a text with no
+    # references still goes over the budget.
+    for span in _iter_reference_spans(
+        normalize_text(text).text,
+        book_groups,
+        engine,
+        lexicon,
+        prefilter=prefilter,
+    ):
+        _check_deadline(deadline, budget)
+        yield span
 
-    for match in re.finditer(book_group_regex, text):
-        references.extend(_process_book_group_match(match[0], book_groups))
+    _check_deadline(deadline, budget)
 
-    return references
 
+def _check_deadline(deadline: float, budget: ParserBudget) -> None:
+    if time.monotonic() >= deadline:
+        error_message = (
+            f"Parsing the text took more than the budget of "
+            f"{budget.max_seconds} seconds."
+        )
+        raise ParserBudgetExceededError(error_message)
+
+
+def _iter_scripture_reference_spans(
+    clean_text: str,
+    engine: ParserEngine,
+    lexicon: BookLexicon,
+) -> Iterator[tuple[int, int, list[NormalizedReference]]]:
+    if engine is ParserEngine.LEXER:
+        for start, end, tokens in tokenize_references(
+            clean_text,
+            lexicon.book_token_regular_expression,
+        ):
+            yield start, end, _process_reference_tokens(tokens)
+        return
+
+    # The regular expression backend only compiles the scripture reference regular
+    # expression of the default lexicon.
+    scripture_reference_regular_expression: Pattern[str] = (
+        get_scripture_reference_regular_expression()
+        if lexicon is get_book_lexicon()
+        else lexicon.scripture_reference_regular_expression
+    )
+
+    for reference_match in scripture_reference_regular_expression.finditer(
+        clean_text,
+    ):
+        yield (
+            reference_match.start(),
+            reference_match.end(),
+            list(_normalize_reference_cached(reference_match[0], lexicon)),
+        )
 
-def _process_book_group_match(
+
+def _iter_book_group_spans(
     text: str,
     book_groups: dict[str, tuple[Book, ...]],
-) -> list[NormalizedReference]:
-    references: list[NormalizedReference] = []
-    regular_expression: str
-    books: tuple[Book, ...]
+) -> Iterator[tuple[int, int, list[NormalizedReference]]]:
+    book_group_regex: Pattern[str]
+    book_group_references: dict[str, tuple[NormalizedReference, ...]]
+    book_group_regex, book_group_references = _get_book_group_matcher(
+        tuple(book_groups.items()),
+    )
 
-    for regular_expression, book_group_books in book_groups.items():
-        reference_match: Match[str] | None = re.match(
-            regular_expression,
-            text,
-            re.IGNORECASE,
+    for match in book_group_regex.finditer(text):
+        yield match.start(), match.end(), list(
+            book_group_references[match.lastgroup],  # type: ignore[index]
         )
 
-        if reference_match:
-            books = book_group_books
-            break
 
+@lru_cache(maxsize=BOOK_GROUP_MATCHER_CACHE_SIZE)
+def _get_book_group_matcher(
+    book_groups: tuple[tuple[str, tuple[Book, ...]], ...],
+) -> tuple[Pattern[str], dict[str, tuple[NormalizedReference, ...]]]:
+    # Each book group regular expression is wrapped in a named group, so the name of
+    # the group that matched is the book group that was found. The references of each
+    # book group are built once, since they never change.
+    group_names: list[str] = [
+        f"{_BOOK_GROUP_NAME_PREFIX}{index}" for index in range(len(book_groups))
+    ]
+    book_group_regex: Pattern[str] = re.compile(
+        "|".join(
+            f"(?P<{group_name}>{regular_expression})"
+            for group_name, (regular_expression, _) in zip(group_names, book_groups)
+        ),
+        re.IGNORECASE | re.UNICODE,
+    )
+    book_group_references: dict[str, tuple[NormalizedReference, ...]] = {
+        group_name: tuple(_build_book_group_references(books))
+        for group_name, (_, books) in zip(group_names, book_groups)
+    }
+
+    return book_group_regex, book_group_references
+
+
+def _build_book_group_references(books: tuple[Book, ...]) -> list[NormalizedReference]:
+    references: list[NormalizedReference] = []
     start_book: Book = books[0]
     previous_book: Book = start_book
 
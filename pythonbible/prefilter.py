@@ -0,0 +1,344 @@
+"""A cheap check for texts that cannot contain a scripture reference.
+
+Every scripture reference starts with a book name at a word boundary, so a text can
+only contain a reference if one of its words starts like one of the book regular
+expressions. The first few characters of every string each book regular expression
+can match are worked out once from the book regular expressions, which only use a few
+regular expression features, and combined into a small regular expression that is much
+cheaper to search than the full scripture reference regular expression.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from typing import Iterable
+from typing import Pattern
+
+from pythonbible.books import Book
+
+PREFIX_LENGTH: int = 4
+
+_ANY_CHARACTER: str = "."
+_WHITESPACE: str = r"\s+"
+_WORD_BOUNDARY: str = r"\b"
+
+# The regular expression features used by the book regular expressions. Any other
+# feature means that the prefixes cannot be worked out.
+_ESCAPES: dict[str, str] = {"s": _WHITESPACE, "d": r"\d", "b": _WORD_BOUNDARY}
+_GROUP_START: str = "("
+_GROUP_END: str = ")"
+_NON_CAPTURING_GROUP_START: str = "(?:"
+_EXTENSION_START: str = "(?"
+_ZERO_WIDTH_GROUP_STARTS: tuple[str, ...] = ("(?=", "(?!", "(?<=", "(?<!")
+_ZERO_WIDTH_CHARACTERS: str = "^$"
+_UNSUPPORTED_CHARACTERS: str = "[]{}"
+_ALTERNATIVE_SEPARATOR: str = "|"
+_ESCAPE: str = "\\"
+_LAZY: str = "?"
+_REPEATS: dict[str, tuple[int, int]] = {
+    "*": (0, sys.maxsize),
+    "+": (1, sys.maxsize),
+    "?": (0, 1),
+}
+
+if TYPE_CHECKING:
+    # A prefix is a tuple of regular expressions that each match a single character, or
+    # a run of whitespace. None means that the characters could not be worked out, and
+    # so that any text could contain a reference.
+    _Prefixes = set[tuple[str, ...]] | None
+
+
+@dataclass(frozen=True)
+class PrefilterInfo:
+    """PrefilterInfo is a dataclass with the statistics of the reference prefilter.
+
+    :param checked: the number of texts checked by the prefilter
+    :type checked: int
+    :param skipped: the number of texts that could not contain a reference, and so
+                    were not searched
+    :type skipped: int
+    """
+
+    checked: int
+    skipped: int
+
+    @property
+    def skip_rate(self: PrefilterInfo) -> float:
+        """Return the fraction of the checked texts that were skipped."""
+        return self.skipped / self.checked if self.checked else 0.0
+
+
+_checked: int = 0
+_skipped: int = 0
+
+
+def might_contain_reference(text: str) -> bool:
+    """Check to see if the text could contain a scripture reference.
+
+    A False result means that the text certainly does not contain a scripture
+    reference. A True result means that it needs to be searched to find out.
+
+    :param text: String that may contain zero or more scripture references
+    :type text: str
+    :return: False if the text cannot contain a scripture reference; otherwise, True
+    :rtype: bool
+    """
+    global _checked, _skipped  # noqa: PLW0603
+    _checked += 1
+    book_prefix_regular_expression: Pattern[str] | None = (
+        _get_book_prefix_regular_expression()
+    )
+
+    if book_prefix_regular_expression is None or (
+        book_prefix_regular_expression.search(text)
+    ):
+        return True
+
+    _skipped += 1
+    return False
+
+
+def get_prefilter_info() -> PrefilterInfo:
+    """Return the statistics of the reference prefilter.
+
+    :return: The number of texts checked and skipped, and the skip rate
+    :rtype: PrefilterInfo
+    """
+    return PrefilterInfo(_checked, _skipped)
+
+
+def reset_prefilter_info() -> None:
+    """Set the statistics of the reference prefilter back to zero."""
+    global _checked, _skipped  # noqa: PLW0603
+    _checked = 0
+    _skipped = 0
+
+
+@lru_cache()
+def _get_book_prefix_regular_expression() -> Pattern[str] | None:
+    # Built the first time it is needed rather than when the module is imported. The
+    # trailing word boundary of the book names in the scripture reference regular
+    # expression rules out the words that only start with a short abbreviation.
+    return _build_book_prefix_regular_expression(
+        rf"(?:{book.regular_expression})\b" for book in Book
+    )
+
+
+def _build_book_prefix_regular_expression(
+    regular_expressions: Iterable[str],
+) -> Pattern[str] | None:
+    prefixes: set[tuple[str, ...]] = set()
+
+    for regular_expression in regular_expressions:
+        book_prefixes: _Prefixes
+        end: int
+        book_prefixes, end = _parse_alternatives(regular_expression, 0, PREFIX_LENGTH)
+
+        if book_prefixes is None or end < len(regular_expression):
+            return None
+
+        prefixes.update(book_prefixes)
+
+    # Group the prefixes by their first character so that the search only has to try
+    # the rest of the prefixes at the positions where one of them could start.
+    prefixes_by_first: dict[str, set[str]] = {}
+
+    for prefix in prefixes:
+        if not prefix:
+            return None
+
+        prefixes_by_first.setdefault(prefix[0], set()).add("".join(prefix[1:]))
+
+    return re.compile(
+        r"\b(?:"
+        + "|".join(
+            f"{first}(?:{'|'.join(sorted(rests, key=len, reverse=True))})"
+            for first, rests in sorted(prefixes_by_first.items())
+        )
+        + ")",
+        re.IGNORECASE | re.UNICODE,
+    )
+
+
+def _parse_alternatives(
+    pattern: str,
+    position: int,
+    length: int,
+) -> tuple[_Prefixes, int]:
+    # Return the first characters of every string the alternatives of the pattern from
+    # the given position can match, up to the given length, and the position after
+    # them. Shorter prefixes are strings that the pattern can match completely.
+    prefixes: set[tuple[str, ...]] = set()
+
+    while True:
+        alternative_prefixes: _Prefixes
+        alternative_prefixes, position = _parse_sequence(pattern, position, length)
+
+        if alternative_prefixes is None:
+            return None, position
+
+        prefixes.update(alternative_prefixes)
+
+        if not pattern.startswith(_ALTERNATIVE_SEPARATOR, position):
+            return prefixes, position
+
+        position += len(_ALTERNATIVE_SEPARATOR)
+
+
+def _parse_sequence(
+    pattern: str,
+    position: int,
+    length: int,
+) -> tuple[_Prefixes, int]:
+    prefixes: set[tuple[str, ...]] = {()}
+
+    while position < len(pattern) and pattern[position] not in (
+        _ALTERNATIVE_SEPARATOR,
+        _GROUP_END,
+    ):
+        item_prefixes: _Prefixes
+        item_prefixes, position = _parse_item(pattern, position, length)
+
+        if item_prefixes is None:
+            return None, position
+
+        prefixes = _concatenate(prefixes, item_prefixes, length)
+
+    return prefixes, position
+
+
+def _parse_item(pattern: str, position: int, length: int) -> tuple[_Prefixes, int]:
+    item_prefixes: _Prefixes
+    item_prefixes, position = _parse_atom(pattern, position, length)
+
+    if (
+        item_prefixes is None
+        or position >= len(pattern)
+        or pattern[position] not in _REPEATS
+    ):
+        return item_prefixes, position
+
+    minimum: int
+    maximum: int
+    minimum, maximum = _REPEATS[pattern[position]]
+    position += 1
+
+    if pattern.startswith(_LAZY, position):
+        position += len(_LAZY)
+
+    return _repeat(item_prefixes, minimum, maximum, length), position
+
+
+def _parse_atom(pattern: str, position: int, length: int) -> tuple[_Prefixes, int]:
+    character: str = pattern[position]
+
+    if character == _GROUP_START:
+        return _parse_group(pattern, position, length)
+
+    if character == _ESCAPE:
+        return _parse_escape(pattern, position)
+
+    return _parse_character(pattern, position)
+
+
+def _parse_escape(pattern: str, position: int) -> tuple[_Prefixes, int]:
+    escaped: str = pattern[position + 1 : position + 2]
+
+    if escaped in _ESCAPES:
+        return {(_ESCAPES[escaped],)}, position + 2
+
+    if not escaped or escaped.isalnum():
+        return None, position
+
+    return {(re.escape(escaped),)}, position + 2
+
+
+def _parse_character(pattern: str, position: int) -> tuple[_Prefixes, int]:
+    character: str = pattern[position]
+
+    if character in _ZERO_WIDTH_CHARACTERS:
+        return {()}, position + 1
+
+    if character in _UNSUPPORTED_CHARACTERS or character in _REPEATS:
+        return None, position
+
+    if character == _ANY_CHARACTER:
+        return {(_ANY_CHARACTER,)}, position + 1
+
+    return {(re.escape(character),)}, position + 1
+
+
+def _parse_group(pattern: str, position: int, length: int) -> tuple[_Prefixes, int]:
+    group_start: str = _GROUP_START
+    is_zero_width: bool = False
+
+    if pattern.startswith(_NON_CAPTURING_GROUP_START, position):
+        group_start = _NON_CAPTURING_GROUP_START
+    elif pattern.startswith(_ZERO_WIDTH_GROUP_STARTS, position):
+        group_start = next(
+            start
+            for start in _ZERO_WIDTH_GROUP_STARTS
+            if pattern.startswith(start, position)
+        )
+        is_zero_width = True
+    elif pattern.startswith(_EXTENSION_START, position):
+        return None, position
+
+    group_prefixes: _Prefixes
+    group_prefixes, position = _parse_alternatives(
+        pattern,
+        position + len(group_start),
+        length,
+    )
+
+    if group_prefixes is None or not pattern.startswith(_GROUP_END, position):
+        return None, position
+
+    # A lookahead or lookbehind does not add any characters to the prefixes.
+    return {()} if is_zero_width else group_prefixes, position + len(_GROUP_END)
+
+
+def _repeat(
+    item_prefixes: set[tuple[str, ...]],
+    minimum: int,
+    maximum: int,
+    length: int,
+) -> set[tuple[str, ...]]:
+    prefixes: set[tuple[str, ...]] = set()
+    repeated_prefixes: set[tuple[str, ...]] = {()}
+
+    # Every repetition adds at least one character, except for runs of whitespace that
+    # are merged together, so repeating more than this cannot add any new prefixes.
+    for count in range(min(maximum, minimum + length) + 1):
+        if count >= minimum:
+            prefixes.update(repeated_prefixes)
+
+        repeated_prefixes = _concatenate(repeated_prefixes, item_prefixes, length)
+
+    return prefixes
+
+
+def _concatenate(
+    prefixes: set[tuple[str, ...]],
+    suffixes: set[tuple[str, ...]],
+    length: int,
+) -> set[tuple[str, ...]]:
+    concatenated: set[tuple[str, ...]] = set()
+
+    for prefix in prefixes:
+        if len(prefix) >= length:
+            concatenated.add(prefix)
+            continue
+
+        for suffix in suffixes:
+            # A run of whitespace followed by another run of whitespace is a single run.
+            if prefix and suffix and prefix[-1] == suffix[0] == _WHITESPACE:
+                suffix = suffix[1:]  # noqa: PLW2901
+
+            concatenated.add((prefix + suffix)[:length])
+
+    return concatenated
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pythonbible.normalized_reference import NormalizedReference
+
+
+@dataclass(frozen=True)
+class ReferenceMatch:
+    """ReferenceMatch is a dataclass that represents where a reference was found.
+
+    The offsets always refer to the text that was searched, even when HTML dash
+    entities or Unicode dashes in that text were replaced before searching.
+
+    :param start: the index of the first character of the match in the text
+    :type start: int
+    :param end: the index after the last character of the match in the text
+    :type end: int
+    :param text: the matched substring of the text
+    :type text: str
+    :param references: the normalized references parsed from the matched substring
+    :type references: list[NormalizedReference]
+    """
+
+    start: int
+    end: int
+    text: str
+    references: list[NormalizedReference]
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import contextlib
+import importlib
+from enum import Enum
+from typing import Any
+from typing import Pattern
+
+from pythonbible import regular_expressions
+from pythonbible.regular_expressions import CROSS_BOOK
+
+# The flag is given inline so that every backend understands it. Patterns for str are
+# Unicode patterns in all of the backends.
+_SCRIPTURE_REFERENCE_PATTERN: str = f"(?i){CROSS_BOOK}"
+
+
+class RegularExpressionBackend(Enum):
+    """RegularExpressionBackend is an Enum of the regular expression engines.
+
+    RE is the standard library re module and is always available. REGEX is the
+    third-party regex package. RE2 is any installed module named re2 that follows the
+    re module interface, such as a wrapper of Google's linear-time RE2 engine.
+
+    :param value: the name of the module that implements the backend
+    :type value: str
+    """
+
+    RE = "re"
+    REGEX = "regex"
+    RE2 = "re2"
+
+    def compile(self: RegularExpressionBackend, pattern: str) -> Pattern[str]:
+        """Compile the pattern with this backend.
+
+        :param pattern: the regular expression, with any flags given inline
+        :type pattern: str
+        :return: The compiled regular expression
+        :rtype: Pattern[str]
+        :raises ImportError: if the backend is not installed
+        """
+        module: Any = importlib.import_module(self.value)
+        return module.compile(pattern)  # type: ignore[no-any-return]
+
+
+_backend: RegularExpressionBackend = RegularExpressionBackend.RE
+
+# None until a backend other than re is set, so that the re backend uses the regular
+# expression of the regular_expressions module, which is compiled on first use.
+_scripture_reference_regular_expression: Pattern[str] | None = None
+
+
+def get_regular_expression_backend() -> RegularExpressionBackend:
+    """Return the backend used to search texts for scripture references.
+
+    :return: The backend in use
+    :rtype: RegularExpressionBackend
+    """
+    return _backend
+
+
+def set_regular_expression_backend(
+    backend: RegularExpressionBackend,
+) -> RegularExpressionBackend:
+    """Set the backend used to search texts for scripture references.
+
+    If the backend is not installed, or it does not support the features of the
+    scripture reference regular expression (RE2, for example, does not support
+    lookahead assertions), the re backend is used instead.
+
+    :param backend: The backend to use
+    :type backend: RegularExpressionBackend
+    :return: The backend that is actually used
+    :rtype: RegularExpressionBackend
+    """
+    global _backend, _scripture_reference_regular_expression  # noqa: PLW0603
+
+    _backend = RegularExpressionBackend.RE
+    _scripture_reference_regular_expression = None
+
+    if backend is RegularExpressionBackend.RE:
+        return _backend
+
+    # Each backend raises its own error type when it cannot compile the pattern.
+    with contextlib.suppress(Exception):
+        _scripture_reference_regular_expression = backend.compile(
+            _SCRIPTURE_REFERENCE_PATTERN,
+        )
+        _backend = backend
+
+    return _backend
+
+
+def get_scripture_reference_regular_expression() -> Pattern[str]:
+    """Return the scripture reference regular expression compiled by the backend.
+
+    :return: The compiled scripture reference regular expression
+    :rtype: Pattern[str]
+    """
+    if _scripture_reference_regular_expression is None:
+        return regular_expressions.SCRIPTURE_REFERENCE_REGULAR_EXPRESSION
+
+    return _scripture_reference_regular_expression
@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 from typing import Pattern
 
-from pythonbible import Book
+from pythonbible.books import Book
 
 DIGIT: str = r"(\d{1,3})"
 SPACE: str = r"\s*"
@@ -37,7 +37,48 @@ FULL_CHAPTER_AND_VERSE: str = (
 FULL_BOOK = f"({BOOK}){SPACE}(?:{FULL_CHAPTER_AND_VERSE})?"
 CROSS_BOOK = f"({FULL_BOOK}(?:{DASH}({FULL_BOOK}))?)"
 
-SCRIPTURE_REFERENCE_REGULAR_EXPRESSION: Pattern[str] = re.compile(
-    CROSS_BOOK,
-    re.IGNORECASE | re.UNICODE,
+# A single alternation of every book regular expression, each wrapped in a named group
+# so that the matching Book can be read straight off of ``Match.lastgroup``.
+BOOK_RESOLVER: str = "|".join(
+    f"(?P<{book.name}>{book.regular_expression})" for book in Book
 )
+
+# The same matches as BOOK, but with the named groups of the book resolver so that the
+# matching Book is known without resolving the matched text again.
+BOOK_TOKEN: str = rf"\b(?:{BOOK_RESOLVER})\b\.*"
+
+# Every book regular expression is part of these patterns, so compiling them takes
+# most of the time needed to import the package. They are compiled the first time
+# they are read from the module, by __getattr__, rather than when it is imported.
+SCRIPTURE_REFERENCE_REGULAR_EXPRESSION: Pattern[str]
+BOOK_RESOLVER_REGULAR_EXPRESSION: Pattern[str]
+BOOK_TOKEN_REGULAR_EXPRESSION: Pattern[str]
+
+_LAZY_REGULAR_EXPRESSIONS: dict[str, tuple[str, int]] = {
+    "SCRIPTURE_REFERENCE_REGULAR_EXPRESSION": (CROSS_BOOK, re.IGNORECASE | re.UNICODE),
+    "BOOK_RESOLVER_REGULAR_EXPRESSION": (BOOK_RESOLVER, re.IGNORECASE),
+    "BOOK_TOKEN_REGULAR_EXPRESSION": (BOOK_TOKEN, re.IGNORECASE | re.UNICODE),
+}
+
+
+def __getattr__(name: str) -> Pattern[str]:
+    """Compile a regular expression of the module the first time it is read.
+
+    The compiled regular expression is stored in the module, so this is only called
+    once for each of them.
+
+    :param name: the name of the module attribute
+    :type name: str
+    :return: the compiled regular expression
+    :rtype: Pattern[str]
+    :raises AttributeError: if the module has no attribute with the name
+    """
+    if name not in _LAZY_REGULAR_EXPRESSIONS:
+        error_message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(error_message)
+
+    pattern, flags = _LAZY_REGULAR_EXPRESSIONS[name]
+    regular_expression: Pattern[str] = re.compile(pattern, flags)
+    globals()[name] = regular_expression
+
+    return regular_expression
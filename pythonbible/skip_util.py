@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Callable
+from typing import Sequence
+from typing import TypeVar
+
+_T = TypeVar("_T")
+
+
+def skip_while(
+    items: Sequence[_T],
+    position: int,
+    predicate: Callable[[_T], bool],
+) -> int:
+    """Return the position of the first item from the position that is not skipped.
+
+    e.g. skip_while(text, position, str.isspace) skips the whitespace at the position.
+
+    :param items: the characters of a text, or the words of a text
+    :type items: Sequence[_T]
+    :param position: the position of the first item that may be skipped
+    :type position: int
+    :param predicate: returns True for the items that are skipped
+    :type predicate: Callable[[_T], bool]
+    :return: the position of the first item that is not skipped, or the length of the
+             items if every item from the position is skipped
+    :rtype: int
+    """
+    items_length: int = len(items)
+
+    while position < items_length and predicate(items[position]):
+        position += 1
+
+    return position
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Generator
+from typing import Iterable
+from typing import Iterator
+from typing import TextIO
+
+from pythonbible.normalization import HTML_ENTITY_START
+from pythonbible.normalization import HTML_MDASH
+from pythonbible.normalization import HTML_NDASH
+from pythonbible.normalization import normalize_text
+from pythonbible.parser import normalize_reference
+from pythonbible.regular_expression_backend import (
+    get_scripture_reference_regular_expression,
+)
+from pythonbible.skip_util import skip_while
+
+if TYPE_CHECKING:
+    from typing import Match
+
+    from pythonbible.normalized_reference import NormalizedReference
+
+DEFAULT_CHUNK_SIZE: int = 64 * 1024
+
+# The number of characters after a position that can decide whether a reference
+# starts there (the longest book names), and the number of characters kept before the
+# next position to search so that the word boundaries and look-behinds of the book
+# regular expressions still see the text before it.
+MAX_REFERENCE_LOOKAHEAD: int = 128
+MAX_REFERENCE_LOOKBEHIND: int = 16
+
+_SEPARATORS: str = ":.,-"
+_HTML_ENTITY_MAX_LENGTH: int = max(len(HTML_MDASH), len(HTML_NDASH))
+
+
+def iter_references_from_stream(
+    stream: TextIO | Iterable[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[NormalizedReference]:
+    """Search a text stream for scripture references, one chunk at a time.
+
+    The end of each chunk is carried over to the next one, so references that are
+    split between two chunks are still found, and the references found are the same
+    as if the whole text had been given to get_references. Only about one chunk of
+    the text is held in memory at a time.
+
+    :param stream: A text file object, or any iterable of strings such as lines
+    :type stream: TextIO | Iterable[str]
+    :param chunk_size: The number of characters read from a file object at a time
+    :type chunk_size: int
+    :return: An iterator of the found scripture references
+    :rtype: Iterator[NormalizedReference]
+    """
+    buffer: str = ""
+    unprocessed: str = ""
+    position: int = 0
+
+    for chunk in _read_chunks(stream, chunk_size):
+        # An HTML dash entity may be split between two chunks, so a trailing "&" and
+        # the characters after it wait for the next chunk before being replaced.
+        unprocessed += chunk
+        entity_start: int = unprocessed.rfind(
+            HTML_ENTITY_START,
+            max(0, len(unprocessed) - _HTML_ENTITY_MAX_LENGTH + 1),
+        )
+        cut: int = len(unprocessed) if entity_start == -1 else entity_start
+        buffer += normalize_text(unprocessed[:cut]).text
+        unprocessed = unprocessed[cut:]
+
+        position = yield from _search_buffer(buffer, position, is_final=False)
+
+        # Drop the text that has already been searched.
+        trim: int = max(0, position - MAX_REFERENCE_LOOKBEHIND)
+        buffer = buffer[trim:]
+        position -= trim
+
+    buffer += normalize_text(unprocessed).text
+    yield from _search_buffer(buffer, position, is_final=True)
+
+
+def _read_chunks(stream: TextIO | Iterable[str], chunk_size: int) -> Iterator[str]:
+    if not hasattr(stream, "read"):
+        yield from stream
+        return
+
+    while chunk := stream.read(chunk_size):
+        yield chunk
+
+
+def _search_buffer(
+    buffer: str,
+    position: int,
+    *,
+    is_final: bool,
+) -> Generator[NormalizedReference, None, int]:
+    # Search the buffer from the given position and return the position to continue
+    # searching from once more text has been added to the buffer.
+    horizon: int = len(buffer) - MAX_REFERENCE_LOOKAHEAD
+    reference_match: Match[str]
+
+    for reference_match in get_scripture_reference_regular_expression().finditer(
+        buffer,
+        position,
+    ):
+        if not is_final and not _is_complete(buffer, reference_match.end()):
+            # More text may make this reference longer, or may even make a reference
+            # start earlier, so search again from here with the next chunk.
+            return max(position, min(reference_match.start(), horizon))
+
+        yield from normalize_reference(reference_match[0])
+        position = reference_match.end()
+
+    return max(position, horizon)
+
+
+def _is_complete(buffer: str, end: int) -> bool:
+    # A reference could only continue after a separator and then a number or book, so
+    # it is complete if the buffer goes far enough past the end of the reference.
+    position: int = skip_while(buffer, end, str.isspace)
+
+    if position < len(buffer) and buffer[position] in _SEPARATORS:
+        position = skip_while(buffer, position + 1, str.isspace)
+
+    return position + MAX_REFERENCE_LOOKAHEAD <= len(buffer)
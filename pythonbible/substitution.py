@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import html
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+
+from pythonbible.converter import convert_reference_to_verse_ids
+from pythonbible.formatter import format_single_reference
+from pythonbible.parser import ParserEngine
+from pythonbible.parser import iter_reference_matches
+
+if TYPE_CHECKING:
+    from pythonbible.books import Book
+    from pythonbible.reference_match import ReferenceMatch
+
+ReferenceReplacer = Callable[["ReferenceMatch"], str]
+
+REFERENCE_SEPARATOR: str = "; "
+
+
+def substitute_references(
+    text: str,
+    replacer: ReferenceReplacer,
+    book_groups: dict[str, tuple[Book, ...]] | None = None,
+    engine: ParserEngine = ParserEngine.REGULAR_EXPRESSION,
+    count: int = 0,
+) -> str:
+    """Replace the scripture references in the text with the result of the replacer.
+
+    Like re.sub, the replacer is called with each reference match and the string it
+    returns replaces the matched text. The text is searched once and the result is
+    joined once at the end. Matched text without any valid references is left as it
+    is.
+
+    :param text: String that may contain zero or more scripture references
+    :type text: str
+    :param replacer: Function that returns the replacement string for a reference match
+    :type replacer: Callable[[ReferenceMatch], str]
+    :param book_groups: Optional dictionary of BookGroup (e.g. Old Testament) to its
+                        related regular expression
+    :type book_groups: dict[str, tuple[Book, ...]] or None
+    :param engine: The engine used to find the references, defaults to
+                   ParserEngine.REGULAR_EXPRESSION
+    :type engine: ParserEngine
+    :param count: The maximum number of references to replace, defaults to 0, which
+                  replaces all of them
+    :type count: int
+    :return: The text with the scripture references replaced
+    :rtype: str
+    """
+    reference_matches = iter_reference_matches(text, book_groups, engine)
+
+    # The book group matches are found after all of the other matches, so they have to
+    # be put back in the order of the text. Any that overlap another match are skipped.
+    if book_groups:
+        reference_matches = iter(
+            sorted(
+                reference_matches,
+                key=lambda reference_match: reference_match.start,
+            ),
+        )
+
+    parts: list[str] = []
+    position: int = 0
+    replaced: int = 0
+
+    for reference_match in reference_matches:
+        if reference_match.start < position or not reference_match.references:
+            continue
+
+        parts.append(text[position : reference_match.start])
+        parts.append(replacer(reference_match))
+        position = reference_match.end
+        replaced += 1
+
+        if replaced == count:
+            break
+
+    parts.append(text[position:])
+
+    return "".join(parts)
+
+
+def html_link_replacer(url_template: str, **kwargs: Any) -> ReferenceReplacer:
+    """Return a replacer that turns each reference into an HTML anchor.
+
+    The url template is formatted with the ``start_verse_id`` and ``end_verse_id`` of
+    the references, and the formatted references are used as the title of the anchor.
+    The url, the title and the matched text are all HTML escaped.
+
+    :param url_template: The url of the anchor, e.g.
+                         "https://example.com/{start_verse_id}-{end_verse_id}"
+    :type url_template: str
+    :param kwargs: Keyword arguments passed on to format_single_reference
+    :return: A replacer to use with substitute_references
+    :rtype: Callable[[ReferenceMatch], str]
+    """
+
+    def replace(reference_match: ReferenceMatch) -> str:
+        url: str = _format_url(url_template, reference_match)
+        title: str = _format_title(reference_match, **kwargs)
+        return (
+            f'<a href="{html.escape(url)}" title="{html.escape(title)}">'
+            f"{html.escape(reference_match.text)}</a>"
+        )
+
+    return replace
+
+
+def markdown_link_replacer(url_template: str, **kwargs: Any) -> ReferenceReplacer:
+    """Return a replacer that turns each reference into a Markdown link.
+
+    The url template is formatted with the ``start_verse_id`` and ``end_verse_id`` of
+    the references, and the formatted references are used as the title of the link.
+
+    :param url_template: The url of the link, e.g.
+                         "https://example.com/{start_verse_id}-{end_verse_id}"
+    :type url_template: str
+    :param kwargs: Keyword arguments passed on to format_single_reference
+    :return: A replacer to use with substitute_references
+    :rtype: Callable[[ReferenceMatch], str]
+    """
+
+    def replace(reference_match: ReferenceMatch) -> str:
+        url: str = _format_url(url_template, reference_match)
+        title: str = _format_title(reference_match, **kwargs).replace('"', '\\"')
+        return f'[{reference_match.text}]({url} "{title}")'
+
+    return replace
+
+
+def _format_url(url_template: str, reference_match: ReferenceMatch) -> str:
+    start_verse_ids: list[int] = []
+    end_verse_ids: list[int] = []
+
+    for reference in reference_match.references:
+        verse_ids: tuple[int, ...] = convert_reference_to_verse_ids(reference)
+        start_verse_ids.append(verse_ids[0])
+        end_verse_ids.append(verse_ids[-1])
+
+    return url_template.format(
+        start_verse_id=min(start_verse_ids),
+        end_verse_id=max(end_verse_ids),
+    )
+
+
+def _format_title(reference_match: ReferenceMatch, **kwargs: Any) -> str:
+    return REFERENCE_SEPARATOR.join(
+        format_single_reference(reference, **kwargs)
+        for reference in reference_match.references
+    )
@@ -0,0 +1,490 @@
+"""A parser for the scripture references in speech-to-text transcripts.
+
+Transcripts write references the way they are spoken, e.g. "Second Timothy chapter
+two verses three and four" or "Ephesians four 17 through 32". The text is split into
+words once, and each word is looked up in precomputed tables of book names, number
+words and keywords, so the time taken grows linearly with the length of the text.
+
+A few rules differ from get_references, to follow the way references are spoken:
+
+- A book name must be followed by a chapter, since many book names are also common
+  words, or by a verse for a book with a single chapter, as in "Jude verse three".
+- A hyphen right after a chapter separates it from the verse, since speech-to-text
+  writes "John one fifteen" as "John one-fifteen".
+- Two numbers after "and" or a comma are a new chapter and verse, as in
+  "Genesis 1, 26, 2, 7", and a single number is another verse in the same chapter.
+- Consecutive verses, as in "verses three and four", are combined into one reference.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterator
+from typing import Match
+from typing import Pattern
+
+from pythonbible.books import Book
+from pythonbible.normalized_reference import NormalizedReference
+from pythonbible.reference_match import ReferenceMatch
+from pythonbible.skip_util import skip_while
+from pythonbible.validator import is_valid_chapter
+from pythonbible.validator import is_valid_reference
+from pythonbible.verses import get_number_of_verses
+from pythonbible.verses import is_single_chapter_book
+
+MAX_NUMBER_LENGTH: int = 3
+
+# Each word is a run of letters and digits, and each other character that is not
+# whitespace is a word of its own.
+_WORD_REGULAR_EXPRESSION: Pattern[str] = re.compile(r"[^\W_]+|[^\w\s]")
+
+# A lone "I" is left out, since it is far more often a pronoun than a book prefix.
+_ORDINALS: dict[str, str] = {
+    "1st": "1",
+    "first": "1",
+    "2nd": "2",
+    "ii": "2",
+    "second": "2",
+    "3rd": "3",
+    "iii": "3",
+    "third": "3",
+}
+_UNITS: dict[str, int] = {
+    "one": 1,
+    "two": 2,
+    "three": 3,
+    "four": 4,
+    "five": 5,
+    "six": 6,
+    "seven": 7,
+    "eight": 8,
+    "nine": 9,
+}
+_SMALL_NUMBERS: dict[str, int] = {
+    **_UNITS,
+    "ten": 10,
+    "eleven": 11,
+    "twelve": 12,
+    "thirteen": 13,
+    "fourteen": 14,
+    "fifteen": 15,
+    "sixteen": 16,
+    "seventeen": 17,
+    "eighteen": 18,
+    "nineteen": 19,
+}
+_TENS: dict[str, int] = {
+    "twenty": 20,
+    "thirty": 30,
+    "forty": 40,
+    "fifty": 50,
+    "sixty": 60,
+    "seventy": 70,
+    "eighty": 80,
+    "ninety": 90,
+}
+_HUNDRED: str = "hundred"
+_HYPHEN: str = "-"
+
+_AND_WORDS: frozenset[str] = frozenset(("and", "&"))
+_CHAPTER_WORDS: frozenset[str] = frozenset(("chapter", "chapters"))
+_VERSE_WORDS: frozenset[str] = frozenset(("verse", "verses", "number"))
+_THROUGH_WORDS: frozenset[str] = frozenset(("through", "thru", "to", _HYPHEN))
+_CHAPTER_AND_VERSE_SEPARATORS: frozenset[str] = frozenset((":", ".", ",", _HYPHEN))
+_PAIR_SEPARATORS: frozenset[str] = frozenset((":", ".", ","))
+_RANGE_END_SEPARATORS: frozenset[str] = frozenset((":", "."))
+_ADDITIONAL_SEPARATORS: frozenset[str] = _AND_WORDS | {","}
+
+# Spoken names of the books, in addition to their titles.
+_EXTRA_BOOK_NAMES: dict[Book, tuple[str, ...]] = {
+    Book.PSALMS: ("Psalm",),
+    Book.SONG_OF_SONGS: ("Song of Solomon",),
+    Book.REVELATION: ("Revelations",),
+    Book.ECCLESIASTICUS: ("Sirach",),
+}
+
+
+def _build_book_names() -> dict[tuple[str, ...], Book]:
+    # The words of each book name, with the ordinal of a numbered book as a digit.
+    book_names: dict[tuple[str, ...], Book] = {}
+
+    for book in Book:
+        for name in (book.title, *_EXTRA_BOOK_NAMES.get(book, ())):
+            book_names[tuple(name.casefold().split())] = book
+
+    return book_names
+
+
+_BOOK_NAMES: dict[tuple[str, ...], Book] = _build_book_names()
+_BOOK_NAME_FIRST_WORDS: frozenset[str] = frozenset(words[0] for words in _BOOK_NAMES)
+_MAX_BOOK_NAME_LENGTH: int = max(len(words) for words in _BOOK_NAMES)
+
+
+def get_transcript_references(text: str) -> list[NormalizedReference]:
+    """Search a speech-to-text transcript for spoken scripture references.
+
+    Number words (e.g. "twenty-one"), "chapter", "verse(s)", "through" and "and" are
+    understood, as well as references written with digits.
+
+    :param text: Transcript that may contain zero or more scripture references
+    :type text: str
+    :return: The list of found scripture references
+    :rtype: list[NormalizedReference]
+    """
+    return list(iter_transcript_references(text))
+
+
+def iter_transcript_references(text: str) -> Iterator[NormalizedReference]:
+    """Search a speech-to-text transcript for spoken scripture references.
+
+    Yield the scripture references as they are found, in the same order as
+    get_transcript_references, so that the search can stop early.
+
+    :param text: Transcript that may contain zero or more scripture references
+    :type text: str
+    :return: An iterator of the found scripture references
+    :rtype: Iterator[NormalizedReference]
+    """
+    for reference_match in iter_transcript_reference_matches(text):
+        yield from reference_match.references
+
+
+def get_transcript_reference_matches(text: str) -> list[ReferenceMatch]:
+    """Search a speech-to-text transcript for spoken references and where they are.
+
+    :param text: Transcript that may contain zero or more scripture references
+    :type text: str
+    :return: The list of reference matches, in the same order as
+             get_transcript_references
+    :rtype: list[ReferenceMatch]
+    """
+    return list(iter_transcript_reference_matches(text))
+
+
+def iter_transcript_reference_matches(text: str) -> Iterator[ReferenceMatch]:
+    """Search a speech-to-text transcript for spoken references and where they are.
+
+    Yield the reference matches as they are found, in the same order as
+    get_transcript_reference_matches, so that the search can stop early.
+
+    :param text: Transcript that may contain zero or more scripture references
+    :type text: str
+    :return: An iterator of the reference matches
+    :rtype: Iterator[ReferenceMatch]
+    """
+    word_matches: list[Match[str]] = list(_WORD_REGULAR_EXPRESSION.finditer(text))
+    words: list[str] = [word_match[0].casefold() for word_match in word_matches]
+    position: int = 0
+
+    while position < len(words):
+        book: Book | None
+        book_end: int
+        book, book_end = _read_book(words, position)
+
+        if book is None:
+            position += 1
+            continue
+
+        references: list[NormalizedReference]
+        end: int
+        references, end = _read_references(words, book_end, book)
+
+        if end == book_end:
+            position = book_end
+            continue
+
+        if references:
+            start_offset: int = word_matches[position].start()
+            end_offset: int = word_matches[end - 1].end()
+            yield ReferenceMatch(
+                start_offset,
+                end_offset,
+                text[start_offset:end_offset],
+                references,
+            )
+
+        position = end
+
+
+def _read_book(words: list[str], position: int) -> tuple[Book | None, int]:
+    first_word: str = _ORDINALS.get(words[position], words[position])
+
+    if first_word not in _BOOK_NAME_FIRST_WORDS:
+        return None, position
+
+    # The longest book name wins, so "first John" is 1 John rather than John.
+    for length in range(min(_MAX_BOOK_NAME_LENGTH, len(words) - position), 0, -1):
+        book: Book | None = _BOOK_NAMES.get(
+            (first_word, *words[position + 1 : position + length]),
+        )
+
+        if book is not None:
+            return book, position + length
+
+    return None, position
+
+
+def _read_references(
+    words: list[str],
+    position: int,
+    book: Book,
+) -> tuple[list[NormalizedReference], int]:
+    # Return the references after the book and the position after the last word read,
+    # which is the given position if there is no chapter after the book.
+    references: list[NormalizedReference] = []
+    chapter: int | None
+    verse: int | None
+    end: int
+
+    if (
+        is_single_chapter_book(book)
+        and position < len(words)
+        and words[position] in _VERSE_WORDS
+    ):
+        # The chapter of a single chapter book is left out before its verse, as in
+        # "Jude verse three".
+        chapter = 1
+        verse, end = _read_number(words, _skip(words, position, _VERSE_WORDS))
+
+        if verse is None:
+            return references, position
+    else:
+        chapter, end = _read_number(words, _skip(words, position, _CHAPTER_WORDS))
+
+        if chapter is None:
+            return references, position
+
+        verse, end = _read_verse(words, end, _CHAPTER_AND_VERSE_SEPARATORS)
+
+        if verse is None and is_single_chapter_book(book):
+            chapter, verse = 1, chapter
+
+    if verse is None:
+        end_chapter: int | None
+        end_chapter, end = _read_chapter_range_end(words, end)
+        _add_reference(references, book, (chapter, 1), (end_chapter or chapter, None))
+        return references, end
+
+    while True:
+        end_chapter_and_verse: tuple[int, int | None]
+        end_chapter_and_verse, end = _read_verse_range_end(words, end, chapter, verse)
+        _add_reference(references, book, (chapter, verse), end_chapter_and_verse)
+        chapter = end_chapter_and_verse[0]
+        additional_verse: int | None
+        chapter, additional_verse, end = _read_additional_verse(words, end, chapter)
+
+        if additional_verse is None:
+            return references, end
+
+        verse = additional_verse
+
+
+def _read_verse(
+    words: list[str],
+    position: int,
+    separators: frozenset[str],
+) -> tuple[int | None, int]:
+    verse_position: int = position
+
+    if verse_position < len(words) and words[verse_position] in separators:
+        verse_position += 1
+
+    verse: int | None
+    end: int
+    verse, end = _read_number(words, _skip(words, verse_position, _VERSE_WORDS))
+
+    return (None, position) if verse is None else (verse, end)
+
+
+def _read_chapter_range_end(words: list[str], position: int) -> tuple[int | None, int]:
+    if position >= len(words) or words[position] not in _THROUGH_WORDS:
+        return None, position
+
+    end_chapter: int | None
+    end: int
+    end_chapter, end = _read_number(
+        words,
+        _skip(words, position + 1, _CHAPTER_WORDS),
+    )
+
+    return (None, position) if end_chapter is None else (end_chapter, end)
+
+
+def _read_verse_range_end(
+    words: list[str],
+    position: int,
+    chapter: int,
+    verse: int,
+) -> tuple[tuple[int, int | None], int]:
+    # Return the end chapter and verse, where a verse of None is the end of the
+    # chapter, and the position after the last word read.
+    if position >= len(words) or words[position] not in _THROUGH_WORDS:
+        return (chapter, verse), position
+
+    # Transcripts may repeat words, as in "22 through verses through chapter four".
+    number_position: int = _skip(words, position + 1, _THROUGH_WORDS | _VERSE_WORDS)
+    has_chapter: bool = (
+        number_position < len(words) and words[number_position] in _CHAPTER_WORDS
+    )
+    number: int | None
+    end: int
+    number, end = _read_number(words, _skip(words, number_position, _CHAPTER_WORDS))
+
+    if number is None:
+        return (chapter, verse), position
+
+    if not has_chapter and (
+        end >= len(words) or words[end] not in _RANGE_END_SEPARATORS
+    ):
+        return (chapter, number), end
+
+    end_verse: int | None
+    verse_end: int
+    end_verse, verse_end = _read_verse(words, end, _CHAPTER_AND_VERSE_SEPARATORS)
+
+    if end_verse is None:
+        return (number, None) if has_chapter else (chapter, number), end
+
+    return (number, end_verse), verse_end
+
+
+def _read_additional_verse(
+    words: list[str],
+    position: int,
+    chapter: int,
+) -> tuple[int, int | None, int]:
+    # Return the chapter and verse after "and" or a comma, or a verse of None if there
+    # is not one, and the position after the last word read.
+    if position >= len(words) or words[position] not in _ADDITIONAL_SEPARATORS:
+        return chapter, None, position
+
+    number: int | None
+    end: int
+    number, end = _read_number(
+        words,
+        _skip(words, _skip(words, position, _ADDITIONAL_SEPARATORS), _VERSE_WORDS),
+    )
+
+    if number is None:
+        return chapter, None, position
+
+    verse: int | None
+    verse_end: int
+    verse, verse_end = _read_verse(words, end, _PAIR_SEPARATORS)
+
+    return (chapter, number, end) if verse is None else (number, verse, verse_end)
+
+
+def _read_number(words: list[str], position: int) -> tuple[int | None, int]:
+    # Numbers that start a book name, as in "John 3, 1 John 4", are not read.
+    if position >= len(words) or _read_book(words, position)[0] is not None:
+        return None, position
+
+    word: str = words[position]
+
+    if word.isdecimal():
+        if len(word) > MAX_NUMBER_LENGTH:
+            return None, position
+
+        return int(word), position + 1
+
+    number: int | None
+    end: int
+    number, end = _read_number_below_hundred(words, position)
+
+    if number is None or end >= len(words) or words[end] != _HUNDRED:
+        return number, end
+
+    # e.g. "one hundred and nineteen"
+    hundreds: int = number * 100
+    rest_position: int = end + 1
+
+    if rest_position < len(words) and words[rest_position] in _AND_WORDS:
+        rest_position += 1
+
+    rest: int | None
+    rest_end: int
+    rest, rest_end = _read_number_below_hundred(words, rest_position)
+
+    return (hundreds, end + 1) if rest is None else (hundreds + rest, rest_end)
+
+
+def _read_number_below_hundred(
+    words: list[str],
+    position: int,
+) -> tuple[int | None, int]:
+    if position >= len(words):
+        return None, position
+
+    word: str = words[position]
+
+    if word in _SMALL_NUMBERS:
+        return _SMALL_NUMBERS[word], position + 1
+
+    if word not in _TENS:
+        return None, position
+
+    # e.g. "twenty", "twenty one" or "twenty-one"
+    number: int = _TENS[word]
+    end: int = position + 1
+
+    if end < len(words) and words[end] in _UNITS:
+        return number + _UNITS[words[end]], end + 1
+
+    if end + 1 < len(words) and words[end] == _HYPHEN and words[end + 1] in _UNITS:
+        return number + _UNITS[words[end + 1]], end + 2
+
+    return number, end
+
+
+def _skip(words: list[str], position: int, skipped_words: frozenset[str]) -> int:
+    return skip_while(words, position, skipped_words.__contains__)
+
+
+def _add_reference(
+    references: list[NormalizedReference],
+    book: Book,
+    start_chapter_and_verse: tuple[int, int],
+    end_chapter_and_verse: tuple[int, int | None],
+) -> None:
+    # The end verse is None for the end of the end chapter.
+    start_chapter: int
+    start_verse: int
+    start_chapter, start_verse = start_chapter_and_verse
+    end_chapter: int
+    end_verse: int | None
+    end_chapter, end_verse = end_chapter_and_verse
+
+    if end_verse is None:
+        if not is_valid_chapter(book, end_chapter):
+            return
+
+        end_verse = get_number_of_verses(book, end_chapter)
+
+    reference: NormalizedReference = NormalizedReference(
+        book,
+        start_chapter,
+        start_verse,
+        end_chapter,
+        end_verse,
+    )
+
+    if not is_valid_reference(reference):
+        return
+
+    # Combine consecutive verses, as in "verses three and four".
+    if references and (
+        references[-1].book is book
+        and references[-1].end_chapter == start_chapter
+        and references[-1].end_verse + 1 == start_verse
+    ):
+        previous: NormalizedReference = references.pop()
+        reference = NormalizedReference(
+            book,
+            previous.start_chapter,
+            previous.start_verse,
+            end_chapter,
+            end_verse,
+        )
+
+    references.append(reference)
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from pythonbible.books import Book
+from pythonbible.errors import InvalidVerseError
 from pythonbible.normalized_reference import NormalizedReference
 from pythonbible.verses import MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER
-from pythonbible.verses import VERSE_IDS
 from pythonbible.verses import get_number_of_verses
 from pythonbible.verses import get_verse_id
+from pythonbible.verses import get_verse_ordinal
 
 
 def is_valid_verse_id(verse_id: int) -> bool:
@@ -16,7 +17,17 @@ def is_valid_verse_id(verse_id: int) -> bool:
     :return: True if the verse_id is in the list of valid verse ids; otherwise, False
     :rtype: bool
     """
-    return verse_id in VERSE_IDS
+    if verse_id is None or not isinstance(verse_id, int):
+        return False
+
+    # The book, chapter, and verse numbers of the verse id are checked against the
+    # canon tables, which takes the same time for every verse id.
+    try:
+        get_verse_ordinal(verse_id)
+    except InvalidVerseError:
+        return False
+
+    return True
 
 
 def is_valid_reference(reference: NormalizedReference) -> bool:
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from array import array
 from functools import lru_cache
+from itertools import accumulate
+from itertools import chain
 
 from pythonbible.books import Book
 from pythonbible.errors import InvalidChapterError
@@ -1148,21 +1151,152 @@ BOOK_PLACE = 1000000
 CHAPTER_PLACE = 1000
 
 
-@lru_cache()
-def __generate_verse_ids() -> tuple[int, ...]:
-    return tuple(
-        int(
-            f"{str(book.value).zfill(2)}"
-            f"{str(chapter + 1).zfill(3)}"
-            f"{str(verse + 1).zfill(3)}",
+# The canon tables are arrays of machine integers built from the table above, with
+# one entry for each chapter rather than for each verse.
+
+# The number of verses in each chapter, one book after another in canonical order.
+CHAPTER_VERSE_COUNTS: array[int] = array(
+    "H",
+    chain.from_iterable(MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER.values()),
+)
+
+# The chapters of the book with number n are the entries of CHAPTER_VERSE_COUNTS from
+# BOOK_CHAPTER_OFFSETS[n - 1] up to BOOK_CHAPTER_OFFSETS[n].
+BOOK_CHAPTER_OFFSETS: array[int] = array(
+    "H",
+    accumulate(
+        (len(chapters) for chapters in MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER.values()),
+        initial=0,
+    ),
+)
+
+# The position in canonical order of the first verse of each chapter, followed by the
+# number of verses in the Bible.
+CHAPTER_VERSE_OFFSETS: array[int] = array(
+    "L",
+    accumulate(CHAPTER_VERSE_COUNTS, initial=0),
+)
+
+
+def _generate_verse_ids() -> array[int]:
+    # The verse ids of each chapter are a range, so they are added to the array one
+    # chapter at a time without any Python work for each verse.
+    verse_ids: array[int] = array("L")
+
+    for book in Book:
+        first_chapter: int = BOOK_CHAPTER_OFFSETS[book.value - 1]
+
+        for chapter_index in range(first_chapter, BOOK_CHAPTER_OFFSETS[book.value]):
+            chapter_id: int = (
+                book.value * BOOK_PLACE
+                + (chapter_index - first_chapter + 1) * CHAPTER_PLACE
+            )
+            number_of_verses: int = CHAPTER_VERSE_COUNTS[chapter_index]
+            verse_ids.extend(range(chapter_id + 1, chapter_id + number_of_verses + 1))
+
+    return verse_ids
+
+
+# Every verse id in canonical order, packed into an array of machine integers.
+_VERSE_IDS: array[int] = _generate_verse_ids()
+
+# The same verse ids as an immutable tuple. A tuple of every verse id takes far more
+# memory than the array, so it is built the first time it is read from the module, by
+# __getattr__, rather than when the module is imported.
+VERSE_IDS: tuple[int, ...]
+
+
+def __getattr__(name: str) -> tuple[int, ...]:
+    """Build VERSE_IDS the first time it is read from the module.
+
+    The tuple is stored in the module, so this is only called once.
+
+    :param name: the name of the module attribute
+    :type name: str
+    :return: every verse id in canonical order
+    :rtype: tuple[int, ...]
+    :raises AttributeError: if the module has no attribute with the name
+    """
+    if name != "VERSE_IDS":
+        error_message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(error_message)
+
+    verse_ids: tuple[int, ...] = tuple(_VERSE_IDS)
+    globals()[name] = verse_ids
+
+    return verse_ids
+
+
+def get_verse_ordinal(verse_id: int) -> int:
+    """Return the position of the verse id in canonical order, starting at 0.
+
+    The position is worked out from the canon tables, so it takes the same time for
+    every verse id.
+
+    :param verse_id: a verse id
+    :type verse_id: int
+    :return: the position of the verse in canonical order, which is its index in
+             VERSE_IDS
+    :rtype: int
+    :raises InvalidVerseError: if the verse id does not correspond to a valid verse
+    """
+    book_number: int = verse_id // BOOK_PLACE
+    chapter: int = verse_id % BOOK_PLACE // CHAPTER_PLACE
+    verse: int = verse_id % CHAPTER_PLACE
+
+    if not 1 <= book_number < len(BOOK_CHAPTER_OFFSETS) or chapter < 1 or verse < 1:
+        raise InvalidVerseError(verse_id=verse_id)
+
+    chapter_index: int = BOOK_CHAPTER_OFFSETS[book_number - 1] + chapter - 1
+
+    if (
+        chapter_index >= BOOK_CHAPTER_OFFSETS[book_number]
+        or verse > CHAPTER_VERSE_COUNTS[chapter_index]
+    ):
+        raise InvalidVerseError(verse_id=verse_id)
+
+    return CHAPTER_VERSE_OFFSETS[chapter_index] + verse - 1
+
+
+def get_verse_id_from_ordinal(ordinal: int) -> int:
+    """Return the verse id at the given position in canonical order.
+
+    :param ordinal: the position of a verse in canonical order, starting at 0
+    :type ordinal: int
+    :return: the verse id at the position
+    :rtype: int
+    :raises IndexError: if the position is not the position of a verse
+    """
+    if not 0 <= ordinal < len(_VERSE_IDS):
+        error_message = (
+            f"{ordinal} is not a valid verse ordinal. "
+            f"Valid verse ordinals are 0-{len(_VERSE_IDS) - 1}."
         )
-        for book, chapters in MAX_VERSE_NUMBER_BY_BOOK_AND_CHAPTER.items()
-        for chapter, max_verse in enumerate(chapters)
-        for verse in range(max_verse)
-    )
+        raise IndexError(error_message)
+
+    return _VERSE_IDS[ordinal]
+
+
+def get_verse_ids_in_range(start_verse_id: int, end_verse_id: int) -> tuple[int, ...]:
+    """Return every verse id from the start verse id through the end verse id.
+
+    The verse ids are in canonical order, so the range can go on across chapters and
+    books. The range is sliced from the verse ids by the ordinals of its ends, so it
+    takes no longer than copying its verse ids.
 
+    :param start_verse_id: the verse id of the first verse of the range
+    :type start_verse_id: int
+    :param end_verse_id: the verse id of the last verse of the range
+    :type end_verse_id: int
+    :return: the verse ids of the range in canonical order, which is empty if the end
+             verse comes before the start verse
+    :rtype: tuple[int, ...]
+    :raises InvalidVerseError: if either verse id does not correspond to a valid verse
+    """
+    start_ordinal: int = get_verse_ordinal(start_verse_id)
+    end_ordinal: int = get_verse_ordinal(end_verse_id)
 
-VERSE_IDS: tuple[int, ...] = __generate_verse_ids()
+    return tuple(_VERSE_IDS[start_ordinal : end_ordinal + 1])
 
 
 @lru_cache()
@@ -1234,7 +1368,6 @@ def get_verse_id(book: Book, chapter: int, verse: int) -> int:
     return book.value * BOOK_PLACE + chapter * CHAPTER_PLACE + verse
 
 
-@lru_cache()
 def get_book_chapter_verse(verse_id: int) -> tuple[Book, int, int]:
     """Return the Book, chapter number, and verse number for the given verse id.
 
@@ -1245,8 +1378,9 @@ def get_book_chapter_verse(verse_id: int) -> tuple[Book, int, int]:
     :rtype: tuple[Book, int, int]
     :raises InvalidVerseError: if the verse id does not correspond to a valid verse
     """
-    if verse_id not in VERSE_IDS:
-        raise InvalidVerseError(verse_id=verse_id)
+    # The verse id is checked against the canon tables rather than searched for in
+    # VERSE_IDS, so this takes the same time for every verse id and is not cached.
+    get_verse_ordinal(verse_id)
 
     return (
         Book(get_book_number(verse_id)),  # type: ignore[call-arg]
@@ -1255,7 +1389,6 @@ def get_book_chapter_verse(verse_id: int) -> tuple[Book, int, int]:
     )
 
 
-@lru_cache()
 def get_book_number(verse_id: int) -> int:
     """Return the book number for the given verse id.
 
@@ -1267,7 +1400,6 @@ def get_book_number(verse_id: int) -> int:
     return verse_id // BOOK_PLACE
 
 
-@lru_cache()
 def get_chapter_number(verse_id: int) -> int:
     """Return the chapter number for the given verse id.
 
@@ -1279,7 +1411,6 @@ def get_chapter_number(verse_id: int) -> int:
     return verse_id % BOOK_PLACE // CHAPTER_PLACE
 
 
-@lru_cache()
 def get_verse_number(verse_id: int) -> int:
     """Return the verse number for the given verse id.
 
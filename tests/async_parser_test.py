@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import pythonbible as bible
+
+
+@pytest.mark.parametrize("engine", list(bible.ParserEngine))
+def test_aget_references(document: str, engine: bible.ParserEngine) -> None:
+    # Given a document that is longer than a slice
+    # When getting the references without blocking the event loop
+    references = asyncio.run(
+        bible.aget_references(document, engine, slice_size=16),
+    )
+
+    # Then the references are the same as when parsing the whole document
+    assert references == bible.get_references(document, engine=engine)
+
+
+def test_aget_references_single_line(document: str) -> None:
+    # Given a long document on a single line
+    text: str = document.replace("\n", " ") * 20
+    loop_iterations: int = 0
+
+    async def count_loop_iterations() -> None:
+        nonlocal loop_iterations
+
+        while True:
+            loop_iterations += 1
+            await asyncio.sleep(0)
+
+    async def get_references() -> list[bible.NormalizedReference]:
+        task = asyncio.create_task(count_loop_iterations())
+        references = await bible.aget_references(text, slice_size=256)
+        task.cancel()
+        return references
+
+    # When getting the references without blocking the event loop
+    references = asyncio.run(get_references())
+
+    # Then the references are the same as when parsing the whole document
+    assert references == bible.get_references(text)
+
+    # And the event loop runs between the slices of the line
+    assert loop_iterations > len(text) // (2 * 256)
+
+
+def test_aget_references_executor(document: str) -> None:
+    # Given a document that is longer than the executor threshold
+    # When getting the references in an executor
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        references = asyncio.run(
+            bible.aget_references(
+                document,
+                slice_size=16,
+                executor=executor,
+                executor_threshold=1,
+            ),
+        )
+
+    # Then the references are the same as when parsing the whole document
+    assert references == bible.get_references(document)
+
+
+def test_aiter_references(document: str) -> None:
+    # Given a document with references
+    async def first_reference() -> bible.NormalizedReference | None:
+        async for reference in bible.aiter_references(document):
+            return reference
+
+        return None
+
+    # When iterating over the references without blocking the event loop
+    # Then the references can be read one at a time
+    assert asyncio.run(first_reference()) == bible.first_reference(document)
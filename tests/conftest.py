@@ -1,9 +1,43 @@
 from __future__ import annotations
 
+import importlib
+import sys
+from typing import TYPE_CHECKING
+from typing import Iterator
+
 import pytest
 
 import pythonbible as bible
 
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+@pytest.fixture()
+def fresh_package() -> Iterator[ModuleType]:
+    # Import pythonbible again, with none of its submodules loaded, and put the
+    # original modules back afterwards so that the other tests keep using them.
+    original_modules: dict[str, ModuleType] = {
+        name: module
+        for name, module in sys.modules.items()
+        if name == bible.__name__ or name.startswith(f"{bible.__name__}.")
+    }
+
+    for name in original_modules:
+        del sys.modules[name]
+
+    try:
+        yield importlib.import_module(bible.__name__)
+    finally:
+        for name in [
+            name
+            for name in sys.modules
+            if name == bible.__name__ or name.startswith(f"{bible.__name__}.")
+        ]:
+            del sys.modules[name]
+
+        sys.modules.update(original_modules)
+
 
 @pytest.fixture()
 def verse_id() -> int:
@@ -53,6 +87,15 @@ def text_with_reference_complex() -> str:
     )
 
 
+@pytest.fixture()
+def document() -> str:
+    return (
+        "Matthew 18:12-14,\n15 is the parable of the lost sheep.\n\n"
+        "Obadiah 3-6 &ndash;\n7\nis about Edom.\n\n"
+        "The first commandment is in Exodus 20:3.\n\nLuke 15:3-7\n\n"
+    ) * 5
+
+
 @pytest.fixture()
 def normalized_references_complex() -> list[bible.NormalizedReference]:
     return [
@@ -182,3 +182,27 @@ def test_cross_book_reverse() -> None:
     assert references == [
         bible.NormalizedReference(bible.Book.ROMANS, 1, 1, 1, 25, bible.Book.PHILEMON),
     ]
+
+
+def test_whole_bible() -> None:
+    # Given a reference to every verse of the Bible
+    last_chapter: int = bible.get_number_of_chapters(bible.Book.MACCABEES_2)
+    reference: bible.NormalizedReference = bible.NormalizedReference(
+        bible.Book.GENESIS,
+        1,
+        1,
+        last_chapter,
+        bible.get_number_of_verses(bible.Book.MACCABEES_2, last_chapter),
+        bible.Book.MACCABEES_2,
+    )
+
+    # When we convert it to verse ids and back again
+    verse_ids: list[int] = bible.convert_references_to_verse_ids([reference])
+    references: list[bible.NormalizedReference] = bible.convert_verse_ids_to_references(
+        verse_ids,
+    )
+
+    # Then every verse id is returned in canonical order, and they make up the same
+    # single reference
+    assert verse_ids == list(VERSE_IDS)
+    assert references == [reference]
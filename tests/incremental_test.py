@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import pytest
+
+import pythonbible as bible
+
+
+@pytest.fixture()
+def document() -> str:
+    return (
+        "Matthew 18:12-14 is the parable of the lost sheep.\n\n"
+        "It is also told in Luke 15:3-7.\n\n"
+        "Obadiah 3-6 is about Edom.\n"
+    )
+
+
+@pytest.mark.parametrize("engine", list(bible.ParserEngine))
+def test_incremental_parser(document: str, engine: bible.ParserEngine) -> None:
+    # Given a text
+    # When creating an incremental parser for the text
+    parser = bible.IncrementalParser(document, engine)
+
+    # Then the references are the same as when parsing the whole text
+    assert parser.reference_matches == bible.get_reference_matches(
+        document,
+        engine=engine,
+    )
+    assert parser.references == bible.get_references(document, engine=engine)
+
+
+@pytest.mark.parametrize(
+    ("offset", "deleted_length", "inserted_text"),
+    [
+        (0, 0, "See "),
+        (0, 7, "Mark"),
+        (12, 0, ",\n15"),
+        (16, 0, ", 19-20"),
+        (49, 3, " - Mark 1:1"),
+        (50, 0, "Ruth 1:16\n"),
+        (85, 0, "\n\nJonah 2:1\n\n"),
+        (0, 53, ""),
+    ],
+)
+def test_incremental_parser_edit(
+    document: str,
+    offset: int,
+    deleted_length: int,
+    inserted_text: str,
+) -> None:
+    # Given an incremental parser
+    parser = bible.IncrementalParser(document)
+
+    # When editing the text
+    reference_matches = parser.edit(offset, deleted_length, inserted_text)
+
+    # Then the references are the same as when parsing the whole edited text
+    edited_text: str = (
+        document[:offset] + inserted_text + document[offset + deleted_length :]
+    )
+    edited_reference_matches = bible.get_reference_matches(edited_text)
+    assert parser.text == edited_text
+    assert parser.reference_matches == edited_reference_matches
+
+    # And only the reference matches of the blocks parsed again are returned
+    assert all(
+        reference_match in edited_reference_matches
+        for reference_match in reference_matches
+    )
+
+
+def test_incremental_parser_edits(document: str) -> None:
+    # Given an incremental parser for an empty text
+    parser = bible.IncrementalParser()
+
+    # When typing the text one character at a time
+    for offset, character in enumerate(document):
+        parser.edit(offset, 0, character)
+
+    # Then the references are the same as when parsing the whole text
+    assert parser.reference_matches == bible.get_reference_matches(document)
+
+
+def test_incremental_parser_edits_out_of_order(document: str) -> None:
+    # Given an incremental parser
+    parser = bible.IncrementalParser(document)
+    text: str = document
+
+    # When editing the end and the start of the text in turn
+    for offset, deleted_length, inserted_text in (
+        (len(document), 0, "\nRuth 1:16\n"),
+        (0, 0, "Jonah 2:1\n\n"),
+        (len(document), 4, "7"),
+        (11, 2, ""),
+    ):
+        parser.edit(offset, deleted_length, inserted_text)
+        text = text[:offset] + inserted_text + text[offset + deleted_length :]
+
+        # Then the references are the same as when parsing the whole edited text
+        assert parser.reference_matches == bible.get_reference_matches(text)
+
+
+def test_incremental_parser_invalid_edit(document: str) -> None:
+    # Given an incremental parser
+    parser = bible.IncrementalParser(document)
+
+    # When making an edit that is not inside of the text
+    # Then an error is raised and the text is not changed
+    with pytest.raises(bible.InvalidEditError):
+        parser.edit(len(document), 1, "")
+
+    assert parser.text == document
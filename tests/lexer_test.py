@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import pytest
+
+import pythonbible as bible
+from pythonbible import regular_expressions
+from pythonbible.lexer import TokenType
+from pythonbible.lexer import tokenize_references
+
+
+def test_tokenize_references() -> None:
+    # Given a text string with a scripture reference
+    text: str = "Genesis 1:1-5, 50:3 and more"
+
+    # When tokenizing that text
+    tokenized_references = list(tokenize_references(text))
+
+    # Then the reference is found and the numbers are already parsed
+    assert len(tokenized_references) == 1
+
+    start, end, tokens = tokenized_references[0]
+
+    assert text[start:end] == "Genesis 1:1-5, 50:3"
+    assert [(token.token_type, token.value) for token in tokens] == [
+        (TokenType.BOOK, bible.Book.GENESIS),
+        (TokenType.NUMBER, 1),
+        (TokenType.COLON, None),
+        (TokenType.NUMBER, 1),
+        (TokenType.DASH, None),
+        (TokenType.NUMBER, 5),
+        (TokenType.COMMA, None),
+        (TokenType.NUMBER, 50),
+        (TokenType.COLON, None),
+        (TokenType.NUMBER, 3),
+    ]
+
+
+def test_tokenize_references_same_matches_as_regular_expression() -> None:
+    scripture_reference_regular_expression = (
+        regular_expressions.SCRIPTURE_REFERENCE_REGULAR_EXPRESSION
+    )
+    texts: list[str] = [
+        "Matthew 18:12-14",
+        "Genesis - Deuteronomy",
+        "Genesis 1:1-5, 50:3 - Exodus 1:14, 2:3-20:5",
+        "Psalm 130:4,8 and Jeremiah 29:32-30:10,11",
+        "Obadiah 3-6",
+        "Exodus 20:1 - ",
+        "Genesis 1234:5",
+        "Mark 3: 5-7,",
+        "Acts . 2 . 3",
+        "Revelation..5  150  531502",
+        "Titus..1word ...",
+    ]
+
+    for text in texts:
+        # When tokenizing the text
+        lexer_spans = [(start, end) for start, end, _ in tokenize_references(text)]
+
+        # Then the references are found at the same place as the regular expression
+        # finds them
+        regular_expression_matches = scripture_reference_regular_expression.finditer(
+            text,
+        )
+        assert lexer_spans == [match.span() for match in regular_expression_matches]
+
+
+def test_get_references_lexer_engine() -> None:
+    texts: list[str] = [
+        "Matthew 18:12-14",
+        "Genesis - Deuteronomy",
+        "Genesis 1:1-5, 50:3 - Exodus 1:14, 2:3-20:5",
+        "Obadiah 3-6",
+        "Exodus 20",
+        "Genesis 1-4",
+        "Philemon 1:9",
+    ]
+
+    for text in texts:
+        # When parsing the text with the lexer engine
+        references = bible.get_references(text, engine=bible.ParserEngine.LEXER)
+
+        # Then the references are the same as with the regular expression engine
+        assert references == bible.get_references(text)
+
+
+def test_get_references_lexer_engine_book_with_periods() -> None:
+    # Given a book name followed by a period and a chapter number
+    text: str = "Genesis. 1"
+
+    # When parsing the text with the lexer engine
+    references = bible.get_references(text, engine=bible.ParserEngine.LEXER)
+
+    # Then the period is read as part of the book name
+    assert references == [bible.NormalizedReference(bible.Book.GENESIS, 1, 1, 1, 31)]
+
+
+@pytest.mark.parametrize(
+    ("text", "expected_references"),
+    [
+        (
+            "Revelation..5  150  531502",
+            [bible.NormalizedReference(bible.Book.REVELATION, 5, 1, 5, 14)],
+        ),
+        (
+            "Titus..1word ...",
+            [bible.NormalizedReference(bible.Book.TITUS, 1, 1, 1, 16)],
+        ),
+        (
+            "Genesis..1:1",
+            [bible.NormalizedReference(bible.Book.GENESIS, 1, 1, 1, 1)],
+        ),
+    ],
+)
+def test_get_references_lexer_engine_known_differences(
+    text: str,
+    expected_references: list[bible.NormalizedReference],
+) -> None:
+    # Given a run of periods after a book name that its regular expression does not
+    # end with
+    # When parsing the text with each engine
+    lexer_references = bible.get_references(text, engine=bible.ParserEngine.LEXER)
+    regular_expression_references = bible.get_references(text)
+
+    # Then the lexer reads the periods as part of the book name, and the regular
+    # expression engine reads them as separators and finds no reference
+    assert lexer_references == expected_references
+    assert regular_expression_references == []
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import pytest
+
+import pythonbible as bible
+
+
+def test_get_book_lexicon_default() -> None:
+    # Given no locales, or all of the locales
+    # When getting the book lexicon
+    lexicon: bible.BookLexicon = bible.get_book_lexicon()
+
+    # Then the default lexicon with every locale is returned
+    assert lexicon.locales == frozenset(bible.LOCALES)
+    assert bible.get_book_lexicon(reversed(bible.LOCALES)) is lexicon
+
+
+def test_get_book_lexicon_cached() -> None:
+    # Given the same locales in two different orders
+    # When getting the book lexicons
+    # Then the lexicon is only built once
+    assert bible.get_book_lexicon(("en", "es")) is bible.get_book_lexicon(["es", "en"])
+
+
+def test_get_book_lexicon_single_locale_string() -> None:
+    # Given a single locale written as a string rather than a tuple
+    # When getting the book lexicon
+    # Then the string is read as one locale, not as a locale per character
+    assert bible.get_book_lexicon("en") is bible.get_book_lexicon(("en",))
+
+
+def test_get_references_single_locale_string() -> None:
+    # Given a reference and a single locale written as a string
+    text: str = "Jn 1:1"
+
+    # When getting the references with only that locale
+    # Then the references are the same as with a tuple of that locale
+    assert bible.get_references(text, locales="en") == bible.get_references(
+        text,
+        locales=("en",),
+    )
+
+
+def test_get_book_lexicon_invalid_locale() -> None:
+    # Given a locale that is not supported
+    # When getting the book lexicon
+    # Then an error is raised
+    with pytest.raises(bible.InvalidLocaleError):
+        bible.get_book_lexicon(("en", "xx"))
+
+
+@pytest.mark.parametrize("engine", list(bible.ParserEngine))
+def test_get_references_english_only(engine: bible.ParserEngine) -> None:
+    # Given a reference with "Jn", which is also an abbreviation of Jonah in Spanish
+    # and Portuguese
+    text: str = "Jn 3:16"
+
+    # When getting the references with only the English book names
+    references = bible.get_references(text, engine=engine, locales=("en",))
+
+    # Then "Jn" is read as John
+    assert references == [bible.NormalizedReference(bible.Book.JOHN, 3, 16, 3, 16)]
+
+
+@pytest.mark.parametrize("engine", list(bible.ParserEngine))
+def test_get_references_english_only_no_other_locale_names(
+    engine: bible.ParserEngine,
+) -> None:
+    # Given texts that start with Portuguese and Spanish book names
+    texts: list[str] = ["At 10:30 on Sunday", "Juan 3:16"]
+
+    # When getting the references with and without only the English book names
+    # Then the names are only found with all of the locales
+    for text in texts:
+        assert bible.get_references(text, engine=engine)
+        assert not bible.get_references(text, engine=engine, locales=("en",))
+
+
+def test_get_references_spanish() -> None:
+    # Given a reference with a Spanish book name and ordinal
+    text: str = "Primero Reyes 3:4"
+
+    # When getting the references with the Spanish and Portuguese book names
+    # Then the reference is only found with the Spanish book names
+    assert bible.get_references(text, locales=("es",)) == [
+        bible.NormalizedReference(bible.Book.KINGS_1, 3, 4, 3, 4),
+    ]
+    assert not bible.get_references(text, locales=("pt",))
+
+
+def test_get_reference_matches_locales() -> None:
+    # Given a reference with "Jn"
+    text: str = "Jn 3:16"
+
+    # When getting the reference matches with only the English book names
+    reference_matches = bible.get_reference_matches(text, locales=("en",))
+
+    # Then the match is found with the reference to John
+    assert reference_matches == [
+        bible.ReferenceMatch(
+            0,
+            7,
+            text,
+            [bible.NormalizedReference(bible.Book.JOHN, 3, 16, 3, 16)],
+        ),
+    ]
+
+
+def test_normalize_reference_locales() -> None:
+    # Given a reference with "Jn"
+    # When normalizing it with all of the locales and with only English
+    # Then the results are cached separately
+    assert bible.normalize_reference("Jn 1:1") == [
+        bible.NormalizedReference(bible.Book.JONAH, 1, 1, 1, 1),
+    ]
+    assert bible.normalize_reference("Jn 1:1", locales=("en",)) == [
+        bible.NormalizedReference(bible.Book.JOHN, 1, 1, 1, 1),
+    ]
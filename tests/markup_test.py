@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import pythonbible as bible
+
+
+def test_get_html_references() -> None:
+    # Given an HTML document with references in its text nodes
+    document: str = (
+        "<html><body><p>Matthew 18:12-14</p><p>Obadiah 3-6</p></body></html>"
+    )
+
+    # When getting the references in the document
+    references = bible.get_html_references(document)
+
+    # Then the references in each text node are found
+    assert references == [
+        bible.NormalizedReference(bible.Book.MATTHEW, 18, 12, 18, 14),
+        bible.NormalizedReference(bible.Book.OBADIAH, 1, 3, 1, 6),
+    ]
+
+
+def test_get_html_references_skips_markup() -> None:
+    # Given an HTML document with references in attributes, comments and scripts
+    document: str = (
+        '<p title="Genesis 1:1 > Genesis 2:1">Exodus 20:3</p>'
+        "<!-- Leviticus 1:1 --><script>const reference = 'Numbers 1:1';</script>"
+        "<style>p::before { content: 'Deuteronomy 1:1'; }</style>"
+    )
+
+    # When getting the references in the document
+    references = bible.get_html_references(document)
+
+    # Then only the reference in the text node is found
+    assert references == [bible.NormalizedReference(bible.Book.EXODUS, 20, 3, 20, 3)]
+
+
+def test_get_html_reference_matches_entities() -> None:
+    # Given an HTML document with entities in its references
+    document: str = (
+        "<p>John&nbsp;3:16&ndash;18</p><p>Exodus 20:3&#8212;5 &amp; more</p>"
+    )
+
+    # When getting the reference matches in the document
+    reference_matches = bible.get_html_reference_matches(document)
+
+    # Then the entities are decoded and the offsets refer to the HTML document
+    assert reference_matches == [
+        bible.ReferenceMatch(
+            3,
+            26,
+            "John&nbsp;3:16&ndash;18",
+            [bible.NormalizedReference(bible.Book.JOHN, 3, 16, 3, 18)],
+        ),
+        bible.ReferenceMatch(
+            33,
+            52,
+            "Exodus 20:3&#8212;5",
+            [bible.NormalizedReference(bible.Book.EXODUS, 20, 3, 20, 5)],
+        ),
+    ]
+
+
+def test_get_html_references_escaped_entity() -> None:
+    # Given an HTML document with an escaped dash entity after a reference
+    document: str = "<p>Genesis 1&amp;ndash;3 is not a range</p>"
+
+    # When getting the references in the document
+    references = bible.get_html_references(document)
+
+    # Then the escaped entity is read as text, and not as a dash
+    assert references == [
+        bible.NormalizedReference(
+            bible.Book.GENESIS,
+            1,
+            1,
+            1,
+            bible.get_number_of_verses(bible.Book.GENESIS, 1),
+        ),
+    ]
+
+
+def test_iter_html_references() -> None:
+    # Given an HTML document with two references
+    document: str = "<li>Ruth 1:16</li><li>Jonah 2:2</li>"
+
+    # When iterating over the references in the document
+    references = bible.iter_html_references(document)
+
+    # Then the references are yielded one at a time
+    assert next(references) == bible.NormalizedReference(bible.Book.RUTH, 1, 16, 1, 16)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import pythonbible as bible
+from pythonbible.normalization import normalize_text
+
+
+def test_normalize_text_nothing_to_replace() -> None:
+    # Given a text without any dash variants
+    text: str = "Genesis 1:1-3"
+
+    # When normalizing the text
+    normalized_text = normalize_text(text)
+
+    # Then the text is not copied and every offset maps to itself
+    assert normalized_text.text is text
+    assert normalized_text.get_original_offset(len(text)) == len(text)
+
+
+def test_normalize_text_dashes() -> None:
+    # Given a text with HTML dash entities and Unicode dashes
+    text: str = "Genesis 1:1&ndash;3, 5\u20137 and 2:1&mdash;3:4"
+
+    # When normalizing the text
+    normalized_text = normalize_text(text)
+
+    # Then every dash is replaced with a hyphen in a single pass
+    assert normalized_text.text == "Genesis 1:1-3, 5-7 and 2:1-3:4"
+
+    # And the offsets in the normalized text map back to the original text
+    for substring in ("3, 5", "7 and", "3:4"):
+        assert normalized_text.get_original_offset(
+            normalized_text.text.index(substring),
+        ) == text.index(substring)
+
+    assert normalized_text.get_original_offset(len(normalized_text.text)) == len(text)
+
+
+def test_normalize_text_html_entities() -> None:
+    # Given a text with other HTML entities
+    text: str = "John&nbsp;3:16&#8211;18 &amp; more"
+
+    # When normalizing the text with every HTML entity decoded
+    normalized_text = normalize_text(text, html_entities=True)
+
+    # Then the space and dash entities are decoded to a space and a hyphen
+    assert normalized_text.text == "John 3:16-18 & more"
+    assert normalized_text.get_original_offset(12) == text.index(" &amp;")
+
+
+def test_get_reference_matches_unicode_dashes() -> None:
+    # Given a reference with an en dash and an em dash
+    text: str = "Exodus 20:3\u20135, 21:1\u20142"
+
+    # When getting the reference matches in the text
+    reference_matches = bible.get_reference_matches(text)
+
+    # Then the dashes are read as ranges and the offsets refer to the text
+    assert reference_matches == [
+        bible.ReferenceMatch(
+            0,
+            len(text),
+            text,
+            [
+                bible.NormalizedReference(bible.Book.EXODUS, 20, 3, 20, 5),
+                bible.NormalizedReference(bible.Book.EXODUS, 21, 1, 21, 2),
+            ],
+        ),
+    ]
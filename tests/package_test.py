@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pytest
+
+import pythonbible as bible
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+def test_import_does_not_load_submodules(fresh_package: ModuleType) -> None:
+    # Given pythonbible imported with none of its submodules loaded
+    assert "pythonbible.parser" not in sys.modules
+
+    # When reading one of its names
+    fresh_package.get_verse_id  # noqa: B018
+
+    # Then only the submodule of the name is imported
+    assert "pythonbible.verses" in sys.modules
+    assert "pythonbible.parser" not in sys.modules
+
+
+def test_star_import() -> None:
+    # Given the pythonbible package
+    namespace: dict[str, Any] = {}
+
+    # When star importing it, which is only allowed at the top level of a module
+    exec("from pythonbible import *", namespace)  # noqa: S102
+
+    # Then every public name is bound, and nothing else
+    assert namespace["get_references"] is bible.get_references
+    assert namespace["Book"] is bible.Book
+    assert namespace["IncrementalParser"] is bible.IncrementalParser
+    assert "TYPE_CHECKING" not in namespace
+    assert "importlib" not in namespace
+
+
+def test_all_names_load() -> None:
+    # Given the public names of the package
+    # When reading each of them
+    # Then every one of them is loaded
+    assert all(hasattr(bible, name) for name in bible.__all__)
+
+
+def test_dir() -> None:
+    # Given the pythonbible package
+    # When listing its names
+    names: list[str] = dir(bible)
+
+    # Then the public names and submodules are listed, whether or not they are loaded
+    assert "get_references" in names
+    assert "get_verse_id" in names
+    assert "IncrementalParser" in names
+    assert "parser" in names
+    assert "__version__" in names
+    assert "TYPE_CHECKING" not in names
+
+
+def test_submodule_attribute() -> None:
+    # Given the name of a submodule
+    # When reading it from the package
+    # Then the submodule is returned
+    assert bible.normalization.normalize_text("John 3:16").text == "John 3:16"
+
+
+def test_missing_attribute() -> None:
+    # Given a name that is not in the package
+    # When reading it from the package
+    # Then an AttributeError is raised
+    with pytest.raises(AttributeError):
+        bible.not_a_name  # noqa: B018
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import pytest
+
+import pythonbible as bible
+from pythonbible import parallel
+
+
+@pytest.fixture()
+def texts(text_with_reference: str) -> list[str]:
+    return [
+        text_with_reference,
+        "Matthew 18:12-14",
+        "This text does not contain a reference.",
+        "Obadiah 3-6",
+    ] * 5
+
+
+def test_get_references_many(texts: list[str]) -> None:
+    # Given a list of texts
+    # When parsing all of the texts at once
+    references = bible.get_references_many(texts)
+
+    # Then the references of each text are returned in the same order as the texts
+    assert references == [bible.get_references(text) for text in texts]
+
+
+def test_get_references_many_process_pool(
+    texts: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Given a list of texts that is large enough to be parsed in worker processes
+    monkeypatch.setattr(parallel, "PARALLEL_THRESHOLD", 1)
+
+    # When parsing all of the texts at once with more than one worker
+    references = bible.get_references_many(texts, workers=2, chunksize=3)
+
+    # Then the references of each text are returned in the same order as the texts
+    assert references == [bible.get_references(text) for text in texts]
+
+
+def test_get_references_many_empty() -> None:
+    assert bible.get_references_many([]) == []
+
+
+@pytest.mark.parametrize("engine", list(bible.ParserEngine))
+def test_get_references_parallel(
+    document: str,
+    engine: bible.ParserEngine,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Given a document that is large enough to be parsed in worker processes, with
+    # references that go on across line breaks
+    monkeypatch.setattr(parallel, "DOCUMENT_PARALLEL_THRESHOLD", 1)
+    monkeypatch.setattr(parallel, "CHUNKS_PER_WORKER", 8)
+
+    # When parsing the document in pieces with more than one worker
+    references = bible.get_references_parallel(document, 2, engine)
+
+    # Then the references are the same as when parsing the whole document
+    assert references == bible.get_references(document, engine=engine)
+
+
+def test_get_reference_matches_parallel(
+    document: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Given a document that is large enough to be parsed in worker processes
+    monkeypatch.setattr(parallel, "DOCUMENT_PARALLEL_THRESHOLD", 1)
+
+    # When getting the reference matches of the document in pieces
+    reference_matches = bible.get_reference_matches_parallel(document, workers=2)
+
+    # Then the offsets refer to the whole document
+    assert reference_matches == bible.get_reference_matches(document)
+
+
+def test_get_references_parallel_serial(document: str) -> None:
+    # Given a document that is smaller than the parallel threshold
+    # When parsing the document
+    # Then it is parsed in the current process with the same result
+    assert bible.get_references_parallel(document) == bible.get_references(document)
+
+
+
+def test_iter_text_pieces_reference_after_number() -> None:
+    # Given a long line with references right after a number and a space
+    text: str = "Read chapter 50 John 3:16 and verse 7 Jude 1:3 again. " * 20
+
+    # When splitting the line into pieces at whitespace
+    pieces = list(parallel.iter_text_pieces(text, 8))
+
+    # Then the line is split, but never right after a number and a space
+    assert len(pieces) > 1
+    assert all(not text[offset - 1].isdigit() for offset, _ in pieces[1:])
+
+    # And the reference matches of the pieces are the same as those of the whole line
+    assert [
+        (offset + reference_match.start, reference_match.references)
+        for offset, piece in pieces
+        for reference_match in bible.get_reference_matches(piece)
+    ] == [
+        (reference_match.start, reference_match.references)
+        for reference_match in bible.get_reference_matches(text)
+    ]
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 import pythonbible as bible
 
 
@@ -114,6 +118,37 @@ def test_get_references_roman_numerals(
     assert references == normalized_references_complex
 
 
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("II Kings 2:3", bible.NormalizedReference(bible.Book.KINGS_2, 2, 3, 2, 3)),
+        (
+            "I Cor 13:4",
+            bible.NormalizedReference(bible.Book.CORINTHIANS_1, 13, 4, 13, 4),
+        ),
+        ("iii John 1:2", bible.NormalizedReference(bible.Book.JOHN_3, 1, 2, 1, 2)),
+        ("II Tim. 3:16", bible.NormalizedReference(bible.Book.TIMOTHY_2, 3, 16, 3, 16)),
+        (
+            "I Thess 4:16",
+            bible.NormalizedReference(bible.Book.THESSALONIANS_1, 4, 16, 4, 16),
+        ),
+        ("II Pet 1:3", bible.NormalizedReference(bible.Book.PETER_2, 1, 3, 1, 3)),
+    ],
+)
+@pytest.mark.parametrize("engine", list(bible.ParserEngine))
+def test_get_references_roman_numeral_book_prefixes(
+    text: str,
+    expected: bible.NormalizedReference,
+    engine: bible.ParserEngine,
+) -> None:
+    # Given a reference to a numbered book with a roman numeral prefix
+    # When parsing that text
+    references = bible.get_references(text, engine=engine)
+
+    # Then the roman numeral is read as the number of the book
+    assert references == [expected]
+
+
 def test_philemon_vs_philippians() -> None:
     """Test for https://github.com/avendesora/pythonbible/issues/2."""
     # Given a text string with a reference in the book of Philemon
@@ -237,6 +272,29 @@ def test_book_group_reference_custom() -> None:
     ]
 
 
+def test_book_group_reference_custom_with_groups() -> None:
+    # Given custom book group regular expressions that contain groups of their own
+    book_groups: dict[str, tuple[bible.Book, ...]] = {
+        "(my|our) first group": (bible.Book.GENESIS,),
+        "(my|our) (second) group": (bible.Book.EXODUS,),
+    }
+
+    # and a text string containing both custom book group references
+    text: str = "Our second group comes after my first group."
+
+    # When we parse the references from that text
+    references: list[bible.NormalizedReference] = bible.get_references(
+        text,
+        book_groups=book_groups,
+    )
+
+    # Then the parser returns the references of the book group that matched
+    assert references == [
+        bible.NormalizedReference(bible.Book.EXODUS, 1, 1, 40, 38, bible.Book.EXODUS),
+        bible.NormalizedReference(bible.Book.GENESIS, 1, 1, 50, 26, bible.Book.GENESIS),
+    ]
+
+
 def test_single_chapter_book_without_chapter_number() -> None:
     # Given a reference string that does not include the chapter number for a book that
     # only has one chapter
@@ -312,3 +370,156 @@ def test_book_abbreviations() -> None:
 
             if book != book.SONG_OF_SONGS:
                 assert expected == actual_period
+
+
+def test_iter_references(text_with_reference_complex: str) -> None:
+    # Given a text string with multiple references
+    # When lazily iterating over the references in that text
+    references = bible.iter_references(text_with_reference_complex)
+
+    # Then the references are the same as the ones returned by get_references
+    assert list(references) == bible.get_references(text_with_reference_complex)
+
+
+def test_first_reference() -> None:
+    # Given a text string with a reference
+    text: str = "Matthew 18:12-14 is the parable of the lost sheep."
+
+    # When getting the first reference in that text
+    reference = bible.first_reference(text)
+
+    # Then the first reference is returned
+    assert reference == bible.NormalizedReference(bible.Book.MATTHEW, 18, 12, 18, 14)
+
+
+def test_first_reference_book_group() -> None:
+    # Given a text string with only a book group reference
+    text: str = "This class is a survey of the Old Testament of the Bible."
+
+    # When getting the first reference in that text
+    # Then the book group reference is only found when book groups are given
+    assert bible.first_reference(text) is None
+    assert bible.first_reference(text, book_groups=bible.BOOK_GROUPS) is not None
+
+
+def test_contains_reference() -> None:
+    # Given text strings with and without references
+    # When checking whether they contain a reference
+    # Then only the text with a reference contains one
+    assert bible.contains_reference("Obadiah 3-6 is a short passage.")
+    assert not bible.contains_reference("This text does not contain a reference.")
+
+
+def test_get_reference_matches() -> None:
+    # Given a text string with a reference that contains an HTML dash entity and a
+    # book group after it
+    text: str = "Genesis 1:1&ndash;5 is in the Old Testament."
+
+    # When getting the reference matches in that text
+    reference_matches = bible.get_reference_matches(text, book_groups=bible.BOOK_GROUPS)
+
+    # Then the offsets of the matches refer to the original text
+    assert [
+        (reference_match.start, reference_match.end, reference_match.text)
+        for reference_match in reference_matches
+    ] == [(0, 19, "Genesis 1:1&ndash;5"), (30, 43, "Old Testament")]
+    assert reference_matches[0].references == [
+        bible.NormalizedReference(bible.Book.GENESIS, 1, 1, 1, 5),
+    ]
+
+    # And the references are the same as the ones returned by get_references
+    assert [
+        reference
+        for reference_match in reference_matches
+        for reference in reference_match.references
+    ] == bible.get_references(text, book_groups=bible.BOOK_GROUPS)
+
+
+def test_normalize_reference_cache() -> None:
+    # Given an empty reference cache
+    bible.clear_reference_cache()
+
+    # When normalizing the same reference string twice
+    first_references = bible.normalize_reference("John 3:16")
+    second_references = bible.normalize_reference("John 3:16")
+
+    # Then the second time is a cache hit with the same result
+    cache_info = bible.get_reference_cache_info()
+    assert (cache_info.hits, cache_info.misses, cache_info.currsize) == (1, 1, 1)
+    assert first_references == second_references
+
+    # And changing the returned list does not change the cached result
+    first_references.clear()
+    assert bible.normalize_reference("John 3:16") == second_references
+
+
+def test_normalize_reference_cache_immutable_references() -> None:
+    # Given a normalized reference
+    reference = bible.normalize_reference("John 3:16")[0]
+
+    # When trying to change it
+    # Then it cannot be changed
+    with pytest.raises(FrozenInstanceError):
+        reference.end_verse = 17  # type: ignore[misc]
+
+    assert bible.normalize_reference("John 3:16")[0].end_verse == 16
+
+
+def test_set_reference_cache_size() -> None:
+    # Given a reference cache with room for a single reference string
+    bible.set_reference_cache_size(1)
+
+    # When normalizing two different reference strings
+    bible.normalize_reference("John 3:16")
+    bible.normalize_reference("Romans 8:28")
+
+    # Then only the most recent one is kept
+    cache_info = bible.get_reference_cache_info()
+    assert (cache_info.maxsize, cache_info.currsize) == (1, 1)
+
+    bible.set_reference_cache_size(bible.parser.DEFAULT_REFERENCE_CACHE_SIZE)
+
+
+def test_get_references_budget_max_length() -> None:
+    # Given a text that is longer than the length budget
+    text: str = "Genesis 1" + ", 1" * 100
+    budget: bible.ParserBudget = bible.ParserBudget(max_length=100)
+
+    # When getting the references in that text
+    # Then an error is raised
+    with pytest.raises(bible.ParserBudgetExceededError):
+        bible.get_references(text, budget=budget)
+
+
+def test_get_references_budget_max_seconds() -> None:
+    # Given a text with a reference and no time to parse it
+    text: str = "Genesis 1:1"
+    budget: bible.ParserBudget = bible.ParserBudget(max_seconds=0)
+
+    # When getting the references in that text
+    # Then an error is raised
+    with pytest.raises(bible.ParserBudgetExceededError):
+        bible.get_references(text, budget=budget)
+
+
+def test_get_references_budget_max_seconds_no_references() -> None:
+    # Given a text with no references and no time to parse it
+    text: str = "In the beginning God created the heaven and the earth."
+    budget: bible.ParserBudget = bible.ParserBudget(max_seconds=0)
+
+    # When getting the references in that text
+    # Then an error is raised
+    with pytest.raises(bible.ParserBudgetExceededError):
+        bible.get_references(text, budget=budget)
+
+
+def test_get_references_within_budget() -> None:
+    # Given a text that is within the budget
+    text: str = "Genesis 1:1"
+    budget: bible.ParserBudget = bible.ParserBudget(max_length=100, max_seconds=60)
+
+    # When getting the references in that text
+    references = bible.get_references(text, budget=budget)
+
+    # Then the references are the same as without a budget
+    assert references == bible.get_references(text)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+import pythonbible as bible
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Matthew 18:12-14",
+        "Genesis - Deuteronomy",
+        "I Samuel 3:1",
+        "First Book of the Kings 2",
+        "Revelation of St. John the Divine 22:21",
+        "jn 3:16",
+    ],
+)
+def test_might_contain_reference(text: str) -> None:
+    # Given a text string with a reference
+    # When checking whether it might contain a reference
+    # Then it is not ruled out
+    assert bible.might_contain_reference(text)
+
+
+def test_might_contain_reference_no_book() -> None:
+    # Given text strings without any words that start like a book name
+    texts: list[str] = [
+        "The quick brown fox jumps over the lazy dog.",
+        "We should meet tomorrow, about 10 or 11.",
+    ]
+
+    # When checking whether they might contain a reference
+    # Then they are ruled out
+    for text in texts:
+        assert not bible.might_contain_reference(text)
+
+
+def test_get_references_prefilter() -> None:
+    # Given a text with a reference and a text without one
+    texts: list[str] = ["Romans 8:28 is a favorite verse.", "See you tomorrow."]
+    bible.reset_prefilter_info()
+
+    # When getting the references in them with the prefilter
+    references = [bible.get_references(text, prefilter=True) for text in texts]
+
+    # Then the references are the same as without the prefilter
+    assert references == [bible.get_references(text) for text in texts]
+
+    # And the text without a reference was skipped
+    prefilter_info: bible.PrefilterInfo = bible.get_prefilter_info()
+    assert (prefilter_info.checked, prefilter_info.skipped) == (2, 1)
+    assert prefilter_info.skip_rate == 0.5
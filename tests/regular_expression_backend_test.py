@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+import pythonbible as bible
+
+
+def test_default_regular_expression_backend() -> None:
+    # Given the default settings
+    # When getting the regular expression backend
+    # Then it is the standard library re module
+    assert bible.get_regular_expression_backend() is bible.RegularExpressionBackend.RE
+
+
+@pytest.mark.parametrize("backend", list(bible.RegularExpressionBackend))
+def test_set_regular_expression_backend(
+    backend: bible.RegularExpressionBackend,
+) -> None:
+    # Given a text with references
+    text: str = "Genesis 1:1-5, 50:3 - Exodus 1:14, 2:3-20:5"
+    expected_references = bible.get_references(text)
+
+    # When setting a regular expression backend that may not be installed
+    used_backend = bible.set_regular_expression_backend(backend)
+
+    try:
+        # Then either that backend or the re backend is used
+        assert used_backend in (backend, bible.RegularExpressionBackend.RE)
+        assert bible.get_regular_expression_backend() is used_backend
+
+        # And the references found are the same
+        bible.clear_reference_cache()
+        assert bible.get_references(text) == expected_references
+    finally:
+        bible.set_regular_expression_backend(bible.RegularExpressionBackend.RE)
+
+
+def test_set_regular_expression_backend_not_installed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Given a backend that cannot be imported
+    def compile_pattern(
+        backend: bible.RegularExpressionBackend,
+        _pattern: str,
+    ) -> None:
+        raise ImportError(backend.value)
+
+    monkeypatch.setattr(bible.RegularExpressionBackend, "compile", compile_pattern)
+
+    # When setting that backend
+    used_backend = bible.set_regular_expression_backend(
+        bible.RegularExpressionBackend.REGEX,
+    )
+
+    # Then the re backend is used instead
+    assert used_backend is bible.RegularExpressionBackend.RE
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import importlib
 import re
+from typing import TYPE_CHECKING
 from typing import Match
 
+import pytest
+
 import pythonbible as bible
 from pythonbible import regular_expressions
 
+if TYPE_CHECKING:
+    from types import ModuleType
+
 
 def test_chapter_regular_expression() -> None:
     # given a string with a chapter number
@@ -284,3 +291,51 @@ def test_jud() -> None:
 
     # then the match is found
     assert not matches
+
+
+def test_book_resolver_regular_expression() -> None:
+    # given references that start with a book of the Bible
+    references: dict[str, bible.Book] = {
+        "Matthew 18:12-14": bible.Book.MATTHEW,
+        "Philemon 1:9": bible.Book.PHILEMON,
+        "Philippians 4:13": bible.Book.PHILIPPIANS,
+        "Jude 1:1": bible.Book.JUDE,
+        "Judges 1:1": bible.Book.JUDGES,
+    }
+
+    for reference, expected_book in references.items():
+        # when resolving the book at the beginning of the reference
+        match: Match[str] | None = (
+            regular_expressions.BOOK_RESOLVER_REGULAR_EXPRESSION.match(reference)
+        )
+
+        # then the first matching book is the name of the matched group
+        assert match
+        assert match.lastgroup == expected_book.name
+
+
+def test_regular_expressions_are_compiled_on_first_use(
+    fresh_package: ModuleType,
+) -> None:
+    # given pythonbible imported again, with its regular expressions module
+    module: ModuleType = importlib.import_module(
+        f"{fresh_package.__name__}.regular_expressions",
+    )
+
+    # when checking the module before and after the first search
+    compiled_before_search: bool = (
+        "SCRIPTURE_REFERENCE_REGULAR_EXPRESSION" in vars(module)
+    )
+    fresh_package.get_references("John 3:16")
+
+    # then the scripture reference regular expression is only compiled by the search
+    assert not compiled_before_search
+    assert "SCRIPTURE_REFERENCE_REGULAR_EXPRESSION" in vars(module)
+
+
+def test_regular_expressions_missing_attribute() -> None:
+    # given the name of an attribute that the module does not have
+    # when reading the attribute
+    # then an AttributeError is raised
+    with pytest.raises(AttributeError):
+        regular_expressions.NOT_A_REGULAR_EXPRESSION  # noqa: B018
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import io
+from typing import Iterator
+
+import pythonbible as bible
+
+
+def test_iter_references_from_stream_split_reference() -> None:
+    # Given a text stream with a reference that is split between two chunks
+    text: str = "Matthew 18:12-14 is the parable of the lost sheep."
+    stream = io.StringIO(text)
+
+    # When searching the stream for references one small chunk at a time
+    references = list(bible.iter_references_from_stream(stream, chunk_size=13))
+
+    # Then the reference is found as if the whole text had been parsed at once
+    assert references == bible.get_references(text)
+    assert references == [bible.NormalizedReference(bible.Book.MATTHEW, 18, 12, 18, 14)]
+
+
+def test_iter_references_from_stream_split_html_dash() -> None:
+    # Given a text stream with an HTML dash entity that is split between two chunks
+    text: str = "Genesis 1&ndash;4"
+    stream = io.StringIO(text)
+
+    # When searching the stream for references one small chunk at a time
+    references = list(bible.iter_references_from_stream(stream, chunk_size=11))
+
+    # Then the entity is still read as a dash
+    assert references == [bible.NormalizedReference(bible.Book.GENESIS, 1, 1, 4, 26)]
+
+
+def test_iter_references_from_stream_lines(text_with_reference_complex: str) -> None:
+    # Given an iterator of lines of text
+    lines = io.StringIO(text_with_reference_complex).readlines()
+
+    # When searching the lines for references
+    references = list(bible.iter_references_from_stream(lines))
+
+    # Then the references are the same as when parsing the whole text
+    assert references == bible.get_references(text_with_reference_complex)
+
+
+def test_iter_references_from_stream_is_lazy() -> None:
+    # Given an endless iterator of lines that starts with a reference
+    def lines() -> Iterator[str]:
+        yield "Romans 8:28 and then a lot more text"
+
+        while True:
+            yield " without any references"
+
+    # When getting the first reference
+    references = bible.iter_references_from_stream(lines())
+
+    # Then the reference is returned without reading the whole stream
+    assert next(references) == bible.NormalizedReference(
+        bible.Book.ROMANS,
+        8,
+        28,
+        8,
+        28,
+    )
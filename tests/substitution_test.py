@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import pythonbible as bible
+
+
+def test_substitute_references() -> None:
+    # Given a text string with a reference and a book group
+    text: str = "Genesis 1:1&ndash;5 is in the Old Testament."
+
+    # When substituting the references in that text
+    substituted_text: str = bible.substitute_references(
+        text,
+        lambda reference_match: f"<{reference_match.text}>",
+        book_groups=bible.BOOK_GROUPS,
+    )
+
+    # Then each matched substring is replaced with the result of the replacer
+    assert substituted_text == "<Genesis 1:1&ndash;5> is in the <Old Testament>."
+
+
+def test_substitute_references_count() -> None:
+    # Given a text string with a reference and a book group
+    text: str = "Genesis 1:1&ndash;5 is in the Old Testament."
+
+    # When substituting only the first reference in that text
+    substituted_text: str = bible.substitute_references(
+        text,
+        lambda _: "",
+        book_groups=bible.BOOK_GROUPS,
+        count=1,
+    )
+
+    # Then only the first reference is replaced
+    assert substituted_text == " is in the Old Testament."
+
+
+def test_substitute_references_no_references() -> None:
+    # Given a text string without any references
+    text: str = "This text does not contain a reference."
+
+    # When substituting the references in that text
+    substituted_text: str = bible.substitute_references(text, lambda _: "")
+
+    # Then the text is unchanged
+    assert substituted_text == text
+
+
+def test_html_link_replacer() -> None:
+    # Given a text string with a reference and an HTML link replacer
+    text: str = "Matthew 18:12-14 is the parable of the lost sheep."
+    replacer = bible.html_link_replacer(
+        "https://example.com/?from={start_verse_id}&to={end_verse_id}",
+    )
+
+    # When substituting the references in that text
+    substituted_text: str = bible.substitute_references(text, replacer)
+
+    # Then the reference is replaced with an HTML anchor
+    title: str = bible.format_single_reference(
+        bible.NormalizedReference(bible.Book.MATTHEW, 18, 12, 18, 14),
+    )
+    assert substituted_text == (
+        '<a href="https://example.com/?from=40018012&amp;to=40018014" '
+        f'title="{title}">Matthew 18:12-14</a> '
+        "is the parable of the lost sheep."
+    )
+
+
+def test_html_link_replacer_escapes_text() -> None:
+    # Given a reference match whose text has HTML special characters in it
+    reference: bible.NormalizedReference = bible.NormalizedReference(
+        bible.Book.GENESIS,
+        1,
+        1,
+        1,
+        1,
+    )
+    reference_match: bible.ReferenceMatch = bible.ReferenceMatch(
+        0,
+        18,
+        "<b>Genesis 1:1</b>",
+        [reference],
+    )
+    replacer = bible.html_link_replacer("https://example.com/{start_verse_id}")
+
+    # When replacing the reference match
+    replacement: str = replacer(reference_match)
+
+    # Then the text of the anchor is escaped
+    assert replacement.endswith(">&lt;b&gt;Genesis 1:1&lt;/b&gt;</a>")
+
+
+def test_markdown_link_replacer() -> None:
+    # Given a text string with a reference and a Markdown link replacer
+    text: str = "Genesis 1:1-5, 50:3 and more"
+    replacer = bible.markdown_link_replacer(
+        "https://example.com/{start_verse_id}-{end_verse_id}",
+    )
+
+    # When substituting the references in that text
+    substituted_text: str = bible.substitute_references(text, replacer)
+
+    # Then the reference is replaced with a Markdown link to all of its verses
+    title: str = "; ".join(
+        bible.format_single_reference(reference)
+        for reference in bible.get_references(text)
+    )
+    assert substituted_text == (
+        "[Genesis 1:1-5, 50:3](https://example.com/1001001-1050003 "
+        f'"{title}") and more'
+    )
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import pytest
+
+import pythonbible as bible
+
+
+@pytest.mark.parametrize(
+    ("transcript", "expected"),
+    [
+        (
+            "Second Timothy chapter two verses three and four says endure hardship",
+            [bible.NormalizedReference(bible.Book.TIMOTHY_2, 2, 3, 2, 4)],
+        ),
+        (
+            "If you read Ephesians four 17 through 32 all the ammunition",
+            [bible.NormalizedReference(bible.Book.EPHESIANS, 4, 17, 4, 32)],
+        ),
+        (
+            "remember that powerful message of Paul in first Corinthians nine",
+            [bible.NormalizedReference(bible.Book.CORINTHIANS_1, 9, 1, 9, 27)],
+        ),
+        (
+            "in Matthew five through seven",
+            [bible.NormalizedReference(bible.Book.MATTHEW, 5, 1, 7, 29)],
+        ),
+        (
+            "Jesus said over in Matthew chapter six, verse number 12",
+            [bible.NormalizedReference(bible.Book.MATTHEW, 6, 12, 6, 12)],
+        ),
+        (
+            "and go and report to John one-fifteen and thirty.",
+            [
+                bible.NormalizedReference(bible.Book.JOHN, 1, 15, 1, 15),
+                bible.NormalizedReference(bible.Book.JOHN, 1, 30, 1, 30),
+            ],
+        ),
+        (
+            "Colossians chapter three, 22 through verses through chapter four, verse "
+            "one.",
+            [bible.NormalizedReference(bible.Book.COLOSSIANS, 3, 22, 4, 1)],
+        ),
+        (
+            "through that fire, 1 Kings 18.24-38, 1 Chronicles 21.26",
+            [
+                bible.NormalizedReference(bible.Book.KINGS_1, 18, 24, 18, 38),
+                bible.NormalizedReference(bible.Book.CHRONICLES_1, 21, 26, 21, 26),
+            ],
+        ),
+        (
+            "open their Bibles to first Corinthians 14, 34, 35 and say, look",
+            [bible.NormalizedReference(bible.Book.CORINTHIANS_1, 14, 34, 14, 35)],
+        ),
+        (
+            "Genesis 1, 26, 2, 7, and 21, 22.",
+            [
+                bible.NormalizedReference(bible.Book.GENESIS, 1, 26, 1, 26),
+                bible.NormalizedReference(bible.Book.GENESIS, 2, 7, 2, 7),
+                bible.NormalizedReference(bible.Book.GENESIS, 21, 22, 21, 22),
+            ],
+        ),
+        (
+            "for one another Galatians 6 1 & 2 clearly gives us",
+            [bible.NormalizedReference(bible.Book.GALATIANS, 6, 1, 6, 2)],
+        ),
+        (
+            "Psalm one hundred and nineteen, verse one hundred five",
+            [bible.NormalizedReference(bible.Book.PSALMS, 119, 105, 119, 105)],
+        ),
+        (
+            "Revelations twenty-one, one through seven",
+            [bible.NormalizedReference(bible.Book.REVELATION, 21, 1, 21, 7)],
+        ),
+        (
+            "as it says in II Kings two, three",
+            [bible.NormalizedReference(bible.Book.KINGS_2, 2, 3, 2, 3)],
+        ),
+        (
+            "Jude five",
+            [bible.NormalizedReference(bible.Book.JUDE, 1, 5, 1, 5)],
+        ),
+        (
+            "Jude verse three",
+            [bible.NormalizedReference(bible.Book.JUDE, 1, 3, 1, 3)],
+        ),
+        (
+            "as Paul asks in Philemon verse four",
+            [bible.NormalizedReference(bible.Book.PHILEMON, 1, 4, 1, 4)],
+        ),
+        (
+            "Obadiah verses six through eight and ten",
+            [
+                bible.NormalizedReference(bible.Book.OBADIAH, 1, 6, 1, 8),
+                bible.NormalizedReference(bible.Book.OBADIAH, 1, 10, 1, 10),
+            ],
+        ),
+    ],
+)
+def test_get_transcript_references(
+    transcript: str,
+    expected: list[bible.NormalizedReference],
+) -> None:
+    # Given a transcript with spoken references
+    # When getting the references in the transcript
+    # Then the spoken references are found
+    assert bible.get_transcript_references(transcript) == expected
+
+
+def test_get_transcript_references_whole_chapters() -> None:
+    # Given a transcript with two spoken chapters
+    transcript: str = "and forth between Haggai two and Ezra three."
+
+    # When getting the references in the transcript
+    references = bible.get_transcript_references(transcript)
+
+    # Then both whole chapters are found
+    assert references == [
+        bible.NormalizedReference(
+            bible.Book.HAGGAI,
+            2,
+            1,
+            2,
+            bible.get_number_of_verses(bible.Book.HAGGAI, 2),
+        ),
+        bible.NormalizedReference(
+            bible.Book.EZRA,
+            3,
+            1,
+            3,
+            bible.get_number_of_verses(bible.Book.EZRA, 3),
+        ),
+    ]
+
+
+def test_get_transcript_references_book_without_chapter() -> None:
+    # Given a transcript with book names that are not followed by a chapter
+    transcript: str = "Mark my words, the Acts of kindness in this job are numbers."
+
+    # When getting the references in the transcript
+    # Then no references are found
+    assert bible.get_transcript_references(transcript) == []
+
+
+def test_get_transcript_references_invalid_reference() -> None:
+    # Given a transcript with a chapter that is not in the book
+    transcript: str = "Romans twenty, verse one"
+
+    # When getting the references in the transcript
+    # Then no references are found
+    assert bible.get_transcript_references(transcript) == []
+
+
+def test_get_transcript_reference_matches() -> None:
+    # Given a transcript with a spoken reference
+    transcript: str = "Paul writes in Romans chapter eight, verse 28 that"
+
+    # When getting the reference matches in the transcript
+    reference_matches = bible.get_transcript_reference_matches(transcript)
+
+    # Then the offsets and text of the spoken reference are found
+    assert reference_matches == [
+        bible.ReferenceMatch(
+            15,
+            45,
+            "Romans chapter eight, verse 28",
+            [bible.NormalizedReference(bible.Book.ROMANS, 8, 28, 8, 28)],
+        ),
+    ]
+
+
+def test_iter_transcript_references() -> None:
+    # Given a transcript with two spoken references
+    transcript: str = "John three sixteen and Romans eight 28"
+
+    # When iterating over the references in the transcript
+    references = bible.iter_transcript_references(transcript)
+
+    # Then the references are yielded one at a time
+    assert next(references) == bible.NormalizedReference(bible.Book.JOHN, 3, 16, 3, 16)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 import pythonbible as bible
 
 
@@ -31,6 +33,17 @@ def test_is_valid_verse_id_invalid(invalid_verse_id: int) -> None:
     assert not bible.is_valid_verse_id(invalid_verse_id)
 
 
+@pytest.mark.parametrize(
+    "verse_id",
+    [0, -1001001, 1000001, 1001000, 1001032, 1051001, 73001001, 1001001000],
+)
+def test_is_valid_verse_id_out_of_range(verse_id: int) -> None:
+    # Given a verse id whose book, chapter, or verse number is out of range
+    # When we check whether it is valid
+    # Then it is not valid
+    assert not bible.is_valid_verse_id(verse_id)
+
+
 def test_is_valid_reference(reference: bible.NormalizedReference) -> None:
     # Given a valid normalized reference tuple
     # When we test to see if it is valid
@@ -120,3 +120,111 @@ def test_get_verse(verse_id: int) -> None:
 
     # Then the resulting verse number matching the expected verse number (1)
     assert verse_number == 1
+
+
+def test_canon_tables() -> None:
+    # Given the canon tables
+    verses = bible.verses
+
+    # When reading the chapters of each book from the tables
+    # Then they match the number of chapters and verses of the book
+    for book in bible.Book:
+        first_chapter: int = verses.BOOK_CHAPTER_OFFSETS[book.value - 1]
+        end_chapter: int = verses.BOOK_CHAPTER_OFFSETS[book.value]
+
+        assert end_chapter - first_chapter == bible.get_number_of_chapters(book)
+        assert list(verses.CHAPTER_VERSE_COUNTS[first_chapter:end_chapter]) == [
+            bible.get_number_of_verses(book, chapter)
+            for chapter in range(1, end_chapter - first_chapter + 1)
+        ]
+
+    assert verses.CHAPTER_VERSE_OFFSETS[-1] == len(verses.VERSE_IDS)
+
+
+def test_verse_ids() -> None:
+    # Given the verse ids of every verse
+    verse_ids = bible.verses.VERSE_IDS
+
+    # When reading the verse ids
+    # Then they are in canonical order, and each one is a valid verse
+    assert list(verse_ids) == sorted(verse_ids)
+    assert verse_ids[0] == bible.get_verse_id(bible.Book.GENESIS, 1, 1)
+    last_chapter: int = bible.get_number_of_chapters(bible.Book.MACCABEES_2)
+    assert verse_ids[-1] == bible.get_verse_id(
+        bible.Book.MACCABEES_2,
+        last_chapter,
+        bible.get_number_of_verses(bible.Book.MACCABEES_2, last_chapter),
+    )
+
+    for verse_id in verse_ids[:: len(verse_ids) // 100]:
+        assert bible.get_verse_id(*bible.get_book_chapter_verse(verse_id)) == verse_id
+
+
+def test_verse_ids_are_immutable() -> None:
+    # Given the verse ids of every verse
+    # When reading them from the module
+    # Then they are a tuple, which cannot be changed
+    assert isinstance(bible.verses.VERSE_IDS, tuple)
+
+
+def test_verses_missing_attribute() -> None:
+    # Given the name of an attribute that the module does not have
+    # When reading the attribute
+    # Then an AttributeError is raised
+    with pytest.raises(AttributeError):
+        bible.verses.NOT_A_TABLE  # noqa: B018
+
+
+def test_get_verse_ordinal() -> None:
+    # Given every verse id in canonical order
+    verse_ids = bible.verses.VERSE_IDS
+
+    # When getting the ordinal of each verse id and the verse id of each ordinal
+    # Then the ordinal is the position of the verse id in canonical order
+    for ordinal, verse_id in enumerate(verse_ids):
+        assert bible.get_verse_ordinal(verse_id) == ordinal
+        assert bible.get_verse_id_from_ordinal(ordinal) == verse_id
+
+
+def test_get_verse_ids_in_range() -> None:
+    # Given the verse ids of the last verse of Genesis and the second verse of Exodus
+    start_verse_id: int = 1050026
+    end_verse_id: int = 2001002
+
+    # When getting the verse ids in that range
+    verse_ids = bible.get_verse_ids_in_range(start_verse_id, end_verse_id)
+
+    # Then the range goes on across the books
+    assert verse_ids == (1050026, 2001001, 2001002)
+
+    # And a range that ends before it starts is empty
+    assert bible.get_verse_ids_in_range(end_verse_id, start_verse_id) == ()
+
+
+def test_get_verse_ids_in_range_invalid() -> None:
+    # Given a verse id that is not valid
+    # When getting the verse ids in a range that ends with it
+    # Then an error is raised
+    with pytest.raises(bible.InvalidVerseError):
+        bible.get_verse_ids_in_range(1001001, 1001000)
+
+
+@pytest.mark.parametrize(
+    "verse_id",
+    [1100100, 0, -1, 1000001, 1001000, 1051001, 73001001, 66022022],
+)
+def test_get_verse_ordinal_invalid(verse_id: int) -> None:
+    # Given a verse id that is not valid
+    # When getting its ordinal
+    # Then an error is raised
+    with pytest.raises(bible.InvalidVerseError):
+        bible.get_verse_ordinal(verse_id)
+
+
+@pytest.mark.parametrize("ordinal", [-1, 37695])
+def test_get_verse_id_from_ordinal_invalid(ordinal: int) -> None:
+    # Given an ordinal that is not the position of a verse
+    # When getting its verse id
+    # Then an error is raised
+    with pytest.raises(IndexError):
+        bible.get_verse_id_from_ordinal(ordinal)